@@ -14,7 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from archon_prime.api.db.session import get_db
 from archon_prime.api.db.models import User
-from archon_prime.api.dependencies import get_admin_user
+from archon_prime.api.dependencies import get_admin_user, invalidate_user_cache
 from archon_prime.api.auth.schemas import MessageResponse
 from archon_prime.api.admin.schemas import (
     DashboardResponse,
@@ -199,6 +199,7 @@ async def update_user(
         is_active=data.is_active,
         is_admin=data.is_admin,
     )
+    invalidate_user_cache(user_id)
 
     return AdminUserResponse(
         id=updated.id,
@@ -247,6 +248,7 @@ async def suspend_user(
         )
 
     await service.update_user(user, is_active=False)
+    invalidate_user_cache(user_id)
 
     # Disconnect all user's profiles
     profiles, _ = await service.get_profiles(
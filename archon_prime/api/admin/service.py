@@ -10,7 +10,7 @@ from decimal import Decimal
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, func, or_, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -102,7 +102,7 @@ class AdminService:
         ws_connections = ws_manager.get_total_connections()
 
         # Uptime
-        uptime = (datetime.now(timezone.utc) - self._start_time).seconds
+        uptime = int((datetime.now(timezone.utc) - self._start_time).total_seconds())
 
         return SystemStatsResponse(
             total_users=total_users or 0,
@@ -171,28 +171,32 @@ class AdminService:
         result = await self.db.execute(query)
         users = result.scalars().all()
 
+        # Profile counts and balances for the whole page in one query
+        profile_stats = {}
+        if users:
+            stats_result = await self.db.execute(
+                select(
+                    MT5Profile.user_id,
+                    func.count(MT5Profile.id),
+                    func.count(MT5Profile.id).filter(
+                        MT5Profile.connection_status == "connected"
+                    ),
+                    func.sum(MT5Profile.balance),
+                )
+                .where(MT5Profile.user_id.in_([user.id for user in users]))
+                .group_by(MT5Profile.user_id)
+            )
+            profile_stats = {
+                user_id: (count, connected, balance)
+                for user_id, count, connected, balance in stats_result
+            }
+
         # Build response with profile counts
         user_responses = []
         for user in users:
-            # Get profile counts
-            profile_count = await self.db.scalar(
-                select(func.count(MT5Profile.id)).where(
-                    MT5Profile.user_id == user.id
-                )
+            profile_count, connected_count, total_balance = profile_stats.get(
+                user.id, (0, 0, None)
             )
-            connected_count = await self.db.scalar(
-                select(func.count(MT5Profile.id)).where(
-                    and_(
-                        MT5Profile.user_id == user.id,
-                        MT5Profile.connection_status == "connected",
-                    )
-                )
-            )
-            total_balance = await self.db.scalar(
-                select(func.sum(MT5Profile.balance)).where(
-                    MT5Profile.user_id == user.id
-                )
-            ) or Decimal("0")
 
             user_responses.append(
                 AdminUserResponse(
@@ -205,9 +209,9 @@ class AdminService:
                     is_active=user.is_active,
                     is_admin=user.is_admin,
                     email_verified=user.is_verified,
-                    profile_count=profile_count or 0,
-                    connected_profile_count=connected_count or 0,
-                    total_balance=total_balance,
+                    profile_count=profile_count,
+                    connected_profile_count=connected_count,
+                    total_balance=total_balance or Decimal("0"),
                     created_at=user.created_at,
                     updated_at=user.updated_at,
                     last_login_at=user.last_login_at,
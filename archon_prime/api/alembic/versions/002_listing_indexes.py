@@ -0,0 +1,50 @@
+"""Add composite listing indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+Adds composite indexes so per-profile listings can range-scan in
+time order instead of sorting:
+- positions: (profile_id, open_time DESC)
+- trade_history: (profile_id, deal_time DESC)
+- system_events: (acknowledged, created_at)
+
+Single-column indexes on profile_id, symbol, event_type, severity and
+acknowledged already exist from 001.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_positions_profile_opened",
+        "positions",
+        ["profile_id", sa.text("open_time DESC")],
+    )
+    op.create_index(
+        "ix_trade_history_profile_closed",
+        "trade_history",
+        ["profile_id", sa.text("deal_time DESC")],
+    )
+    op.create_index(
+        "ix_system_events_ack_created",
+        "system_events",
+        ["acknowledged", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_system_events_ack_created", table_name="system_events")
+    op.drop_index("ix_trade_history_profile_closed", table_name="trade_history")
+    op.drop_index("ix_positions_profile_opened", table_name="positions")
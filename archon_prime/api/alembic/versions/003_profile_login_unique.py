@@ -0,0 +1,35 @@
+"""Add unique index on profile login
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+Adds a unique index on mt5_profiles (user_id, mt5_login, mt5_server)
+so the database rejects duplicate logins atomically. create_profile
+relies on the resulting IntegrityError instead of a pre-check SELECT.
+
+Existing duplicates must be removed before upgrading.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_mt5_profiles_user_login_server",
+        "mt5_profiles",
+        ["user_id", "mt5_login", "mt5_server"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_mt5_profiles_user_login_server", table_name="mt5_profiles")
@@ -6,7 +6,15 @@ for regulatory and internal compliance requirements.
 
 Components:
 - provenance.py: Decision provenance tracking and queries
-- evidence.py: Evidence packaging and export functionality
+- decisions.py: Decision nodes, types and node hashing
+- chains.py: Decision chains and chain integrity checks
+- query.py: Provenance query filters and chain indexes
+- merkle.py: Merkle tree roots and inclusion proofs for decision chains
+- hashing.py: Bulk SHA256 for batch node verification
+- columns.py: Columnar node fields for vectorized provenance queries
+- persistence.py: Batched background writes of completed chains
+- evidence.py: Evidence collection and packaging
+- exporter.py: JSON and ZIP export of evidence packages
 - reports.py: Compliance report generation
 - COMPLIANCE_GUIDE.md: Complete compliance documentation
 
@@ -30,6 +38,7 @@ from archon_prime.api.compliance.provenance import (
     get_trade_provenance,
     get_signal_provenance,
     verify_decision_integrity,
+    verify_merkle_proof,
 )
 
 from archon_prime.api.compliance.evidence import (
@@ -37,11 +46,15 @@ from archon_prime.api.compliance.evidence import (
     EvidencePackage,
     EvidenceType,
     EvidenceFormat,
-    export_evidence_package,
     create_audit_bundle,
     hash_evidence,
 )
 
+from archon_prime.api.compliance.exporter import (
+    export_evidence_package,
+    export_evidence_package_streaming,
+)
+
 from archon_prime.api.compliance.reports import (
     ComplianceReporter,
     ReportType,
@@ -62,6 +75,7 @@ __all__ = [
     "get_trade_provenance",
     "get_signal_provenance",
     "verify_decision_integrity",
+    "verify_merkle_proof",
 
     # Evidence
     "EvidencePackager",
@@ -69,6 +83,7 @@ __all__ = [
     "EvidenceType",
     "EvidenceFormat",
     "export_evidence_package",
+    "export_evidence_package_streaming",
     "create_audit_bundle",
     "hash_evidence",
 
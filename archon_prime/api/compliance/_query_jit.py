@@ -0,0 +1,133 @@
+"""
+ARCHON PRIME - Compiled Provenance Query Scan
+
+Evaluates node-level query filters (decision types, sources and
+emergency exclusion) for many chains in one pass over their
+concatenated node columns.
+
+Chains are laid out CSR-style: offsets[c]:offsets[c + 1] is the node
+range of chain c. The scan is compiled with Numba when it is installed
+(pip install archon-platform[jit]) and falls back to NumPy otherwise.
+"""
+
+import logging
+from typing import List
+
+import numpy as np
+
+from archon_prime.api.compliance.columns import NodeColumns
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+_warmed_up = False
+
+
+def _scan_numpy(
+    type_codes: np.ndarray,
+    source_codes: np.ndarray,
+    offsets: np.ndarray,
+    type_mask: np.ndarray,
+    source_mask: np.ndarray,
+    exclude_mask: np.ndarray,
+) -> np.ndarray:
+    """NumPy implementation of the chain scan (chains must be non-empty)."""
+    starts = offsets[:-1]
+    has_type = np.add.reduceat(type_mask[type_codes], starts) > 0
+    has_source = np.add.reduceat(source_mask[source_codes], starts) > 0
+    excluded = np.add.reduceat(exclude_mask[type_codes], starts) > 0
+    return has_type & has_source & ~excluded
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _scan_jit(
+        type_codes, source_codes, offsets, type_mask, source_mask, exclude_mask
+    ):
+        """Numba implementation of the chain scan."""
+        n_chains = offsets.shape[0] - 1
+        matches = np.zeros(n_chains, dtype=np.bool_)
+        for c in prange(n_chains):
+            has_type = False
+            has_source = False
+            excluded = False
+            for i in range(offsets[c], offsets[c + 1]):
+                if type_mask[type_codes[i]]:
+                    has_type = True
+                if source_mask[source_codes[i]]:
+                    has_source = True
+                if exclude_mask[type_codes[i]]:
+                    excluded = True
+                    break
+            matches[c] = has_type and has_source and not excluded
+        return matches
+
+    _scan = _scan_jit
+else:
+    _scan = _scan_numpy
+
+
+def scan(
+    columns: List[NodeColumns],
+    type_mask: np.ndarray,
+    source_mask: np.ndarray,
+    exclude_mask: np.ndarray,
+) -> np.ndarray:
+    """
+    Evaluate node-level filters for a list of chains.
+
+    Args:
+        columns: Node columns of each candidate chain
+        type_mask: Decision type codes a chain must contain one of
+        source_mask: Source codes a chain must contain one of
+        exclude_mask: Decision type codes that exclude a chain
+
+    Returns:
+        Boolean array, True where the chain matches
+    """
+    if not columns:
+        return np.zeros(0, dtype=np.bool_)
+
+    offsets = np.zeros(len(columns) + 1, dtype=np.int64)
+    np.cumsum([len(c) for c in columns], out=offsets[1:])
+    type_codes = np.concatenate([c.type_codes for c in columns])
+    source_codes = np.concatenate([c.source_codes for c in columns])
+
+    return _scan(
+        type_codes, source_codes, offsets, type_mask, source_mask, exclude_mask
+    )
+
+
+def warmup(n_types: int, n_sources: int) -> None:
+    """
+    Compile the scan ahead of the first query.
+
+    Args:
+        n_types: Number of decision type codes
+        n_sources: Number of source codes
+    """
+    global _warmed_up
+    if not NUMBA_AVAILABLE or _warmed_up:
+        return
+    _warmed_up = True
+
+    codes = np.zeros(1, dtype=np.int8)
+    offsets = np.array([0, 1], dtype=np.int64)
+    try:
+        _scan(
+            codes,
+            codes,
+            offsets,
+            np.ones(n_types, dtype=np.bool_),
+            np.ones(n_sources, dtype=np.bool_),
+            np.zeros(n_types, dtype=np.bool_),
+        )
+    except Exception as e:
+        logger.warning(f"Provenance query JIT warmup failed: {e}")
@@ -0,0 +1,270 @@
+"""
+ARCHON PRIME - Decision Chains
+
+DecisionChain holds the nodes of one decision context under a
+Merkle chain hash, with row- and column-oriented exports.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+import numpy as np
+import orjson
+
+from archon_prime.api.compliance.columns import NodeColumns
+from archon_prime.api.compliance.decisions import (
+    DECISION_SOURCE_CODES,
+    DECISION_TYPE_CODES,
+    DecisionNode,
+    DecisionSource,
+    DecisionType,
+    payload_json_default,
+    verify_batch,
+)
+from archon_prime.api.compliance.merkle import (
+    MerkleProof,
+    merkle_append,
+    merkle_build,
+    merkle_proof,
+    merkle_root,
+)
+
+# Chain hash formats
+CHAIN_HASH_VERSION_JOINED = 1  # SHA256 over "|"-joined hex node hashes (legacy)
+CHAIN_HASH_VERSION_MERKLE = 2  # Merkle root over raw node hashes
+
+# Code -> value tables for column-oriented exports
+_DECISION_TYPE_VALUES: List[str] = [m.value for m in DecisionType]
+_DECISION_SOURCE_VALUES: List[str] = [m.value for m in DecisionSource]
+
+
+@dataclass(slots=True)
+class DecisionChain:
+    """A complete chain of decisions leading to an outcome."""
+
+    chain_id: str
+    root_node_id: str
+    terminal_node_id: str
+    outcome: str  # "executed", "rejected", "emergency_closed"
+    created_at: datetime
+    completed_at: datetime
+    nodes: List[DecisionNode] = field(default_factory=list)
+
+    # Chain integrity (hex Merkle root over node hashes)
+    chain_hash: str = field(default="")
+    chain_hash_version: int = CHAIN_HASH_VERSION_MERKLE
+    _merkle_levels: List[List[bytes]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    # Columnar copy of the fields queries filter on
+    _columns: NodeColumns = field(
+        default_factory=NodeColumns, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if not self.chain_id:
+            self.chain_id = f"chain_{uuid4().hex[:12]}"
+        # A stored hash is kept as is, in whatever version it was written
+        self._merkle_levels = merkle_build([n.hash_bytes for n in self.nodes])
+        if not self.chain_hash:
+            self.chain_hash = merkle_root(self._merkle_levels).hex()
+            self.chain_hash_version = CHAIN_HASH_VERSION_MERKLE
+        for node in self.nodes:
+            self._append_columns(node)
+
+    def append_node(self, node: DecisionNode) -> None:
+        """
+        Append a node as a new Merkle leaf (O(log n) root update).
+
+        A chain loaded with a legacy hash is rehashed as a Merkle root.
+        """
+        self.nodes.append(node)
+        merkle_append(self._merkle_levels, node.hash_bytes)
+        self.chain_hash = merkle_root(self._merkle_levels).hex()
+        self.chain_hash_version = CHAIN_HASH_VERSION_MERKLE
+        self._append_columns(node)
+
+    def _append_columns(self, node: DecisionNode) -> None:
+        """Add a node's filterable fields to the chain columns."""
+        self._columns.append(
+            DECISION_TYPE_CODES[node.decision_type],
+            DECISION_SOURCE_CODES[node.source],
+            node.timestamp_ns,
+        )
+
+    def rebuild_chain_hash(self) -> str:
+        """Rebuild the Merkle tree and rehash the chain in the current format."""
+        self._merkle_levels = merkle_build([n.hash_bytes for n in self.nodes])
+        self.chain_hash = merkle_root(self._merkle_levels).hex()
+        self.chain_hash_version = CHAIN_HASH_VERSION_MERKLE
+        return self.chain_hash
+
+    def merkle_root(self) -> bytes:
+        """Get the raw Merkle root of the chain."""
+        return merkle_root(self._merkle_levels)
+
+    def merkle_proof(self, node_id: str) -> Optional[MerkleProof]:
+        """
+        Get the inclusion proof for a node.
+
+        Args:
+            node_id: The node identifier
+
+        Returns:
+            Sibling hashes from leaf to root, or None if not in chain
+        """
+        for index, node in enumerate(self.nodes):
+            if node.node_id == node_id:
+                return merkle_proof(self._merkle_levels, index)
+        return None
+
+    def _compute_chain_hash(self) -> str:
+        """Compute hash of entire chain in its chain_hash_version format."""
+        if self.chain_hash_version == CHAIN_HASH_VERSION_JOINED:
+            combined = "|".join(n.hash for n in self.nodes)
+            return hashlib.sha256(combined.encode()).hexdigest()
+        levels = merkle_build([bytes.fromhex(n.hash) for n in self.nodes])
+        return merkle_root(levels).hex()
+
+    def verify_chain_integrity(self, recompute: bool = True) -> bool:
+        """
+        Verify entire chain hasn't been tampered with.
+
+        Args:
+            recompute: Re-serialize every node instead of trusting
+                cached verification results
+        """
+        # Verify each node
+        for node in self.nodes:
+            if not node.verify_integrity(recompute):
+                return False
+
+        # Verify chain hash
+        return self.chain_hash == self._compute_chain_hash()
+
+    def get_timeline(self) -> List[Dict[str, Any]]:
+        """Get chronological timeline of decisions."""
+        sorted_nodes = sorted(self.nodes, key=lambda n: n.timestamp_ns)
+        return [
+            {
+                "timestamp": n.timestamp.isoformat(),
+                "decision": n.decision_type.value,
+                "source": n.source.value,
+                "rationale": n.rationale,
+                "confidence": n.confidence,
+            }
+            for n in sorted_nodes
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export to dictionary."""
+        return {
+            "chain_id": self.chain_id,
+            "root_node_id": self.root_node_id,
+            "terminal_node_id": self.terminal_node_id,
+            "outcome": self.outcome,
+            "created_at": self.created_at.isoformat(),
+            "completed_at": self.completed_at.isoformat(),
+            "nodes": [n.to_dict() for n in self.nodes],
+            "chain_hash_version": self.chain_hash_version,
+            "chain_hash": self.chain_hash,
+            "timeline": self.get_timeline(),
+        }
+
+    def to_json(self) -> bytes:
+        """Export to JSON bytes."""
+        return orjson.dumps(self.to_dict(), default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def to_dict_bulk(self) -> Dict[str, Any]:
+        """
+        Export to a column-oriented dictionary.
+
+        Nodes are exported as one list or NumPy array per field instead
+        of one dict per node. Decision types and sources are int8 codes
+        into the "decision_types" and "sources" value tables.
+        """
+        nodes = self.nodes
+        return {
+            "chain_id": self.chain_id,
+            "root_node_id": self.root_node_id,
+            "terminal_node_id": self.terminal_node_id,
+            "outcome": self.outcome,
+            "created_at": self.created_at.isoformat(),
+            "completed_at": self.completed_at.isoformat(),
+            "chain_hash_version": self.chain_hash_version,
+            "chain_hash": self.chain_hash,
+            "decision_types": _DECISION_TYPE_VALUES,
+            "sources": _DECISION_SOURCE_VALUES,
+            "nodes": {
+                "node_id": [n.node_id for n in nodes],
+                "decision_type_code": self._columns.type_codes,
+                "source_code": self._columns.source_codes,
+                "timestamp_ns": self._columns.timestamps_ns,
+                "confidence": np.fromiter(
+                    (n.confidence for n in nodes), dtype=np.float64, count=len(nodes)
+                ),
+                "rationale": [n.rationale for n in nodes],
+                "parent_node_id": [n.parent_node_id for n in nodes],
+                "input_data": [n.input_data for n in nodes],
+                "output_data": [n.output_data for n in nodes],
+                "hash_version": [n.hash_version for n in nodes],
+                "hash": [n.hash for n in nodes],
+            },
+        }
+
+    def to_json_bulk(self) -> bytes:
+        """Export the column-oriented form to JSON bytes."""
+        return orjson.dumps(
+            self.to_dict_bulk(),
+            default=payload_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def verify_decision_integrity(chain: DecisionChain) -> Dict[str, Any]:
+    """
+    Verify integrity of a decision chain.
+
+    Nodes are checked in one verify_batch() pass; the chain hash is
+    then compared against the stored node hashes without verifying
+    the nodes a second time.
+
+    Args:
+        chain: The DecisionChain to verify
+
+    Returns:
+        Verification results with details
+    """
+    results = {
+        "chain_id": chain.chain_id,
+        "verified": True,
+        "chain_hash_valid": True,
+        "nodes_verified": [],
+        "issues": [],
+    }
+
+    # Verify each node
+    for node, valid in zip(chain.nodes, verify_batch(chain.nodes), strict=True):
+        node_result = {
+            "node_id": node.node_id,
+            "valid": valid,
+        }
+        results["nodes_verified"].append(node_result)
+
+        if not node_result["valid"]:
+            results["verified"] = False
+            results["issues"].append(
+                f"Node {node.node_id} failed integrity check"
+            )
+
+    # Verify chain hash (nodes were checked above)
+    if chain.chain_hash != chain._compute_chain_hash():
+        results["verified"] = False
+        results["chain_hash_valid"] = False
+        results["issues"].append("Chain hash verification failed")
+
+    return results
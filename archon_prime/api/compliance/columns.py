@@ -0,0 +1,97 @@
+"""
+ARCHON PRIME - Decision Node Columns
+
+Columnar (structure-of-arrays) copy of the decision node fields that
+provenance queries filter on, so chain filters run as vectorized
+NumPy operations instead of attribute lookups on every node object.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+import numpy as np
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def timestamp_ns(ts: datetime) -> int:
+    """Convert a datetime to epoch nanoseconds (naive means UTC)."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return (ts - _EPOCH) // _MICROSECOND * 1_000
+
+
+def datetime_from_ns(ns: int) -> datetime:
+    """Convert epoch nanoseconds to a UTC datetime (microsecond precision)."""
+    return _EPOCH + timedelta(microseconds=ns // 1_000)
+
+
+def code_mask(codes: Iterable[int], size: int) -> np.ndarray:
+    """
+    Build a boolean lookup table from a set of enum codes.
+
+    Args:
+        codes: Codes to mark as selected
+        size: Number of codes in the enum
+
+    Returns:
+        Boolean array where mask[code] is True for selected codes
+    """
+    mask = np.zeros(size, dtype=np.bool_)
+    mask[list(codes)] = True
+    return mask
+
+
+class NodeColumns:
+    """
+    Append-only int8/int64 columns for one decision chain.
+
+    Backing arrays grow by doubling; the public properties return
+    views trimmed to the number of appended nodes.
+    """
+
+    __slots__ = ("_type_codes", "_source_codes", "_timestamps_ns", "_size")
+
+    def __init__(self, capacity: int = 8):
+        self._type_codes = np.empty(capacity, dtype=np.int8)
+        self._source_codes = np.empty(capacity, dtype=np.int8)
+        self._timestamps_ns = np.empty(capacity, dtype=np.int64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, type_code: int, source_code: int, ts_ns: int) -> None:
+        """Append one node's column values."""
+        if self._size == len(self._type_codes):
+            self._grow()
+        i = self._size
+        self._type_codes[i] = type_code
+        self._source_codes[i] = source_code
+        self._timestamps_ns[i] = ts_ns
+        self._size = i + 1
+
+    def _grow(self) -> None:
+        """Double the capacity of all columns."""
+        capacity = max(8, len(self._type_codes) * 2)
+        for name in ("_type_codes", "_source_codes", "_timestamps_ns"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    @property
+    def type_codes(self) -> np.ndarray:
+        """Decision type codes, one per node."""
+        return self._type_codes[:self._size]
+
+    @property
+    def source_codes(self) -> np.ndarray:
+        """Decision source codes, one per node."""
+        return self._source_codes[:self._size]
+
+    @property
+    def timestamps_ns(self) -> np.ndarray:
+        """Node timestamps in epoch nanoseconds, one per node."""
+        return self._timestamps_ns[:self._size]
@@ -0,0 +1,392 @@
+"""
+ARCHON PRIME - Decision Nodes
+
+Decision types and sources, and the hashed DecisionNode recording
+one decision in a provenance chain.
+"""
+
+import copy
+import hashlib
+import json
+import struct
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from uuid import uuid4
+
+import orjson
+
+from archon_prime.api.compliance.columns import datetime_from_ns
+from archon_prime.api.compliance.hashing import fast_digest, sha256_many
+
+# Node hash formats
+HASH_VERSION_JSON = 1  # SHA256 over sorted-key JSON (legacy)
+HASH_VERSION_CANONICAL_ISO = 2  # Canonical bytes, ISO-8601 timestamp
+HASH_VERSION_CANONICAL = 3  # Canonical bytes, int64 nanosecond timestamp
+
+_LENGTH = struct.Struct("<I")
+_FLOAT64 = struct.Struct("<d")
+_INT64 = struct.Struct("<q")
+_NONE_LENGTH = 0xFFFFFFFF
+_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+# Frozen payloads shared between nodes with identical content
+_PAYLOAD_POOL_SIZE = 4096
+_payload_pool: "OrderedDict[bytes, Tuple[bytes, Mapping[str, Any]]]" = OrderedDict()
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
+# Only JSON-native values are pooled: orjson writes a datetime, UUID or
+# str enum exactly like its string form, so those would share an entry
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Whether a value is made only of dicts, lists and JSON scalars."""
+    kind = type(value)
+    if kind is dict:
+        return all(
+            type(k) is str and _is_plain_json(v) for k, v in value.items()
+        )
+    if kind is list:
+        return all(_is_plain_json(v) for v in value)
+    return kind in _JSON_SCALARS
+
+
+def _deep_freeze(value: Any) -> Any:
+    """Copy a payload value into read-only mappings, tuples and frozensets."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _deep_freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_deep_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return copy.deepcopy(value)
+
+
+def _thaw(value: Any) -> Any:
+    """Copy a frozen payload value back into plain dicts, lists and sets."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    if isinstance(value, frozenset):
+        return set(value)
+    return value
+
+
+def _freeze_payload(payload: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Deep-copy and freeze a node payload, reusing identical payloads.
+
+    Nested containers are frozen too, so a payload shared between
+    nodes cannot be changed through any of them. Payloads made only of
+    JSON-native types are pooled by a fast in-memory digest of their
+    encoding, confirmed by comparing the encoding itself. Node hashes
+    are unaffected and remain SHA256.
+    """
+    if not payload:
+        return _EMPTY_PAYLOAD
+
+    if not _is_plain_json(payload):
+        return _deep_freeze(payload)
+    try:
+        encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    except TypeError:  # e.g. integers past 64 bits
+        return _deep_freeze(payload)
+
+    key = fast_digest(encoded)
+    pooled = _payload_pool.get(key)
+    if pooled is not None and pooled[0] == encoded:
+        _payload_pool.move_to_end(key)
+        return pooled[1]
+
+    frozen = _deep_freeze(payload)
+    _payload_pool[key] = (encoded, frozen)
+    if len(_payload_pool) > _PAYLOAD_POOL_SIZE:
+        _payload_pool.popitem(last=False)
+    return frozen
+
+
+def payload_json_default(value: Any) -> Any:
+    """JSON fallback: frozen payloads as dicts and sets, anything else as str."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, frozenset):
+        return str(set(value))
+    return str(value)
+
+
+def _frame(buf: bytearray, value: Optional[bytes]) -> None:
+    """Append a 4-byte length-prefixed field (None is its own marker)."""
+    if value is None:
+        buf += _LENGTH.pack(_NONE_LENGTH)
+        return
+    buf += _LENGTH.pack(len(value))
+    buf += value
+
+
+# Fields covered by the node hash (reassigning one invalidates caches)
+_HASHED_FIELDS = frozenset({
+    "node_id",
+    "decision_type",
+    "source",
+    "timestamp_ns",
+    "input_data",
+    "output_data",
+    "rationale",
+    "confidence",
+    "parent_node_id",
+    "hash_version",
+    "hash",
+})
+
+
+class DecisionType(str, Enum):
+    """Types of decisions in the trading chain."""
+
+    # Signal Generation
+    SIGNAL_GENERATED = "signal.generated"
+    SIGNAL_VALIDATED = "signal.validated"
+    SIGNAL_REJECTED = "signal.rejected"
+
+    # Gate Decisions
+    GATE_PASSED = "gate.passed"
+    GATE_BLOCKED = "gate.blocked"
+    GATE_OVERRIDE = "gate.override"
+
+    # Risk Evaluation
+    RISK_APPROVED = "risk.approved"
+    RISK_REDUCED = "risk.reduced"
+    RISK_REJECTED = "risk.rejected"
+
+    # Position Actions
+    POSITION_OPENED = "position.opened"
+    POSITION_MODIFIED = "position.modified"
+    POSITION_CLOSED = "position.closed"
+
+    # Emergency Actions
+    KILL_SWITCH_ACTIVATED = "emergency.kill_switch"
+    PANIC_HEDGE_TRIGGERED = "emergency.panic_hedge"
+    MANUAL_INTERVENTION = "emergency.manual"
+
+
+class DecisionSource(str, Enum):
+    """Source of a decision."""
+
+    AI_AGENT = "ai_agent"
+    SIGNAL_GATE = "signal_gate"
+    RISK_ENGINE = "risk_engine"
+    POSITION_MANAGER = "position_manager"
+    ADMIN_USER = "admin_user"
+    RISK_OFFICER = "risk_officer"
+    SYSTEM_AUTO = "system_auto"
+    EXTERNAL_SIGNAL = "external_signal"
+
+
+# Encoded enum values for canonical hashing (avoids .value per node)
+_DECISION_TYPE_VALUE_BYTES: Dict[DecisionType, bytes] = {
+    m: m.value.encode() for m in DecisionType
+}
+_DECISION_SOURCE_VALUE_BYTES: Dict[DecisionSource, bytes] = {
+    m: m.value.encode() for m in DecisionSource
+}
+
+# Small integer codes used by the per-chain node columns
+DECISION_TYPE_CODES: Dict[DecisionType, int] = {
+    m: i for i, m in enumerate(DecisionType)
+}
+DECISION_SOURCE_CODES: Dict[DecisionSource, int] = {
+    m: i for i, m in enumerate(DecisionSource)
+}
+
+
+@dataclass(slots=True, weakref_slot=True)
+class DecisionNode:
+    """A single node in the decision chain."""
+
+    node_id: str
+    decision_type: DecisionType
+    source: DecisionSource
+    timestamp_ns: int  # epoch nanoseconds (UTC)
+    input_data: Mapping[str, Any]  # frozen in __post_init__
+    output_data: Mapping[str, Any]  # frozen in __post_init__
+    rationale: str
+    confidence: float  # 0.0 to 1.0
+    parent_node_id: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None  # allocated on first use
+
+    # Integrity
+    hash_version: int = HASH_VERSION_CANONICAL
+    hash: str = field(default="")
+    hash_bytes: bytes = field(default=b"", repr=False, compare=False)
+
+    # Cached canonical bytes and verification result
+    _canonical: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _verified: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.node_id:
+            self.node_id = f"node_{uuid4().hex[:12]}"
+
+        # Rationales repeat heavily across nodes
+        self.rationale = sys.intern(self.rationale)
+
+        # Payloads are copied once and frozen all the way down
+        self.input_data = _freeze_payload(self.input_data)
+        self.output_data = _freeze_payload(self.output_data)
+
+        # Set directly so __setattr__ keeps the canonical bytes just built
+        if not self.hash:
+            object.__setattr__(self, "hash", self._compute_hash())
+            self._verified = True
+        if not self.hash_bytes:
+            self.hash_bytes = bytes.fromhex(self.hash)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reassigning a hashed field drops the cached bytes and result
+        if name in _HASHED_FIELDS:
+            object.__setattr__(self, "_canonical", None)
+            object.__setattr__(self, "_verified", False)
+        object.__setattr__(self, name, value)
+
+    def _canonical_bytes(self) -> bytes:
+        """
+        Serialize the hashed fields into a canonical byte buffer.
+
+        Fields are written in a fixed order, each prefixed with its
+        length, so the encoding is unambiguous without JSON escaping.
+        Payload dicts are encoded with orjson using sorted keys.
+        """
+        buf = bytearray()
+        _frame(buf, self.node_id.encode())
+        _frame(buf, _DECISION_TYPE_VALUE_BYTES[self.decision_type])
+        _frame(buf, _DECISION_SOURCE_VALUE_BYTES[self.source])
+        if self.hash_version == HASH_VERSION_CANONICAL_ISO:
+            _frame(buf, self.timestamp.isoformat().encode())
+        else:
+            _frame(buf, _INT64.pack(self.timestamp_ns))
+        _frame(buf, orjson.dumps(
+            self.input_data, default=payload_json_default, option=_JSON_OPTIONS
+        ))
+        _frame(buf, orjson.dumps(
+            self.output_data, default=payload_json_default, option=_JSON_OPTIONS
+        ))
+        _frame(buf, self.rationale.encode())
+        _frame(buf, _FLOAT64.pack(self.confidence))
+        _frame(
+            buf,
+            self.parent_node_id.encode() if self.parent_node_id is not None else None,
+        )
+        return bytes(buf)
+
+    def _compute_hash(self) -> str:
+        """Compute SHA256 hash for integrity verification."""
+        if self.hash_version == HASH_VERSION_JSON:
+            return self._compute_json_hash()
+        if self._canonical is None:
+            self._canonical = self._canonical_bytes()
+        return hashlib.sha256(self._canonical).hexdigest()
+
+    def _compute_json_hash(self) -> str:
+        """Compute the legacy (version 1) SHA256 hash over sorted JSON."""
+        data = {
+            "node_id": self.node_id,
+            "decision_type": self.decision_type.value,
+            "source": self.source.value,
+            "timestamp": self.timestamp.isoformat(),
+            "input_data": self.input_data,
+            "output_data": self.output_data,
+            "rationale": self.rationale,
+            "confidence": self.confidence,
+            "parent_node_id": self.parent_node_id,
+        }
+        return hashlib.sha256(
+            json.dumps(data, sort_keys=True, default=payload_json_default).encode()
+        ).hexdigest()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Node time as a UTC datetime."""
+        return datetime_from_ns(self.timestamp_ns)
+
+    def verify_integrity(self, recompute: bool = True) -> bool:
+        """
+        Verify node hasn't been tampered with.
+
+        A successful result is cached until a hashed field is reassigned.
+        Only recompute=False trusts it, so in-place edits of nested
+        payload data are caught by default.
+
+        Args:
+            recompute: Re-serialize the node and ignore cached results
+        """
+        if self._verified and not recompute:
+            return True
+        if recompute:
+            self._canonical = None
+        self._verified = self.hash == self._compute_hash()
+        return self._verified
+
+    def invalidate(self) -> None:
+        """Drop cached hashing state after in-place payload changes."""
+        self._canonical = None
+        self._verified = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export to dictionary."""
+        return {
+            "node_id": self.node_id,
+            "decision_type": self.decision_type.value,
+            "source": self.source.value,
+            "timestamp": self.timestamp.isoformat(),
+            "input_data": _thaw(self.input_data),
+            "output_data": _thaw(self.output_data),
+            "rationale": self.rationale,
+            "confidence": self.confidence,
+            "parent_node_id": self.parent_node_id,
+            "metadata": self.metadata if self.metadata is not None else {},
+            "hash_version": self.hash_version,
+            "hash": self.hash,
+        }
+
+    def to_json(self) -> bytes:
+        """Export to JSON bytes."""
+        return orjson.dumps(self.to_dict(), default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def verify_batch(nodes: List[DecisionNode]) -> List[bool]:
+    """
+    Verify the integrity of many nodes in one pass.
+
+    Canonical buffers for all nodes are gathered first and hashed
+    together with sha256_many(); legacy JSON-hashed nodes fall back
+    to per-node verification.
+
+    Args:
+        nodes: Nodes to verify
+
+    Returns:
+        Per-node verification result in input order
+    """
+    results = [False] * len(nodes)
+    batch_indexes: List[int] = []
+    buffers: List[bytes] = []
+
+    for i, node in enumerate(nodes):
+        if node.hash_version == HASH_VERSION_JSON:
+            results[i] = node.verify_integrity()
+        else:
+            batch_indexes.append(i)
+            buffers.append(node._canonical_bytes())
+
+    for i, digest in zip(batch_indexes, sha256_many(buffers), strict=True):
+        results[i] = digest.hex() == nodes[i].hash
+
+    return results
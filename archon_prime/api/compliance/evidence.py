@@ -1,20 +1,18 @@
 """
 ARCHON PRIME - Evidence Packaging & Export
 
-Provides evidence collection, packaging, and export for
-audits, regulatory inquiries, and internal reviews.
+Provides evidence collection and packaging for audits,
+regulatory inquiries, and internal reviews. Exports live in
+exporter.py.
 """
 
 import hashlib
 import json
-import zipfile
-import io
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import List, Dict, Optional, Any, BinaryIO
+from typing import List, Dict, Optional, Any
 from uuid import uuid4
-from pathlib import Path
 
 
 class EvidenceType(str, Enum):
@@ -422,118 +420,6 @@ class EvidencePackager:
         return counts
 
 
-def export_evidence_package(
-    package: EvidencePackage,
-    format: EvidenceFormat = EvidenceFormat.ZIP,
-    output_path: Optional[Path] = None,
-) -> bytes:
-    """
-    Export evidence package to specified format.
-
-    Args:
-        package: The EvidencePackage to export
-        format: Output format
-        output_path: Optional path to write file
-
-    Returns:
-        Bytes of the exported package
-    """
-    package.exported_at = datetime.now(timezone.utc)
-    package.exported_format = format
-
-    if format == EvidenceFormat.JSON:
-        content = json.dumps(package.to_dict(), indent=2, default=str)
-        data = content.encode("utf-8")
-
-    elif format == EvidenceFormat.ZIP:
-        data = _create_zip_bundle(package)
-
-    else:
-        # Default to JSON for unsupported formats
-        content = json.dumps(package.to_dict(), indent=2, default=str)
-        data = content.encode("utf-8")
-
-    if output_path:
-        output_path.write_bytes(data)
-
-    return data
-
-
-def _create_zip_bundle(package: EvidencePackage) -> bytes:
-    """Create a ZIP bundle of the evidence package."""
-    buffer = io.BytesIO()
-
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Add manifest
-        manifest = json.dumps(package.get_manifest(), indent=2, default=str)
-        zf.writestr("MANIFEST.json", manifest)
-
-        # Add README
-        readme = _generate_readme(package)
-        zf.writestr("README.md", readme)
-
-        # Add each evidence item
-        for item in package.items:
-            filename = f"evidence/{item.evidence_type.value}/{item.item_id}.json"
-            content = json.dumps(item.to_dict(), indent=2, default=str)
-            zf.writestr(filename, content)
-
-        # Add integrity verification
-        integrity = package.verify_integrity()
-        zf.writestr("INTEGRITY.json", json.dumps(integrity, indent=2))
-
-    return buffer.getvalue()
-
-
-def _generate_readme(package: EvidencePackage) -> str:
-    """Generate README for evidence package."""
-    return f"""# Evidence Package: {package.title}
-
-## Package Information
-
-- **Package ID:** {package.package_id}
-- **Purpose:** {package.purpose}
-- **Requested By:** {package.requested_by}
-- **Requested At:** {package.requested_at.isoformat()}
-- **Classification:** {package.classification}
-
-## Evidence Period
-
-- **Start:** {package.period_start.isoformat()}
-- **End:** {package.period_end.isoformat()}
-
-## Contents
-
-This package contains {len(package.items)} evidence items:
-
-| Type | Title | Hash |
-|------|-------|------|
-{chr(10).join(f"| {i.evidence_type.value} | {i.title} | {i.hash[:16]}... |" for i in package.items)}
-
-## Integrity Verification
-
-Package Hash: `{package.package_hash}`
-
-To verify integrity, compare the hashes in INTEGRITY.json with
-the computed hashes of each evidence item.
-
-## Retention
-
-This package must be retained for {package.retention_days} days
-({package.retention_days // 365} years) from the export date.
-
-## Legal Notice
-
-This evidence package is {package.classification} and contains
-sensitive trading and operational data. Unauthorized disclosure
-is prohibited.
-
----
-Generated by ARCHON PRIME Compliance Module
-Exported: {package.exported_at.isoformat() if package.exported_at else "Not yet exported"}
-"""
-
-
 def create_audit_bundle(
     packager: EvidencePackager,
     purpose: str,
@@ -0,0 +1,170 @@
+"""
+ARCHON PRIME - Evidence Export
+
+Writes evidence packages out as JSON or ZIP bundles, either as one
+bytes object or streamed item by item to a file object.
+"""
+
+import io
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+import orjson
+
+from archon_prime.api.compliance.evidence import EvidenceFormat, EvidencePackage
+
+
+def export_evidence_package(
+    package: EvidencePackage,
+    format: EvidenceFormat = EvidenceFormat.ZIP,
+    output_path: Optional[Path] = None,
+) -> bytes:
+    """
+    Export evidence package to specified format.
+
+    Args:
+        package: The EvidencePackage to export
+        format: Output format
+        output_path: Optional path to write file
+
+    Returns:
+        Bytes of the exported package
+    """
+    package.exported_at = datetime.now(timezone.utc)
+    package.exported_format = format
+
+    if format == EvidenceFormat.JSON:
+        data = _dumps(package.to_dict(), indent=True)
+
+    elif format == EvidenceFormat.ZIP:
+        data = _create_zip_bundle(package)
+
+    else:
+        # Default to JSON for unsupported formats
+        data = _dumps(package.to_dict(), indent=True)
+
+    if output_path:
+        output_path.write_bytes(data)
+
+    return data
+
+
+def export_evidence_package_streaming(
+    package: EvidencePackage,
+    sink: BinaryIO,
+    format: EvidenceFormat = EvidenceFormat.JSON,
+) -> None:
+    """
+    Stream an evidence package to a binary sink.
+
+    Unlike export_evidence_package, the package is never materialized
+    as a single dict/string/bytes object: items are encoded and written
+    one at a time, so peak memory is bounded by the largest item.
+
+    Args:
+        package: The EvidencePackage to export
+        sink: Writable binary file-like object
+        format: Output format (JSON or ZIP; others fall back to JSON)
+    """
+    package.exported_at = datetime.now(timezone.utc)
+    package.exported_format = format
+
+    if format == EvidenceFormat.ZIP:
+        _write_zip_bundle(package, sink)
+        return
+
+    # Manifest object with its closing brace dropped, then the items array
+    sink.write(_dumps(package.get_manifest())[:-1])
+    sink.write(b',"items":[')
+    for i, item in enumerate(package.items):
+        if i:
+            sink.write(b",")
+        sink.write(_dumps(item.to_dict()))
+    sink.write(b"]}")
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Encode evidence data to JSON bytes with orjson."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=str, option=option)
+
+
+def _create_zip_bundle(package: EvidencePackage) -> bytes:
+    """Create a ZIP bundle of the evidence package."""
+    buffer = io.BytesIO()
+    _write_zip_bundle(package, buffer)
+    return buffer.getvalue()
+
+
+def _write_zip_bundle(package: EvidencePackage, fileobj: BinaryIO) -> None:
+    """Write a ZIP bundle of the evidence package to a file object."""
+    with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED) as zf:
+        # Add manifest
+        zf.writestr("MANIFEST.json", _dumps(package.get_manifest(), indent=True))
+
+        # Add README
+        readme = _generate_readme(package)
+        zf.writestr("README.md", readme)
+
+        # Add each evidence item, one at a time
+        for item in package.items:
+            filename = f"evidence/{item.evidence_type.value}/{item.item_id}.json"
+            with zf.open(filename, "w") as entry:
+                entry.write(_dumps(item.to_dict(), indent=True))
+
+        # Add integrity verification
+        integrity = package.verify_integrity()
+        zf.writestr("INTEGRITY.json", _dumps(integrity, indent=True))
+
+
+def _generate_readme(package: EvidencePackage) -> str:
+    """Generate README for evidence package."""
+    return f"""# Evidence Package: {package.title}
+
+## Package Information
+
+- **Package ID:** {package.package_id}
+- **Purpose:** {package.purpose}
+- **Requested By:** {package.requested_by}
+- **Requested At:** {package.requested_at.isoformat()}
+- **Classification:** {package.classification}
+
+## Evidence Period
+
+- **Start:** {package.period_start.isoformat()}
+- **End:** {package.period_end.isoformat()}
+
+## Contents
+
+This package contains {len(package.items)} evidence items:
+
+| Type | Title | Hash |
+|------|-------|------|
+{chr(10).join(f"| {i.evidence_type.value} | {i.title} | {i.hash[:16]}... |" for i in package.items)}
+
+## Integrity Verification
+
+Package Hash: `{package.package_hash}`
+
+To verify integrity, compare the hashes in INTEGRITY.json with
+the computed hashes of each evidence item.
+
+## Retention
+
+This package must be retained for {package.retention_days} days
+({package.retention_days // 365} years) from the export date.
+
+## Legal Notice
+
+This evidence package is {package.classification} and contains
+sensitive trading and operational data. Unauthorized disclosure
+is prohibited.
+
+---
+Generated by ARCHON PRIME Compliance Module
+Exported: {package.exported_at.isoformat() if package.exported_at else "Not yet exported"}
+"""
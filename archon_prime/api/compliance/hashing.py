@@ -0,0 +1,96 @@
+"""
+ARCHON PRIME - Compliance Hashing Helpers
+
+Bulk SHA256 used when re-verifying many decision nodes at once, and
+a fast digest for in-memory keys.
+
+Audit hashes (node hashes, chain roots, evidence hashes) are always
+SHA256. fast_digest() is only for keys that never leave the process.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+try:
+    import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# hashlib releases the GIL for inputs of at least this many bytes,
+# so only large payloads benefit from hashing on several threads.
+GIL_RELEASE_BYTES = 2048
+
+# Buffers handed to each worker per task
+BATCH_LANES = 8
+
+_MAX_WORKERS = min(8, os.cpu_count() or 1)
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the shared hashing thread pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_MAX_WORKERS, thread_name_prefix="archon-sha256"
+        )
+    return _executor
+
+
+def _sha256_lane(buffers: List[bytes]) -> List[bytes]:
+    """Hash one lane of buffers."""
+    return [hashlib.sha256(b).digest() for b in buffers]
+
+
+def sha256_many(buffers: List[bytes]) -> List[bytes]:
+    """
+    Compute SHA256 digests for a batch of buffers.
+
+    Buffers are split into lanes of BATCH_LANES and hashed on a
+    thread pool when the batch is big enough for the GIL release to
+    pay off; otherwise they are hashed inline.
+
+    Args:
+        buffers: Byte buffers to hash
+
+    Returns:
+        Raw 32-byte digests in input order
+    """
+    if (
+        _MAX_WORKERS < 2
+        or len(buffers) < BATCH_LANES * 2
+        or sum(map(len, buffers)) < GIL_RELEASE_BYTES * len(buffers)
+    ):
+        return _sha256_lane(buffers)
+
+    lanes = [
+        buffers[i:i + BATCH_LANES] for i in range(0, len(buffers), BATCH_LANES)
+    ]
+    digests: List[bytes] = []
+    for lane_digests in _get_executor().map(_sha256_lane, lanes):
+        digests.extend(lane_digests)
+    return digests
+
+
+def fast_digest(data: bytes) -> bytes:
+    """
+    Compute a 128-bit digest for in-memory lookup keys.
+
+    Uses BLAKE3 when installed (pip install archon-platform[fasthash]).
+    Otherwise falls back to truncated SHA256, which OpenSSL runs on the
+    CPU's SHA extensions and beats stdlib BLAKE2b where they exist.
+    Never use it for audit or tamper evidence.
+
+    Args:
+        data: Bytes to digest
+
+    Returns:
+        16-byte digest
+    """
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3(data).digest(length=16)
+    return hashlib.sha256(data).digest()[:16]
@@ -0,0 +1,139 @@
+"""
+ARCHON PRIME - Merkle Tree Helpers
+
+Binary Merkle tree over raw 32-byte SHA256 digests.
+Used for decision chain roots and O(log n) inclusion proofs.
+
+Levels are stored bottom-up: levels[0] holds the leaves and the
+last level holds the root. The last hash of an odd-sized level is
+promoted to the next level unchanged rather than paired with itself,
+so [a, b, c] and [a, b, c, c] have different roots.
+
+Interior nodes are hashed under a fixed one-block prefix so they can
+never collide with a leaf digest. The prefix block is compressed once
+into a prototype that is copied per pair, so the prefix adds no
+SHA256 compressions over hashing the bare 64-byte pair.
+"""
+
+import hashlib
+from typing import List, Tuple
+
+# Proof step: (sibling hash, sibling is the right-hand child)
+MerkleProof = List[Tuple[bytes, bool]]
+
+EMPTY_ROOT = hashlib.sha256(b"").digest()
+
+# Exactly one SHA256 block (64 bytes)
+INTERIOR_PREFIX = b"archon-chain-v1|".ljust(64, b"\0")
+_INTERIOR_PROTO = hashlib.sha256(INTERIOR_PREFIX)
+
+
+def hash_pair(left: bytes, right: bytes) -> bytes:
+    """Hash two child digests into their parent."""
+    h = _INTERIOR_PROTO.copy()
+    h.update(left)
+    h.update(right)
+    return h.digest()
+
+
+def merkle_build(leaves: List[bytes]) -> List[List[bytes]]:
+    """
+    Build all tree levels from a list of leaf digests.
+
+    Args:
+        leaves: Leaf digests in order
+
+    Returns:
+        Tree levels, leaves first
+    """
+    levels = [list(leaves)]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        levels.append([
+            hash_pair(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ])
+    return levels
+
+
+def merkle_append(levels: List[List[bytes]], leaf: bytes) -> None:
+    """
+    Append a leaf and update its path to the root in O(log n).
+
+    Args:
+        levels: Tree levels to update in place
+        leaf: New leaf digest
+    """
+    if not levels:
+        levels.append([])
+    levels[0].append(leaf)
+
+    index = len(levels[0]) - 1
+    depth = 0
+    while len(levels[depth]) > 1:
+        level = levels[depth]
+        left_index = index & ~1
+        if left_index + 1 < len(level):
+            parent = hash_pair(level[left_index], level[left_index + 1])
+        else:
+            parent = level[left_index]
+
+        index >>= 1
+        depth += 1
+        if depth == len(levels):
+            levels.append([])
+
+        upper = levels[depth]
+        if index < len(upper):
+            upper[index] = parent
+        else:
+            upper.append(parent)
+
+
+def merkle_root(levels: List[List[bytes]]) -> bytes:
+    """Get the root digest (EMPTY_ROOT for an empty tree)."""
+    if not levels or not levels[0]:
+        return EMPTY_ROOT
+    return levels[-1][0]
+
+
+def merkle_proof(levels: List[List[bytes]], index: int) -> MerkleProof:
+    """
+    Build the inclusion proof for the leaf at an index.
+
+    Args:
+        levels: Tree levels
+        index: Leaf index
+
+    Returns:
+        Sibling hashes from leaf to root (levels where the node was
+        promoted have no sibling and add no step)
+    """
+    proof: MerkleProof = []
+    for level in levels[:-1]:
+        sibling_index = index ^ 1
+        if sibling_index < len(level):
+            proof.append((level[sibling_index], sibling_index > index))
+        index >>= 1
+    return proof
+
+
+def verify_merkle_proof(leaf: bytes, proof: MerkleProof, root: bytes) -> bool:
+    """
+    Verify that a leaf is included under a root.
+
+    Args:
+        leaf: Leaf digest
+        proof: Inclusion proof from merkle_proof()
+        root: Expected root digest
+
+    Returns:
+        True if the proof is valid
+    """
+    current = leaf
+    for sibling, sibling_is_right in proof:
+        if sibling_is_right:
+            current = hash_pair(current, sibling)
+        else:
+            current = hash_pair(sibling, current)
+    return current == root
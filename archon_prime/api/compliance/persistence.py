@@ -0,0 +1,114 @@
+"""
+ARCHON PRIME - Batched Provenance Persistence
+
+Background writer that coalesces completed decision chains into
+batched storage writes, off the request path.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Max chains per storage write
+WRITE_BATCH_SIZE = 100
+
+# How long a batch waits for more chains after its first one
+WRITE_BATCH_WINDOW_SEC = 0.05
+
+
+class ChainWriter:
+    """
+    Queue-fed background task that writes chains in batches.
+
+    Each batch is handed to save_batch() (e.g. a backend doing one
+    multi-row INSERT or COPY); on_saved() is called with the batch
+    once the write succeeds. Failed batches and callback errors are
+    logged and dropped from the queue; the chains stay in the
+    tracker's memory.
+    """
+
+    def __init__(
+        self,
+        save_batch: Callable[[List[Any]], Awaitable[None]],
+        on_saved: Callable[[List[Any]], None],
+        batch_size: int = WRITE_BATCH_SIZE,
+        window_sec: float = WRITE_BATCH_WINDOW_SEC,
+    ):
+        """
+        Initialize the writer (the task starts on first submit).
+
+        Args:
+            save_batch: Coroutine function persisting a list of chains
+            on_saved: Callback for each successfully written batch
+            batch_size: Max chains per write
+            window_sec: Time to wait for a batch to fill
+        """
+        self._save_batch = save_batch
+        self._on_saved = on_saved
+        self.batch_size = batch_size
+        self.window_sec = window_sec
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, chain: Any) -> None:
+        """Queue a chain for writing (requires a running event loop)."""
+        if self._task is None or self._task.done():
+            # Chains still queued for a stopped task go to the new one
+            if self._queue is None or self._queue.empty():
+                self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._queue.put_nowait(chain)
+
+    async def flush(self) -> None:
+        """Wait until every queued chain has been written."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Drain the queue and stop the writer task."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and write them."""
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await queue.get()]
+            try:
+                deadline = loop.time() + self.window_sec
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except TimeoutError:
+                        break
+
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, batch: List[Any]) -> None:
+        """Write one batch; errors are logged so the writer keeps running."""
+        try:
+            await self._save_batch(batch)
+        except Exception as e:
+            logger.error(f"Failed to persist {len(batch)} decision chains: {e}")
+            return
+
+        try:
+            self._on_saved(batch)
+        except Exception as e:
+            logger.error(f"Saved-chains callback failed for {len(batch)} chains: {e}")
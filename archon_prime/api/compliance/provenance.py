@@ -3,210 +3,65 @@ ARCHON PRIME - Decision Provenance Tracking
 
 Provides complete chain-of-custody for every trading decision.
 Answers: "Why did this trade happen?"
+
+Nodes live in decisions.py, chains in chains.py and queries in
+query.py; the tracker and the public API are exported from here.
 """
 
-import hashlib
-import json
-from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
-from enum import Enum
-from typing import List, Dict, Optional, Any, Set
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-
-class DecisionType(str, Enum):
-    """Types of decisions in the trading chain."""
-
-    # Signal Generation
-    SIGNAL_GENERATED = "signal.generated"
-    SIGNAL_VALIDATED = "signal.validated"
-    SIGNAL_REJECTED = "signal.rejected"
-
-    # Gate Decisions
-    GATE_PASSED = "gate.passed"
-    GATE_BLOCKED = "gate.blocked"
-    GATE_OVERRIDE = "gate.override"
-
-    # Risk Evaluation
-    RISK_APPROVED = "risk.approved"
-    RISK_REDUCED = "risk.reduced"
-    RISK_REJECTED = "risk.rejected"
-
-    # Position Actions
-    POSITION_OPENED = "position.opened"
-    POSITION_MODIFIED = "position.modified"
-    POSITION_CLOSED = "position.closed"
-
-    # Emergency Actions
-    KILL_SWITCH_ACTIVATED = "emergency.kill_switch"
-    PANIC_HEDGE_TRIGGERED = "emergency.panic_hedge"
-    MANUAL_INTERVENTION = "emergency.manual"
-
-
-class DecisionSource(str, Enum):
-    """Source of a decision."""
-
-    AI_AGENT = "ai_agent"
-    SIGNAL_GATE = "signal_gate"
-    RISK_ENGINE = "risk_engine"
-    POSITION_MANAGER = "position_manager"
-    ADMIN_USER = "admin_user"
-    RISK_OFFICER = "risk_officer"
-    SYSTEM_AUTO = "system_auto"
-    EXTERNAL_SIGNAL = "external_signal"
-
-
-@dataclass
-class DecisionNode:
-    """A single node in the decision chain."""
-
-    node_id: str
-    decision_type: DecisionType
-    source: DecisionSource
-    timestamp: datetime
-    input_data: Dict[str, Any]
-    output_data: Dict[str, Any]
-    rationale: str
-    confidence: float  # 0.0 to 1.0
-    parent_node_id: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
-
-    # Integrity
-    hash: str = field(default="")
-
-    def __post_init__(self):
-        if not self.node_id:
-            self.node_id = f"node_{uuid4().hex[:12]}"
-        if not self.hash:
-            self.hash = self._compute_hash()
-
-    def _compute_hash(self) -> str:
-        """Compute SHA256 hash for integrity verification."""
-        data = {
-            "node_id": self.node_id,
-            "decision_type": self.decision_type.value,
-            "source": self.source.value,
-            "timestamp": self.timestamp.isoformat(),
-            "input_data": self.input_data,
-            "output_data": self.output_data,
-            "rationale": self.rationale,
-            "confidence": self.confidence,
-            "parent_node_id": self.parent_node_id,
-        }
-        return hashlib.sha256(
-            json.dumps(data, sort_keys=True, default=str).encode()
-        ).hexdigest()
-
-    def verify_integrity(self) -> bool:
-        """Verify node hasn't been tampered with."""
-        return self.hash == self._compute_hash()
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Export to dictionary."""
-        return {
-            "node_id": self.node_id,
-            "decision_type": self.decision_type.value,
-            "source": self.source.value,
-            "timestamp": self.timestamp.isoformat(),
-            "input_data": self.input_data,
-            "output_data": self.output_data,
-            "rationale": self.rationale,
-            "confidence": self.confidence,
-            "parent_node_id": self.parent_node_id,
-            "metadata": self.metadata,
-            "hash": self.hash,
-        }
-
-
-@dataclass
-class DecisionChain:
-    """A complete chain of decisions leading to an outcome."""
-
-    chain_id: str
-    root_node_id: str
-    terminal_node_id: str
-    outcome: str  # "executed", "rejected", "emergency_closed"
-    created_at: datetime
-    completed_at: datetime
-    nodes: List[DecisionNode] = field(default_factory=list)
-
-    # Chain integrity
-    chain_hash: str = field(default="")
-
-    def __post_init__(self):
-        if not self.chain_id:
-            self.chain_id = f"chain_{uuid4().hex[:12]}"
-        if not self.chain_hash:
-            self.chain_hash = self._compute_chain_hash()
-
-    def _compute_chain_hash(self) -> str:
-        """Compute hash of entire chain."""
-        node_hashes = [n.hash for n in self.nodes]
-        combined = "|".join(node_hashes)
-        return hashlib.sha256(combined.encode()).hexdigest()
-
-    def verify_chain_integrity(self) -> bool:
-        """Verify entire chain hasn't been tampered with."""
-        # Verify each node
-        for node in self.nodes:
-            if not node.verify_integrity():
-                return False
-
-        # Verify chain hash
-        return self.chain_hash == self._compute_chain_hash()
-
-    def get_timeline(self) -> List[Dict[str, Any]]:
-        """Get chronological timeline of decisions."""
-        sorted_nodes = sorted(self.nodes, key=lambda n: n.timestamp)
-        return [
-            {
-                "timestamp": n.timestamp.isoformat(),
-                "decision": n.decision_type.value,
-                "source": n.source.value,
-                "rationale": n.rationale,
-                "confidence": n.confidence,
-            }
-            for n in sorted_nodes
-        ]
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Export to dictionary."""
-        return {
-            "chain_id": self.chain_id,
-            "root_node_id": self.root_node_id,
-            "terminal_node_id": self.terminal_node_id,
-            "outcome": self.outcome,
-            "created_at": self.created_at.isoformat(),
-            "completed_at": self.completed_at.isoformat(),
-            "nodes": [n.to_dict() for n in self.nodes],
-            "chain_hash": self.chain_hash,
-            "timeline": self.get_timeline(),
-        }
-
-
-@dataclass
-class ProvenanceQuery:
-    """Query parameters for provenance searches."""
-
-    # Time range
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
-
-    # Filters
-    decision_types: Optional[Set[DecisionType]] = None
-    sources: Optional[Set[DecisionSource]] = None
-    outcome: Optional[str] = None
-
-    # Identifiers
-    trade_id: Optional[str] = None
-    signal_id: Optional[str] = None
-    profile_id: Optional[str] = None
-    user_id: Optional[str] = None
-
-    # Options
-    include_rejected: bool = True
-    include_emergency: bool = True
-    max_results: int = 100
+from archon_prime.api.compliance import _query_jit
+from archon_prime.api.compliance.chains import (
+    CHAIN_HASH_VERSION_JOINED,
+    CHAIN_HASH_VERSION_MERKLE,
+    DecisionChain,
+    verify_decision_integrity,
+)
+from archon_prime.api.compliance.columns import datetime_from_ns
+from archon_prime.api.compliance.decisions import (
+    DECISION_SOURCE_CODES,
+    DECISION_TYPE_CODES,
+    HASH_VERSION_CANONICAL,
+    HASH_VERSION_CANONICAL_ISO,
+    HASH_VERSION_JSON,
+    DecisionNode,
+    DecisionSource,
+    DecisionType,
+    verify_batch,
+)
+from archon_prime.api.compliance.merkle import MerkleProof, verify_merkle_proof
+from archon_prime.api.compliance.persistence import ChainWriter
+from archon_prime.api.compliance.query import ChainIndex, ProvenanceQuery, run_query
+from archon_prime.api.config import settings
+
+__all__ = [
+    "HASH_VERSION_JSON",
+    "HASH_VERSION_CANONICAL_ISO",
+    "HASH_VERSION_CANONICAL",
+    "CHAIN_HASH_VERSION_JOINED",
+    "CHAIN_HASH_VERSION_MERKLE",
+    "DECISION_TYPE_CODES",
+    "DECISION_SOURCE_CODES",
+    "DecisionType",
+    "DecisionSource",
+    "DecisionNode",
+    "DecisionChain",
+    "MerkleProof",
+    "ProvenanceQuery",
+    "ProvenanceTracker",
+    "query_decision_chain",
+    "get_trade_provenance",
+    "get_signal_provenance",
+    "verify_batch",
+    "verify_decision_integrity",
+    "verify_merkle_proof",
+]
 
 
 class ProvenanceTracker:
@@ -217,18 +72,55 @@ class ProvenanceTracker:
     from signal generation to trade execution.
     """
 
-    def __init__(self, storage_backend=None):
+    def __init__(
+        self,
+        storage_backend=None,
+        hot_cache_size: Optional[int] = None,
+        hot_ttl_sec: Optional[float] = None,
+    ):
         """
         Initialize provenance tracker.
 
+        Completed chains are kept in memory until they exceed the hot
+        cache size or TTL, then evicted (only when a storage backend
+        holds the durable copy). Active chains are never evicted.
+
         Args:
             storage_backend: Database or file storage for persistence
+            hot_cache_size: Max chains kept in memory
+                (default: settings.PROVENANCE_HOT_CACHE_SIZE)
+            hot_ttl_sec: Seconds a completed chain stays in memory
+                (default: settings.PROVENANCE_HOT_TTL_SEC)
         """
         self.storage = storage_backend
+        self.hot_cache_size = (
+            hot_cache_size
+            if hot_cache_size is not None
+            else settings.PROVENANCE_HOT_CACHE_SIZE
+        )
+        self.hot_ttl_sec = (
+            hot_ttl_sec if hot_ttl_sec is not None else settings.PROVENANCE_HOT_TTL_SEC
+        )
         self._chains: Dict[str, DecisionChain] = {}
-        self._nodes_by_id: Dict[str, DecisionNode] = {}
+        self._nodes_by_id: weakref.WeakValueDictionary[str, DecisionNode] = (
+            weakref.WeakValueDictionary()
+        )
         self._active_chains: Dict[str, str] = {}  # context_id -> chain_id
 
+        # Completed, persisted chains in LRU order -> monotonic time
+        self._completed_at: OrderedDict[str, float] = OrderedDict()
+
+        # Batched background writes for backends with async save_chains()
+        self._writer: Optional[ChainWriter] = None
+        save_chains = getattr(storage_backend, "save_chains", None)
+        if save_chains is not None:
+            self._writer = ChainWriter(save_chains, self._on_chains_saved)
+
+        # Secondary indexes used to prune query() candidates
+        self._index = ChainIndex()
+
+        _query_jit.warmup(len(DecisionType), len(DecisionSource))
+
     def start_chain(
         self,
         context_id: str,
@@ -252,14 +144,15 @@ class ProvenanceTracker:
         Returns:
             New DecisionChain
         """
-        now = datetime.now(timezone.utc)
+        now_ns = time.time_ns()
+        now = datetime_from_ns(now_ns)
 
         # Create root node
         root_node = DecisionNode(
             node_id=f"node_{uuid4().hex[:12]}",
             decision_type=initial_decision,
             source=source,
-            timestamp=now,
+            timestamp_ns=now_ns,
             input_data=input_data,
             output_data={},
             rationale=rationale,
@@ -278,9 +171,9 @@ class ProvenanceTracker:
         )
 
         # Store
-        self._chains[chain.chain_id] = chain
-        self._nodes_by_id[root_node.node_id] = root_node
+        self._store_chain(chain)
         self._active_chains[context_id] = chain.chain_id
+        self._evict()
 
         return chain
 
@@ -319,30 +212,30 @@ class ProvenanceTracker:
         if not chain:
             return None
 
-        now = datetime.now(timezone.utc)
+        now_ns = time.time_ns()
 
         # Create new node
         node = DecisionNode(
             node_id=f"node_{uuid4().hex[:12]}",
             decision_type=decision_type,
             source=source,
-            timestamp=now,
+            timestamp_ns=now_ns,
             input_data=input_data,
             output_data=output_data,
             rationale=rationale,
             confidence=confidence,
             parent_node_id=chain.terminal_node_id,
-            metadata=metadata or {},
+            metadata=metadata or None,
         )
 
         # Update chain
-        chain.nodes.append(node)
+        chain.append_node(node)
         chain.terminal_node_id = node.node_id
-        chain.completed_at = now
-        chain.chain_hash = chain._compute_chain_hash()
+        chain.completed_at = datetime_from_ns(now_ns)
 
         # Store node
         self._nodes_by_id[node.node_id] = node
+        self._index.add_node(chain_id, node)
 
         return node
 
@@ -372,30 +265,141 @@ class ProvenanceTracker:
             return None
 
         # Update chain
+        self._index.set_outcome(chain, outcome)
         chain.outcome = outcome
         chain.completed_at = datetime.now(timezone.utc)
 
         # Attach final data to terminal node
         if final_data and chain.nodes:
             terminal = chain.nodes[-1]
+            if terminal.metadata is None:
+                terminal.metadata = {}
             terminal.metadata["final_data"] = final_data
 
-        # Recompute chain hash
-        chain.chain_hash = chain._compute_chain_hash()
-
         # Remove from active
         del self._active_chains[context_id]
 
-        # Persist if storage available
+        # Persist if storage available; chains become evictable once saved
         if self.storage:
             self._persist_chain(chain)
+        else:
+            self._mark_completed(chain_id)
+
+        return chain
+
+    def _mark_completed(self, chain_id: str) -> None:
+        """Make a completed chain eligible for eviction."""
+        self._completed_at[chain_id] = time.monotonic()
+        self._completed_at.move_to_end(chain_id)
+        self._evict()
+
+    def _on_chains_saved(self, chains: List[DecisionChain]) -> None:
+        """Writer callback for a successfully persisted batch."""
+        for chain in chains:
+            if chain.chain_id in self._chains:
+                self._mark_completed(chain.chain_id)
+
+    async def flush(self) -> None:
+        """Wait for queued chain writes to reach storage."""
+        if self._writer is not None:
+            await self._writer.flush()
+
+    async def close(self) -> None:
+        """Drain queued chain writes and stop the background writer."""
+        if self._writer is not None:
+            await self._writer.close()
+
+    def get_chain(self, chain_id: str) -> Optional[DecisionChain]:
+        """
+        Get a chain by ID, loading evicted chains from storage.
+
+        Args:
+            chain_id: The chain identifier
 
+        Returns:
+            DecisionChain or None
+        """
+        chain = self._chains.get(chain_id)
+        if chain is not None:
+            if chain_id in self._completed_at:
+                self._completed_at[chain_id] = time.monotonic()
+                self._completed_at.move_to_end(chain_id)
+            return chain
+
+        load_chain = getattr(self.storage, "load_chain", None)
+        if load_chain is None:
+            return None
+        chain = load_chain(chain_id)
+        if chain is not None:
+            self._store_chain(chain)
+            self._completed_at[chain_id] = time.monotonic()
+            self._evict()
         return chain
 
+    def _store_chain(self, chain: DecisionChain) -> None:
+        """Add a chain and its nodes to the hot set and indexes."""
+        self._chains[chain.chain_id] = chain
+        for node in chain.nodes:
+            self._nodes_by_id[node.node_id] = node
+        self._index.add(chain)
+
+    def _evict(self) -> None:
+        """Evict completed chains past the hot cache TTL or size bound."""
+        # Without storage the in-memory copy is the only one
+        if not self.storage:
+            return
+
+        now = time.monotonic()
+        excess = len(self._chains) - self.hot_cache_size
+        while self._completed_at:
+            chain_id, completed_at = next(iter(self._completed_at.items()))
+            if excess <= 0 and now - completed_at < self.hot_ttl_sec:
+                break
+            self._drop_chain(chain_id)
+            excess -= 1
+
+    def _drop_chain(self, chain_id: str) -> None:
+        """Remove a completed chain from memory and from the indexes."""
+        del self._completed_at[chain_id]
+        self._index.remove(self._chains.pop(chain_id))
+
+    def evict_before(self, day: date) -> int:
+        """
+        Evict all completed chains created before a UTC day.
+
+        Active chains stay in memory. Does nothing without storage.
+
+        Args:
+            day: First day to keep
+
+        Returns:
+            Number of chains evicted
+        """
+        if not self.storage:
+            return 0
+
+        evicted = 0
+        for chain_id in self._index.created_before(day):
+            if chain_id in self._completed_at:
+                self._drop_chain(chain_id)
+                evicted += 1
+        return evicted
+
     def _persist_chain(self, chain: DecisionChain):
-        """Persist chain to storage backend."""
-        # Implementation depends on storage backend
-        pass
+        """
+        Persist chain to storage backend.
+
+        Backends opt in by providing async save_chains() (batched in the
+        background when an event loop is running) or save_chain().
+        """
+        if self._writer is not None and _has_running_loop():
+            self._writer.submit(chain)
+            return
+
+        save_chain = getattr(self.storage, "save_chain", None)
+        if save_chain is not None:
+            save_chain(chain)
+            self._mark_completed(chain.chain_id)
 
     def query(self, query: ProvenanceQuery) -> List[DecisionChain]:
         """
@@ -407,54 +411,16 @@ class ProvenanceTracker:
         Returns:
             List of matching DecisionChains
         """
-        results = []
-
-        for chain in self._chains.values():
-            if self._matches_query(chain, query):
-                results.append(chain)
-
-        # Sort by created_at descending
-        results.sort(key=lambda c: c.created_at, reverse=True)
-
-        # Apply limit
-        return results[:query.max_results]
-
-    def _matches_query(
-        self, chain: DecisionChain, query: ProvenanceQuery
-    ) -> bool:
-        """Check if chain matches query criteria."""
-        # Time range
-        if query.start_time and chain.created_at < query.start_time:
-            return False
-        if query.end_time and chain.created_at > query.end_time:
-            return False
-
-        # Outcome filter
-        if query.outcome and chain.outcome != query.outcome:
-            return False
-
-        # Emergency filter
-        if not query.include_emergency:
-            for node in chain.nodes:
-                if node.decision_type in (
-                    DecisionType.KILL_SWITCH_ACTIVATED,
-                    DecisionType.PANIC_HEDGE_TRIGGERED,
-                ):
-                    return False
-
-        # Decision type filter
-        if query.decision_types:
-            chain_types = {n.decision_type for n in chain.nodes}
-            if not chain_types & query.decision_types:
-                return False
-
-        # Source filter
-        if query.sources:
-            chain_sources = {n.source for n in chain.nodes}
-            if not chain_sources & query.sources:
-                return False
-
-        return True
+        return run_query(self._index.candidates(query, self._chains), query)
+
+
+def _has_running_loop() -> bool:
+    """Check whether we are called from inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
 
 
 def query_decision_chain(
@@ -471,7 +437,7 @@ def query_decision_chain(
     Returns:
         DecisionChain or None
     """
-    return tracker._chains.get(chain_id)
+    return tracker.get_chain(chain_id)
 
 
 def get_trade_provenance(
@@ -511,44 +477,3 @@ def get_signal_provenance(
         DecisionChain showing signal's journey
     """
     return tracker._chains.get(tracker._active_chains.get(signal_id))
-
-
-def verify_decision_integrity(chain: DecisionChain) -> Dict[str, Any]:
-    """
-    Verify integrity of a decision chain.
-
-    Args:
-        chain: The DecisionChain to verify
-
-    Returns:
-        Verification results with details
-    """
-    results = {
-        "chain_id": chain.chain_id,
-        "verified": True,
-        "chain_hash_valid": True,
-        "nodes_verified": [],
-        "issues": [],
-    }
-
-    # Verify each node
-    for node in chain.nodes:
-        node_result = {
-            "node_id": node.node_id,
-            "valid": node.verify_integrity(),
-        }
-        results["nodes_verified"].append(node_result)
-
-        if not node_result["valid"]:
-            results["verified"] = False
-            results["issues"].append(
-                f"Node {node.node_id} failed integrity check"
-            )
-
-    # Verify chain hash
-    if not chain.verify_chain_integrity():
-        results["verified"] = False
-        results["chain_hash_valid"] = False
-        results["issues"].append("Chain hash verification failed")
-
-    return results
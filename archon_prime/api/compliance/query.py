@@ -0,0 +1,286 @@
+"""
+ARCHON PRIME - Provenance Queries
+
+Query parameters, the secondary indexes that narrow the chains a
+query inspects, and the filters applied to the remaining candidates:
+chain-level predicates compiled per query shape and node-level
+filters scanned over the chains' columns.
+"""
+
+import bisect
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+from archon_prime.api.compliance import _query_jit
+from archon_prime.api.compliance.chains import DecisionChain
+from archon_prime.api.compliance.columns import code_mask
+from archon_prime.api.compliance.decisions import (
+    DECISION_SOURCE_CODES,
+    DECISION_TYPE_CODES,
+    DecisionNode,
+    DecisionSource,
+    DecisionType,
+)
+
+_EMERGENCY_MASK = code_mask(
+    (
+        DECISION_TYPE_CODES[DecisionType.KILL_SWITCH_ACTIVATED],
+        DECISION_TYPE_CODES[DecisionType.PANIC_HEDGE_TRIGGERED],
+    ),
+    len(DecisionType),
+)
+
+
+@dataclass
+class ProvenanceQuery:
+    """Query parameters for provenance searches."""
+
+    # Time range
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+
+    # Filters
+    decision_types: Optional[Set[DecisionType]] = None
+    sources: Optional[Set[DecisionSource]] = None
+    outcome: Optional[str] = None
+
+    # Identifiers
+    trade_id: Optional[str] = None
+    signal_id: Optional[str] = None
+    profile_id: Optional[str] = None
+    user_id: Optional[str] = None
+
+    # Options
+    include_rejected: bool = True
+    include_emergency: bool = True
+    max_results: int = 100
+
+
+class ChainIndex:
+    """
+    Secondary indexes over the in-memory chains.
+
+    Maps decision types, sources and outcomes to the chains containing
+    them, and partitions chains by UTC creation day so time ranges
+    only visit the overlapping days.
+    """
+
+    def __init__(self):
+        self._by_type: Dict[DecisionType, Set[str]] = defaultdict(set)
+        self._by_source: Dict[DecisionSource, Set[str]] = defaultdict(set)
+        self._by_outcome: Dict[str, Set[str]] = defaultdict(set)
+
+        # Chains partitioned by UTC creation day, plus the sorted day keys
+        self._by_day: Dict[date, Dict[str, DecisionChain]] = {}
+        self._days: List[date] = []
+
+    def add(self, chain: DecisionChain) -> None:
+        """Index a chain and all of its nodes."""
+        for node in chain.nodes:
+            self.add_node(chain.chain_id, node)
+        self._by_outcome[chain.outcome].add(chain.chain_id)
+
+        day = _utc_day(chain.created_at)
+        bucket = self._by_day.get(day)
+        if bucket is None:
+            bucket = self._by_day[day] = {}
+            bisect.insort(self._days, day)
+        bucket[chain.chain_id] = chain
+
+    def add_node(self, chain_id: str, node: DecisionNode) -> None:
+        """Record a node's type and source for its chain."""
+        self._by_type[node.decision_type].add(chain_id)
+        self._by_source[node.source].add(chain_id)
+
+    def set_outcome(self, chain: DecisionChain, outcome: str) -> None:
+        """Move a chain to a new outcome (call before updating the chain)."""
+        self._by_outcome[chain.outcome].discard(chain.chain_id)
+        self._by_outcome[outcome].add(chain.chain_id)
+
+    def remove(self, chain: DecisionChain) -> None:
+        """Drop a chain from every index."""
+        chain_id = chain.chain_id
+        for node in chain.nodes:
+            self._by_type[node.decision_type].discard(chain_id)
+            self._by_source[node.source].discard(chain_id)
+        self._by_outcome[chain.outcome].discard(chain_id)
+
+        day = _utc_day(chain.created_at)
+        bucket = self._by_day[day]
+        del bucket[chain_id]
+        if not bucket:
+            del self._by_day[day]
+            del self._days[bisect.bisect_left(self._days, day)]
+
+    def created_before(self, day: date) -> List[str]:
+        """IDs of the chains created before a UTC day."""
+        return [
+            chain_id
+            for old_day in self._days[:bisect.bisect_left(self._days, day)]
+            for chain_id in self._by_day[old_day]
+        ]
+
+    def candidates(
+        self, query: "ProvenanceQuery", chains: Mapping[str, DecisionChain]
+    ) -> List[DecisionChain]:
+        """
+        Narrow the chains a query has to inspect.
+
+        Args:
+            query: Query parameters
+            chains: All indexed chains by ID
+
+        Returns:
+            Chains that may match; residual predicates still apply
+        """
+        candidate_sets: List[Set[str]] = []
+
+        if query.decision_types:
+            candidate_sets.append(set().union(
+                *(self._by_type.get(t, ()) for t in query.decision_types)
+            ))
+        if query.sources:
+            candidate_sets.append(set().union(
+                *(self._by_source.get(s, ()) for s in query.sources)
+            ))
+        if query.outcome:
+            candidate_sets.append(self._by_outcome.get(query.outcome, set()))
+
+        # Only the day buckets overlapping the time range are visited
+        if query.start_time or query.end_time:
+            lo = 0
+            hi = len(self._days)
+            if query.start_time:
+                lo = bisect.bisect_left(self._days, _utc_day(query.start_time))
+            if query.end_time:
+                hi = bisect.bisect_right(self._days, _utc_day(query.end_time))
+            candidate_sets.append({
+                chain_id
+                for day in self._days[lo:hi]
+                for chain_id in self._by_day[day]
+            })
+
+        if not candidate_sets:
+            return list(chains.values())
+
+        candidate_sets.sort(key=len)
+        chain_ids = candidate_sets[0].intersection(*candidate_sets[1:])
+        return [chains[chain_id] for chain_id in chain_ids]
+
+
+# Chain-level predicates as (query field, expression over chain c / query q)
+_CHAIN_PREDICATES: Tuple[Tuple[str, str], ...] = (
+    ("start_time", "c.created_at >= q.start_time"),
+    ("end_time", "c.created_at <= q.end_time"),
+    ("outcome", "c.outcome == q.outcome"),
+)
+
+ChainMatcher = Callable[[DecisionChain, ProvenanceQuery], bool]
+
+
+def _query_shape(query: ProvenanceQuery) -> Tuple[bool, ...]:
+    """Get which chain-level predicates a query uses."""
+    return tuple(bool(getattr(query, name)) for name, _ in _CHAIN_PREDICATES)
+
+
+@lru_cache(maxsize=64)
+def _compile_matcher(shape: Tuple[bool, ...]) -> ChainMatcher:
+    """
+    Compile a chain matcher containing only the active predicates.
+
+    Args:
+        shape: Flags from _query_shape()
+
+    Returns:
+        Function (chain, query) -> bool
+    """
+    terms = [
+        expr
+        for (_, expr), active in zip(_CHAIN_PREDICATES, shape, strict=True)
+        if active
+    ]
+    source = f"def matcher(c, q):\n    return {' and '.join(terms) or 'True'}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<provenance-matcher>", "exec"), namespace)
+    return namespace["matcher"]
+
+
+def _utc_day(ts: datetime) -> date:
+    """Get the UTC calendar day of a timestamp (naive means UTC)."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc)
+    return ts.date()
+
+
+def _node_filter_masks(
+    query: ProvenanceQuery,
+) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Build the code masks for the node-level filters of a query.
+
+    Returns:
+        (type_mask, source_mask, exclude_mask), or None if the query
+        has no node-level filters
+    """
+    if query.include_emergency and not query.decision_types and not query.sources:
+        return None
+
+    if query.decision_types:
+        type_mask = code_mask(
+            (DECISION_TYPE_CODES[t] for t in query.decision_types),
+            len(DecisionType),
+        )
+    else:
+        type_mask = np.ones(len(DecisionType), dtype=np.bool_)
+
+    if query.sources:
+        source_mask = code_mask(
+            (DECISION_SOURCE_CODES[s] for s in query.sources),
+            len(DecisionSource),
+        )
+    else:
+        source_mask = np.ones(len(DecisionSource), dtype=np.bool_)
+
+    if query.include_emergency:
+        exclude_mask = np.zeros(len(DecisionType), dtype=np.bool_)
+    else:
+        exclude_mask = _EMERGENCY_MASK
+
+    return type_mask, source_mask, exclude_mask
+
+
+def run_query(
+    candidates: List[DecisionChain], query: ProvenanceQuery
+) -> List[DecisionChain]:
+    """
+    Apply a query's residual filters, ordering and limit to candidates.
+
+    Args:
+        candidates: Chains from ChainIndex.candidates()
+        query: Query parameters
+
+    Returns:
+        Matching chains, newest first
+    """
+    # Chain-level predicates run through a matcher compiled per shape
+    shape = _query_shape(query)
+    if any(shape):
+        matcher = _compile_matcher(shape)
+        candidates = [c for c in candidates if matcher(c, query)]
+
+    # Node-level filters run as one scan over all candidates' columns
+    masks = _node_filter_masks(query)
+    if masks is not None and candidates:
+        matched = _query_jit.scan([c._columns for c in candidates], *masks)
+        candidates = [c for c, ok in zip(candidates, matched, strict=True) if ok]
+
+    # Sort by created_at descending
+    candidates.sort(key=lambda c: c.created_at, reverse=True)
+
+    # Apply limit
+    return candidates[:query.max_results]
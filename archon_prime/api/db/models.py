@@ -13,6 +13,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -154,12 +155,15 @@ class Position(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     profile_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("mt5_profiles.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("mt5_profiles.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
     # MT5 position data
     ticket: Mapped[int] = mapped_column(Integer, nullable=False)
-    symbol: Mapped[str] = mapped_column(String(20), nullable=False)
+    symbol: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
     direction: Mapped[int] = mapped_column(Integer, nullable=False)  # 1=long, -1=short
     volume: Mapped[float] = mapped_column(Numeric(10, 4), nullable=False)
     entry_price: Mapped[float] = mapped_column(Numeric(20, 8), nullable=False)
@@ -177,12 +181,14 @@ class Position(Base):
 
     # Metadata
     strategy: Mapped[Optional[str]] = mapped_column(String(100))
-    signal_id: Mapped[Optional[str]] = mapped_column(String(100))
+    signal_id: Mapped[Optional[str]] = mapped_column(String(100), index=True)
     magic_number: Mapped[Optional[int]] = mapped_column(Integer)
     comment: Mapped[Optional[str]] = mapped_column(String(255))
 
     # Status
-    status: Mapped[str] = mapped_column(String(20), default="open")  # open, closed, pending
+    status: Mapped[str] = mapped_column(
+        String(20), default="open", index=True
+    )  # open, closed, pending
     opened_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     closed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     close_price: Mapped[Optional[float]] = mapped_column(Numeric(20, 8))
@@ -213,7 +219,10 @@ class TradeHistory(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     profile_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("mt5_profiles.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("mt5_profiles.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
     ticket: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -231,11 +240,13 @@ class TradeHistory(Base):
     commission: Mapped[float] = mapped_column(Numeric(20, 4), default=0)
 
     strategy: Mapped[Optional[str]] = mapped_column(String(100))
-    signal_id: Mapped[Optional[str]] = mapped_column(String(100))
+    signal_id: Mapped[Optional[str]] = mapped_column(String(100), index=True)
     close_reason: Mapped[Optional[str]] = mapped_column(String(50))
 
     opened_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    closed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    closed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=utcnow
@@ -249,8 +260,8 @@ class SystemEvent(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
-    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    severity: Mapped[str] = mapped_column(String(20), default="info")
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    severity: Mapped[str] = mapped_column(String(20), default="info", index=True)
     source: Mapped[str] = mapped_column(String(100), default="system")
 
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -264,7 +275,7 @@ class SystemEvent(Base):
     details: Mapped[Optional[dict]] = mapped_column(JSONB)
 
     # Acknowledgement tracking
-    acknowledged: Mapped[bool] = mapped_column(Boolean, default=False)
+    acknowledged: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
     acknowledged_by: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id")
     )
@@ -273,3 +284,35 @@ class SystemEvent(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=utcnow
     )
+
+
+# One profile per login and server for each user
+Index(
+    "ix_mt5_profiles_user_login_server",
+    MT5Profile.user_id,
+    MT5Profile.mt5_login,
+    MT5Profile.broker_server,
+    unique=True,
+)
+
+# Composite indexes matching the hot per-profile listing queries
+Index(
+    "ix_positions_profile_opened",
+    Position.profile_id,
+    Position.opened_at.desc(),
+)
+Index(
+    "ix_positions_open",
+    Position.profile_id,
+    postgresql_where=Position.status == "open",
+)
+Index(
+    "ix_trade_history_profile_closed",
+    TradeHistory.profile_id,
+    TradeHistory.closed_at.desc(),
+)
+Index(
+    "ix_system_events_ack_created",
+    SystemEvent.acknowledged,
+    SystemEvent.created_at,
+)
@@ -4,8 +4,11 @@ Database Session Management
 Async SQLAlchemy session with PostgreSQL.
 """
 
+import asyncio
+import logging
 import ssl
 from typing import AsyncGenerator, Optional
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -16,38 +19,127 @@ from sqlalchemy.pool import NullPool
 
 from archon_prime.api.config import settings
 
-# Module-level engine (created lazily)
+logger = logging.getLogger(__name__)
+
+# Module-level engine (created lazily, per event loop)
 _engine: Optional[AsyncEngine] = None
+# Held (not just its id) so a new loop can never reuse a dead loop's id
+_engine_loop: Optional[asyncio.AbstractEventLoop] = None
 _async_session_maker: Optional[async_sessionmaker] = None
+_readonly_session_maker: Optional[async_sessionmaker] = None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Get the running event loop (None outside one)."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+# Shared SSL context for cloud PostgreSQL (built on first use, since
+# loading the CA bundle is slow and local databases never need it)
+_ssl_context: Optional[ssl.SSLContext] = None
+
+_CLOUD_HOSTS = ("neon.tech", "supabase")
 
 
-def _get_ssl_context():
-    """Create SSL context for cloud PostgreSQL."""
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    return ssl_context
+def _get_ssl_context() -> ssl.SSLContext:
+    """Get the SSL context for cloud PostgreSQL."""
+    global _ssl_context
+    if _ssl_context is None:
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        _ssl_context = ssl_context
+    return _ssl_context
+
+
+def _is_cloud_url(url: str) -> bool:
+    """Check whether a database URL points at cloud PostgreSQL."""
+    return any(host in url for host in _CLOUD_HOSTS)
+
+
+def _asyncpg_connect_args() -> dict:
+    """
+    Driver settings for asyncpg connections.
+
+    Prepared statements are cached per pooled connection, so they are
+    only worth keeping with the native pool; pgbouncer in transaction
+    mode cannot track them at all. PostgreSQL's JIT is disabled since
+    its compile cost outweighs the gain on short OLTP queries.
+    """
+    cache_size = 0 if settings.USE_EXTERNAL_POOL else settings.DB_STATEMENT_CACHE_SIZE
+    return {
+        "statement_cache_size": cache_size,
+        "prepared_statement_cache_size": cache_size,
+        "server_settings": {
+            "jit": "off",
+            "application_name": "archon_api",
+            "timezone": "UTC",
+        },
+    }
 
 
 def get_engine() -> AsyncEngine:
-    """Get or create the database engine."""
-    global _engine
+    """
+    Get or create the database engine.
+
+    Pooled asyncpg connections belong to the event loop that opened
+    them, so a new engine is created when called from a different
+    running loop (e.g. per-test loops or a restarted worker).
+
+    Creation has no await points, so concurrent requests on one loop
+    cannot both create an engine; no lock is needed.
+    """
+    global _engine, _engine_loop, _async_session_maker, _readonly_session_maker
+
+    loop = _running_loop()
+    if _engine is not None and loop is not None:
+        if _engine_loop is None:
+            # Created outside a loop; no connections are open yet
+            _engine_loop = loop
+        elif loop is not _engine_loop:
+            logger.info("Event loop changed, creating a new engine")
+            # Drop the old pool without I/O; its loop may be closed
+            _engine.sync_engine.dispose(close=False)
+            _engine = None
+            _async_session_maker = None
+            _readonly_session_maker = None
 
     if _engine is None:
+        _engine_loop = loop
         url = settings.DATABASE_URL
-        print(f"[DB] Creating engine with URL: {url[:60]}...")
+        logger.info(
+            "Creating engine for %s", make_url(url).render_as_string(hide_password=True)
+        )
 
         # Detect cloud PostgreSQL (Neon, Supabase)
-        connect_args = {}
-        if "neon.tech" in url or "supabase" in url:
-            print("[DB] Detected cloud PostgreSQL, enabling SSL context")
+        connect_args = _asyncpg_connect_args() if "+asyncpg" in url else {}
+        if _is_cloud_url(url):
+            logger.info("Detected cloud PostgreSQL, enabling SSL context")
             connect_args["ssl"] = _get_ssl_context()
 
+        if settings.USE_EXTERNAL_POOL:
+            # pgbouncer (transaction pooling) owns the connections
+            pool_args = {"poolclass": NullPool}
+        else:
+            pool_args = {
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_recycle": settings.DB_POOL_RECYCLE_SEC,
+                "pool_timeout": settings.DB_POOL_TIMEOUT_SEC,
+                "pool_pre_ping": settings.DB_POOL_PRE_PING,
+                "pool_use_lifo": True,
+            }
+
         _engine = create_async_engine(
             url,
             echo=settings.DATABASE_ECHO,
-            poolclass=NullPool,
+            # Skip the cartesian-product lint pass when compiling statements
+            enable_from_linting=False,
             connect_args=connect_args,
+            **pool_args,
         )
 
     return _engine
@@ -57,9 +149,10 @@ def get_session_maker() -> async_sessionmaker:
     """Get or create the session maker."""
     global _async_session_maker
 
+    engine = get_engine()
     if _async_session_maker is None:
         _async_session_maker = async_sessionmaker(
-            get_engine(),
+            engine,
             class_=AsyncSession,
             expire_on_commit=False,
             autocommit=False,
@@ -69,31 +162,80 @@ def get_session_maker() -> async_sessionmaker:
     return _async_session_maker
 
 
+def get_readonly_session_maker() -> async_sessionmaker:
+    """
+    Get or create the session maker for read-only sessions.
+
+    Sessions run in autocommit mode on the shared pool, so reads skip
+    the BEGIN and COMMIT round trips of a transaction.
+    """
+    global _readonly_session_maker
+
+    engine = get_engine()
+    if _readonly_session_maker is None:
+        _readonly_session_maker = async_sessionmaker(
+            engine.execution_options(isolation_level="AUTOCOMMIT"),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+
+    return _readonly_session_maker
+
+
 async def init_db() -> None:
     """Initialize database connection."""
     from archon_prime.api.db.models import Base
 
     engine = get_engine()
-    print("[DB] Initializing database connection...")
+    logger.info("Initializing database connection")
 
     async with engine.begin() as conn:
         # Create tables if they don't exist (dev only)
         # In production, use Alembic migrations
         if settings.DEBUG:
-            print("[DB] Creating tables (DEBUG mode)...")
+            logger.info("Creating tables (DEBUG mode)")
             await conn.run_sync(Base.metadata.create_all)
-            print("[DB] Tables created successfully")
+            logger.info("Tables created successfully")
+
+    if not settings.USE_EXTERNAL_POOL:
+        await _warm_pool(engine)
+
+
+async def _warm_pool(engine: AsyncEngine) -> None:
+    """
+    Fill the pool up to its size so first requests skip the handshake.
+
+    The connections are checked out concurrently, so each checkout
+    opens its own connection rather than reusing a returned one.
+    """
+    size = engine.pool.size()
+
+    async def _checkout() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(
+        *(_checkout() for _ in range(size)), return_exceptions=True
+    )
+    failed = sum(isinstance(r, Exception) for r in results)
+    if failed:
+        logger.warning("Pool warmup: %d/%d connections failed", failed, size)
+    else:
+        logger.info("Pool warmed with %d connections", size)
 
 
 async def close_db() -> None:
     """Close database connection."""
-    global _engine, _async_session_maker
+    global _engine, _engine_loop, _async_session_maker, _readonly_session_maker
 
     if _engine is not None:
         await _engine.dispose()
         _engine = None
+        _engine_loop = None
         _async_session_maker = None
-        print("[DB] Database connection closed")
+        _readonly_session_maker = None
+        logger.info("Database connection closed")
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -115,3 +257,15 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a read-only database session.
+
+    Nothing is committed: use it only for routes that never write,
+    and get_db for everything else.
+    """
+    session_maker = get_readonly_session_maker()
+    async with session_maker() as session:
+        yield session
@@ -4,34 +4,157 @@ FastAPI Dependencies
 Common dependencies for dependency injection.
 """
 
-from typing import Optional
+import hashlib
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional, Tuple, TypeVar, Union
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import select
+from sqlalchemy import bindparam, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from archon_prime.api.db.session import get_db
 from archon_prime.api.db.models import User, MT5Profile
 from archon_prime.api.auth.jwt import verify_token
+from archon_prime.api.config import settings
 
 
 security = HTTPBearer()
+security_optional = HTTPBearer(auto_error=False)
 
+# Verified access tokens: sha256(token)[:16] -> (expires_at, payload).
+# Per-process; a revoked or deactivated token stays usable for at most
+# JWT_CACHE_TTL_SEC. Failed verifications are never cached. Payloads
+# are shared across requests, so they are stored read-only.
+_token_cache: "OrderedDict[bytes, Tuple[float, Mapping[str, Any]]]" = OrderedDict()
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+
+def _cached_verify(
+    token: str, token_type: str = "access"
+) -> Optional[Mapping[str, Any]]:
     """
-    Get the current authenticated user from JWT token.
+    Verify a token, reusing recent successful verifications.
+
+    Args:
+        token: JWT token string
+        token_type: Expected token type
+
+    Returns:
+        Read-only decoded payload if valid, None otherwise. The parsed
+        subject is added under "_sub_uuid" so it is only parsed once
+        per token.
+    """
+    key = hashlib.sha256(f"{token_type}:{token}".encode()).digest()[:16]
+    now = time.time()
+
+    entry = _token_cache.get(key)
+    if entry is not None:
+        if entry[0] > now:
+            _token_cache.move_to_end(key)
+            return entry[1]
+        del _token_cache[key]
+
+    payload = verify_token(token, token_type)
+    if not payload:
+        return None
+    try:
+        payload["_sub_uuid"] = UUID(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    frozen = MappingProxyType(payload)
+    expires_at = min(payload["exp"], now + settings.JWT_CACHE_TTL_SEC)
+    _token_cache[key] = (expires_at, frozen)
+    if len(_token_cache) > settings.JWT_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return frozen
+
+
+# Hot-path statements, built once with bind parameters
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_PROFILE_BY_ID = select(MT5Profile).where(MT5Profile.id == bindparam("profile_id"))
+_USER_ACCESS_AND_PROFILE = (
+    select(User.id, User.is_active, User.is_admin, MT5Profile)
+    .outerjoin(MT5Profile, MT5Profile.id == bindparam("profile_id"))
+    .where(User.id == bindparam("user_id"))
+)
+
+# Active users by id: user_id -> (expires_at, detached User copy).
+# Routes that change a user call invalidate_user_cache(); other
+# processes see the change within USER_CACHE_TTL_SEC.
+_user_cache: "OrderedDict[UUID, Tuple[float, User]]" = OrderedDict()
+
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+
+def _cache_user(user: User) -> None:
+    """Store a detached column-only copy of a loaded user."""
+    copy = User(**{key: getattr(user, key) for key in _USER_COLUMNS})
+    make_transient_to_detached(copy)
+    _user_cache[user.id] = (time.time() + settings.USER_CACHE_TTL_SEC, copy)
+    _user_cache.move_to_end(user.id)
+    if len(_user_cache) > settings.USER_CACHE_SIZE:
+        _user_cache.popitem(last=False)
+
+
+def _cached_user(user_id: UUID) -> Optional[User]:
+    """Get the detached cached copy of a user, if still fresh."""
+    entry = _user_cache.get(user_id)
+    if entry is None:
+        return None
+    if entry[0] <= time.time():
+        del _user_cache[user_id]
+        return None
+    _user_cache.move_to_end(user_id)
+    return entry[1]
+
+
+async def _load_user(db: AsyncSession, user_id: UUID) -> Optional[User]:
+    """
+    Load a user, serving active users from the cache when possible.
+
+    Cached users are merged into the session without a SELECT, so
+    routes can still modify and commit the returned instance.
+    """
+    cached = _cached_user(user_id)
+    if cached is not None:
+        return await db.merge(cached, load=False)
+
+    result = await db.execute(_USER_BY_ID, {"user_id": user_id})
+    user = result.scalar_one_or_none()
+    if user is not None and user.is_active:
+        _cache_user(user)
+    return user
+
+
+class UserAccess(NamedTuple):
+    """The user columns needed for access checks."""
+
+    id: UUID
+    is_active: bool
+    is_admin: bool
+
+
+_U = TypeVar("_U", User, UserAccess)
+
+
+def invalidate_user_cache(user_id: UUID) -> None:
+    """Drop a user from this process's user cache after an update."""
+    _user_cache.pop(user_id, None)
+
+
+def _authenticated_user_id(credentials: HTTPAuthorizationCredentials) -> UUID:
+    """
+    Verify the bearer token and return its user id.
 
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is invalid or expired
     """
-    token = credentials.credentials
-    payload = verify_token(token, "access")
+    payload = _cached_verify(credentials.credentials, "access")
 
     if not payload:
         raise HTTPException(
@@ -40,22 +163,38 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id = UUID(payload["sub"])
+    return payload["_sub_uuid"]
 
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
 
+def _require_active(user: Optional[_U]) -> _U:
+    """
+    Reject missing or inactive users.
+
+    Raises:
+        HTTPException: If user not found or inactive
+    """
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
         )
-
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Get the current authenticated user from JWT token.
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user_id = _authenticated_user_id(credentials)
+    return _require_active(await _load_user(db, user_id))
+
+
 async def get_admin_user(
     user: User = Depends(get_current_user),
 ) -> User:
@@ -75,19 +214,37 @@ async def get_admin_user(
 
 async def get_profile_with_access(
     profile_id: UUID,
-    user: User = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> MT5Profile:
     """
     Get MT5 profile and verify user has access.
 
+    Authenticates on its own so the user and the profile are read in
+    a single query (just the profile when the user is cached).
+
     Raises:
-        HTTPException: If profile not found or access denied
+        HTTPException: If token is invalid, user inactive, profile not
+            found or access denied
     """
-    result = await db.execute(
-        select(MT5Profile).where(MT5Profile.id == profile_id)
-    )
-    profile = result.scalar_one_or_none()
+    user_id = _authenticated_user_id(credentials)
+    user: Optional[Union[User, UserAccess]] = _cached_user(user_id)
+
+    if user is not None:
+        result = await db.execute(_PROFILE_BY_ID, {"profile_id": profile_id})
+        profile = result.scalar_one_or_none()
+    else:
+        result = await db.execute(
+            _USER_ACCESS_AND_PROFILE, {"user_id": user_id, "profile_id": profile_id}
+        )
+        row = result.one_or_none()
+        if row is None:
+            profile = None
+        else:
+            user = UserAccess(row.id, row.is_active, row.is_admin)
+            profile = row.MT5Profile
+
+    user = _require_active(user)
 
     if not profile:
         raise HTTPException(
@@ -110,9 +267,7 @@ async def get_profile_with_access(
 
 
 async def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(
-        HTTPBearer(auto_error=False)
-    ),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_optional),
     db: AsyncSession = Depends(get_db),
 ) -> Optional[User]:
     """
@@ -124,14 +279,10 @@ async def get_optional_user(
         return None
 
     token = credentials.credentials
-    payload = verify_token(token, "access")
+    payload = _cached_verify(token, "access")
 
     if not payload:
         return None
 
-    user_id = UUID(payload["sub"])
-
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    return result.scalar_one_or_none()
+    user_id = payload["_sub_uuid"]
+    return await _load_user(db, user_id)
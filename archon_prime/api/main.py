@@ -4,35 +4,123 @@ ARCHON PRIME API - Main Application Entry Point
 FastAPI backend for the commercial multi-tenant trading platform.
 """
 
+import asyncio
+import inspect
+import logging
 from contextlib import asynccontextmanager
+from typing import Awaitable, Dict, List
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
 
+from archon_prime.api.admin.routes import router as admin_router
+from archon_prime.api.auth.routes import router as auth_router
 from archon_prime.api.config import settings
-from archon_prime.api.db.session import init_db, close_db
-from archon_prime.api.services.mt5_pool import init_mt5_pool, close_mt5_pool
-from archon_prime.api.services.background_tasks import init_background_workers, close_background_workers
-from archon_prime.api.websocket.manager import init_websocket_manager, close_websocket_manager
+from archon_prime.api.db.session import close_db, init_db
+from archon_prime.api.profiles.routes import router as profiles_router
+from archon_prime.api.services.background_tasks import (
+    close_background_workers,
+    init_background_workers,
+    warm_up_mt5_pool,
+)
+from archon_prime.api.services.mt5_pool import close_mt5_pool, init_mt5_pool
+from archon_prime.api.signals.routes import router as signals_router
+from archon_prime.api.trading.routes import router as trading_router
+from archon_prime.api.users.routes import router as users_router
+from archon_prime.api.websocket.manager import (
+    close_websocket_manager,
+    init_websocket_manager,
+)
+from archon_prime.api.websocket.routes import router as websocket_router
+
+logger = logging.getLogger(__name__)
+
+# Newer FastAPI serializes response models straight to JSON bytes with
+# Pydantic, but only while the default response class is left unset;
+# older releases go through json.dumps, where orjson is much faster.
+_PYDANTIC_JSON_RESPONSES = "dump_json" in inspect.signature(
+    serialize_response
+).parameters
+
+
+def configure_logging() -> None:
+    """Send archon_prime.* logs to stderr at LOG_LEVEL (uvicorn skips them)."""
+    logger = logging.getLogger("archon_prime")
+    logger.setLevel(settings.LOG_LEVEL.upper())
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter("%(levelname)s:     [%(name)s] %(message)s")
+        )
+        logger.addHandler(handler)
+
+
+async def _run_concurrently(
+    stage: str, steps: Dict[str, Awaitable[None]]
+) -> List[BaseException]:
+    """
+    Run independent lifecycle steps concurrently.
+
+    Args:
+        stage: "startup" or "shutdown", for log messages
+        steps: Step name -> coroutine
+
+    Returns:
+        Exceptions raised by failed steps (each is logged)
+    """
+    results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    errors = []
+    for name, result in zip(steps, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("%s of %s failed: %s", stage.capitalize(), name, result)
+            errors.append(result)
+    return errors
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    # Startup
-    await init_db()
-    await init_mt5_pool()
-    await init_websocket_manager()
+    # uvicorn runs on uvloop when it is installed (not on Windows)
+    loop = asyncio.get_running_loop()
+    logger.info("Event loop: %s.%s", type(loop).__module__, type(loop).__name__)
+    # Startup: background workers use the other three services
+    errors = await _run_concurrently(
+        "startup",
+        {
+            "database": init_db(),
+            "MT5 pool": init_mt5_pool(),
+            "WebSocket manager": init_websocket_manager(),
+        },
+    )
+    if errors:
+        raise errors[0]
+    # Open min_connections now so early signals skip the MT5 handshake
+    await warm_up_mt5_pool()
     await init_background_workers()
+    # Build the OpenAPI schema now so the first docs request doesn't pay for it
+    app.openapi()
     yield
-    # Shutdown
+    # Shutdown: stop workers before the services they use
     await close_background_workers()
-    await close_websocket_manager()
-    await close_mt5_pool()
-    await close_db()
+    await _run_concurrently(
+        "shutdown",
+        {
+            "WebSocket manager": close_websocket_manager(),
+            "MT5 pool": close_mt5_pool(),
+            "database": close_db(),
+        },
+    )
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    configure_logging()
+
+    response_options = (
+        {} if _PYDANTIC_JSON_RESPONSES else {"default_response_class": ORJSONResponse}
+    )
     app = FastAPI(
         title=settings.APP_NAME,
         version=settings.APP_VERSION,
@@ -40,6 +128,7 @@ def create_app() -> FastAPI:
         docs_url="/api/docs" if settings.DEBUG else None,
         redoc_url="/api/redoc" if settings.DEBUG else None,
         lifespan=lifespan,
+        **response_options,
     )
 
     # CORS middleware
@@ -52,14 +141,6 @@ def create_app() -> FastAPI:
     )
 
     # Include routers
-    from archon_prime.api.auth.routes import router as auth_router
-    from archon_prime.api.users.routes import router as users_router
-    from archon_prime.api.profiles.routes import router as profiles_router
-    from archon_prime.api.trading.routes import router as trading_router
-    from archon_prime.api.websocket.routes import router as websocket_router
-    from archon_prime.api.admin.routes import router as admin_router
-    from archon_prime.api.signals.routes import router as signals_router
-
     app.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
     app.include_router(users_router, prefix="/api/v1/users", tags=["Users"])
     app.include_router(profiles_router, prefix="/api/v1/profiles", tags=["MT5 Profiles"])
@@ -4,12 +4,13 @@ MT5 Profile Routes
 API endpoints for MT5 profile management.
 """
 
+import math
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from archon_prime.api.db.session import get_db
+from archon_prime.api.db.session import get_db, get_db_ro
 from archon_prime.api.db.models import User, MT5Profile
 from archon_prime.api.dependencies import get_current_user, get_profile_with_access
 from archon_prime.api.auth.schemas import MessageResponse
@@ -18,6 +19,7 @@ from archon_prime.api.profiles.schemas import (
     ProfileUpdateRequest,
     ProfileCredentialsUpdateRequest,
     ProfileResponse,
+    ProfileListItemResponse,
     ProfileListResponse,
     ConnectionStatusResponse,
     TradingStatusResponse,
@@ -29,6 +31,28 @@ from archon_prime.api.profiles.service import ProfileService
 router = APIRouter()
 
 
+def _etag(*stamps) -> str:
+    """Build a weak ETag from profile timestamps."""
+    return 'W/"' + "-".join(
+        f"{ts.timestamp():.6f}" if ts is not None else "0" for ts in stamps
+    ) + '"'
+
+
+def _not_modified(request: Request, response: Response, etag: str) -> bool:
+    """
+    Set the ETag header and check it against If-None-Match.
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    response.headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+
 @router.get(
     "",
     response_model=ProfileListResponse,
@@ -36,15 +60,26 @@ router = APIRouter()
 )
 async def list_profiles(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
 ) -> ProfileListResponse:
-    """Get all MT5 profiles for the current user."""
+    """
+    Get a page of MT5 profile summaries for the current user.
+
+    Use GET /{profile_id} for settings and full account details.
+    """
     service = ProfileService(db)
-    profiles = await service.get_user_profiles(user.id)
+    rows, total = await service.get_user_profiles(user.id, page, page_size)
+
+    total_pages = math.ceil(total / page_size) if total > 0 else 1
 
     return ProfileListResponse(
-        profiles=[ProfileResponse.from_model(p) for p in profiles],
-        total=len(profiles),
+        profiles=[ProfileListItemResponse.from_row(r) for r in rows],
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
     )
 
 
@@ -86,9 +121,21 @@ async def create_profile(
     summary="Get profile",
 )
 async def get_profile(
+    request: Request,
+    response: Response,
     profile: MT5Profile = Depends(get_profile_with_access),
 ) -> ProfileResponse:
-    """Get a specific MT5 profile."""
+    """
+    Get a specific MT5 profile.
+
+    Returns 304 Not Modified when If-None-Match carries the current ETag.
+    """
+    etag = _etag(profile.updated_at, profile.last_sync_at)
+    if _not_modified(request, response, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
     return ProfileResponse.from_model(profile)
 
 
@@ -240,12 +287,15 @@ async def disconnect_profile(
     summary="Get account info",
 )
 async def get_account_info(
+    request: Request,
+    response: Response,
     profile: MT5Profile = Depends(get_profile_with_access),
 ) -> AccountInfoResponse:
     """
     Get MT5 account information.
 
-    Returns balance, equity, margin, and other account details.
+    Returns balance, equity, margin, and other account details, or
+    304 Not Modified when If-None-Match carries the current ETag.
     """
     if not profile.is_connected:
         raise HTTPException(
@@ -253,6 +303,12 @@ async def get_account_info(
             detail="Profile is not connected",
         )
 
+    etag = _etag(profile.last_sync_at)
+    if _not_modified(request, response, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
     return AccountInfoResponse(
         balance=profile.balance,
         equity=profile.equity,
@@ -304,7 +360,7 @@ async def stop_trading(
 ) -> TradingStatusResponse:
     """Stop trading on this profile."""
     service = ProfileService(db)
-    await service.set_trading_enabled(profile, False)
+    await service.touch_trading_enabled(profile.id, False)
 
     return TradingStatusResponse(
         profile_id=profile.id,
@@ -330,7 +386,7 @@ async def kill_switch(
     service = ProfileService(db)
 
     # Disable trading immediately
-    await service.set_trading_enabled(profile, False)
+    await service.touch_trading_enabled(profile.id, False)
 
     # TODO: Close all open positions via MT5 connection pool
 
@@ -78,12 +78,26 @@ class ProfileResponse(BaseModel):
 
     @classmethod
     def from_model(cls, profile) -> "ProfileResponse":
-        """Create response from ORM model."""
-        return cls(
+        """
+        Create response from ORM model.
+
+        Skips validation (model_construct): the values come from typed
+        ORM columns, so only mt5_login needs converting.
+        """
+        account = AccountInfoResponse.model_construct(
+            balance=profile.balance,
+            equity=profile.equity,
+            margin=profile.margin,
+            free_margin=profile.free_margin,
+            margin_level=profile.margin_level,
+            leverage=profile.leverage,
+            currency=profile.currency,
+        )
+        return cls.model_construct(
             id=profile.id,
             user_id=profile.user_id,
             name=profile.name,
-            mt5_login=profile.mt5_login,
+            mt5_login=str(profile.mt5_login),
             mt5_server=profile.mt5_server,
             broker_name=profile.broker_name,
             account_type=profile.account_type,
@@ -91,15 +105,7 @@ class ProfileResponse(BaseModel):
             is_trading_enabled=profile.is_trading_enabled,
             last_connected_at=profile.last_connected_at,
             last_sync_at=profile.last_sync_at,
-            account=AccountInfoResponse(
-                balance=profile.balance,
-                equity=profile.equity,
-                margin=profile.margin,
-                free_margin=profile.free_margin,
-                margin_level=profile.margin_level,
-                leverage=profile.leverage,
-                currency=profile.currency,
-            ),
+            account=account,
             risk_settings=profile.risk_settings or {},
             trading_settings=profile.trading_settings or {},
             created_at=profile.created_at,
@@ -107,11 +113,49 @@ class ProfileResponse(BaseModel):
         )
 
 
+class ProfileListItemResponse(BaseModel):
+    """MT5 profile summary for list views."""
+
+    id: UUID
+    name: str
+    mt5_login: str
+    mt5_server: str
+    broker_name: Optional[str] = None
+    account_type: Optional[str] = None
+    is_connected: bool
+    is_trading_enabled: bool
+    balance: Optional[Decimal] = None
+    equity: Optional[Decimal] = None
+    last_connected_at: Optional[datetime] = None
+    created_at: datetime
+
+    @classmethod
+    def from_row(cls, row) -> "ProfileListItemResponse":
+        """Create response from a PROFILE_LIST_COLUMNS row (unvalidated)."""
+        return cls.model_construct(
+            id=row.id,
+            name=row.name,
+            mt5_login=str(row.mt5_login),
+            mt5_server=row.broker_server,
+            broker_name=row.broker_name,
+            account_type=row.account_type,
+            is_connected=row.connection_status == "connected",
+            is_trading_enabled=row.is_trading_enabled,
+            balance=row.balance,
+            equity=row.equity,
+            last_connected_at=row.last_connected_at,
+            created_at=row.created_at,
+        )
+
+
 class ProfileListResponse(BaseModel):
-    """List of profiles response."""
+    """Paginated list of profile summaries."""
 
-    profiles: list[ProfileResponse]
+    profiles: list[ProfileListItemResponse]
     total: int
+    page: int
+    page_size: int
+    total_pages: int
 
 
 class ConnectionStatusResponse(BaseModel):
@@ -4,11 +4,12 @@ MT5 Profile Service
 Business logic for MT5 profile management.
 """
 
-from datetime import datetime, timezone
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Mapping, Optional, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import Row, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from archon_prime.api.db.models import User, MT5Profile
@@ -20,13 +21,35 @@ from archon_prime.api.profiles.schemas import (
 )
 
 
-# Subscription tier limits
-TIER_LIMITS = {
-    "free": {"max_profiles": 1, "max_positions": 1},
-    "starter": {"max_profiles": 2, "max_positions": 3},
-    "pro": {"max_profiles": 5, "max_positions": 5},
-    "enterprise": {"max_profiles": 20, "max_positions": 10},
-}
+# Columns rendered by the profile list (no settings blobs or credentials)
+PROFILE_LIST_COLUMNS = (
+    MT5Profile.id,
+    MT5Profile.name,
+    MT5Profile.mt5_login,
+    MT5Profile.broker_server,
+    MT5Profile.broker_name,
+    MT5Profile.account_type,
+    MT5Profile.connection_status,
+    MT5Profile.is_trading_enabled,
+    MT5Profile.balance,
+    MT5Profile.equity,
+    MT5Profile.last_connected_at,
+    MT5Profile.created_at,
+)
+
+# Subscription tier limits (unknown tiers get the free limits)
+TIER_MAX_PROFILES: Mapping[str, int] = MappingProxyType(
+    {"free": 1, "starter": 2, "pro": 5, "enterprise": 20}
+)
+TIER_MAX_POSITIONS: Mapping[str, int] = MappingProxyType(
+    {"free": 1, "starter": 3, "pro": 5, "enterprise": 10}
+)
+_DEFAULT_MAX_PROFILES = TIER_MAX_PROFILES["free"]
+
+
+def _connection_status(connected: bool) -> str:
+    """connection_status value for a connected flag."""
+    return "connected" if connected else "disconnected"
 
 
 class ProfileService:
@@ -37,14 +60,68 @@ class ProfileService:
         self.db = db
         self.encryption = get_encryption_service()
 
-    async def get_user_profiles(self, user_id: UUID) -> List[MT5Profile]:
-        """Get all profiles for a user."""
+    async def _update(self, profile: MT5Profile, **values) -> MT5Profile:
+        """
+        Write changed columns and commit, reading the row back via RETURNING.
+
+        The returned instance is the session's copy of the profile,
+        repopulated from the RETURNING row, so no refresh() is needed.
+        """
         result = await self.db.execute(
-            select(MT5Profile)
+            update(MT5Profile)
+            .where(MT5Profile.id == profile.id)
+            .values(**values)
+            .returning(MT5Profile)
+            .execution_options(populate_existing=True)
+        )
+        profile = result.scalar_one()
+        await self.db.commit()
+        return profile
+
+    async def _touch(self, profile_id: UUID, **values) -> None:
+        """
+        Write columns with a bare UPDATE and commit, without loading the row.
+
+        For status writes whose caller does not need the profile back.
+        """
+        await self.db.execute(
+            update(MT5Profile)
+            .where(MT5Profile.id == profile_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
+    async def get_user_profiles(
+        self,
+        user_id: UUID,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> Tuple[List[Row], int]:
+        """
+        Get a page of profile summaries for a user.
+
+        Only PROFILE_LIST_COLUMNS are selected. The total is counted
+        separately only when the page is full (or past the end).
+
+        Returns:
+            Tuple of (summary rows, total profile count)
+        """
+        offset = (page - 1) * page_size
+        result = await self.db.execute(
+            select(*PROFILE_LIST_COLUMNS)
             .where(MT5Profile.user_id == user_id)
             .order_by(MT5Profile.created_at.desc())
+            .limit(page_size)
+            .offset(offset)
         )
-        return list(result.scalars().all())
+        rows = list(result.all())
+
+        if len(rows) < page_size and (rows or offset == 0):
+            total = offset + len(rows)
+        else:
+            total = await self.count_user_profiles(user_id)
+        return rows, total
 
     async def get_profile_by_id(self, profile_id: UUID) -> Optional[MT5Profile]:
         """Get a profile by ID."""
@@ -53,6 +130,16 @@ class ProfileService:
         )
         return result.scalar_one_or_none()
 
+    async def get_warm_up_profiles(self, limit: int) -> List[MT5Profile]:
+        """Get trading-enabled profiles, most recently connected first."""
+        result = await self.db.execute(
+            select(MT5Profile)
+            .where(MT5Profile.is_active, MT5Profile.is_trading_enabled)
+            .order_by(MT5Profile.last_connected_at.desc().nulls_last())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
     async def count_user_profiles(self, user_id: UUID) -> int:
         """Count profiles for a user."""
         result = await self.db.execute(
@@ -60,61 +147,48 @@ class ProfileService:
         )
         return result.scalar() or 0
 
-    async def can_create_profile(self, user: User) -> tuple[bool, str]:
-        """Check if user can create a new profile based on subscription."""
-        tier = user.subscription_tier
-        limits = TIER_LIMITS.get(tier, TIER_LIMITS["free"])
-        max_profiles = limits["max_profiles"]
-
-        current_count = await self.count_user_profiles(user.id)
-
-        if current_count >= max_profiles:
-            return False, f"Profile limit reached ({max_profiles}) for {tier} tier"
-
-        return True, ""
-
     async def create_profile(
         self, user: User, data: ProfileCreateRequest
     ) -> tuple[Optional[MT5Profile], str]:
         """
         Create a new MT5 profile.
 
+        Duplicate logins are rejected by the unique index on
+        (user_id, mt5_login, mt5_server), not by a pre-check query.
+
         Returns:
             Tuple of (profile, error_message)
         """
-        # Check limits
-        can_create, error = await self.can_create_profile(user)
-        if not can_create:
-            return None, error
-
-        # Check for duplicate login
-        existing = await self.db.execute(
-            select(MT5Profile).where(
-                MT5Profile.user_id == user.id,
-                MT5Profile.mt5_login == data.mt5_login,
-                MT5Profile.mt5_server == data.mt5_server,
-            )
-        )
-        if existing.scalar_one_or_none():
-            return None, "Profile with this login and server already exists"
+        tier = user.subscription_tier
+        max_profiles = TIER_MAX_PROFILES.get(tier, _DEFAULT_MAX_PROFILES)
+
+        current_count = await self.count_user_profiles(user.id)
+        if current_count >= max_profiles:
+            return None, f"Profile limit reached ({max_profiles}) for {tier} tier"
 
         # Encrypt password
         encrypted_password = self.encryption.encrypt(data.mt5_password)
 
-        # Create profile
-        profile = MT5Profile(
-            user_id=user.id,
-            name=data.name,
-            mt5_login=data.mt5_login,
-            mt5_password_encrypted=encrypted_password,
-            mt5_server=data.mt5_server,
-            broker_name=data.broker_name,
-            account_type=data.account_type,
-        )
-
-        self.db.add(profile)
-        await self.db.commit()
-        await self.db.refresh(profile)
+        # Create profile, reading defaults back via RETURNING
+        try:
+            result = await self.db.execute(
+                insert(MT5Profile)
+                .values(
+                    user_id=user.id,
+                    name=data.name,
+                    mt5_login=data.mt5_login,
+                    mt5_password_encrypted=encrypted_password,
+                    broker_server=data.mt5_server,
+                    broker_name=data.broker_name,
+                    account_type=data.account_type,
+                )
+                .returning(MT5Profile)
+            )
+            profile = result.scalar_one()
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            return None, "Profile with this login and server already exists"
 
         return profile, ""
 
@@ -122,20 +196,18 @@ class ProfileService:
         self, profile: MT5Profile, data: ProfileUpdateRequest
     ) -> MT5Profile:
         """Update profile settings."""
+        values = {}
         if data.name is not None:
-            profile.name = data.name
+            values["name"] = data.name
         if data.broker_name is not None:
-            profile.broker_name = data.broker_name
+            values["broker_name"] = data.broker_name
         if data.risk_settings is not None:
-            profile.risk_settings = data.risk_settings
+            values["risk_settings"] = data.risk_settings
         if data.trading_settings is not None:
-            profile.trading_settings = data.trading_settings
+            values["strategy_settings"] = data.trading_settings
 
-        profile.updated_at = datetime.now(timezone.utc)
-        await self.db.commit()
-        await self.db.refresh(profile)
-
-        return profile
+        values["updated_at"] = func.now()
+        return await self._update(profile, **values)
 
     async def update_credentials(
         self, profile: MT5Profile, data: ProfileCredentialsUpdateRequest
@@ -144,18 +216,18 @@ class ProfileService:
         if profile.is_connected:
             raise ValueError("Cannot update credentials while connected")
 
+        values = {}
         if data.mt5_login is not None:
-            profile.mt5_login = data.mt5_login
+            values["mt5_login"] = data.mt5_login
         if data.mt5_password is not None:
-            profile.mt5_password_encrypted = self.encryption.encrypt(data.mt5_password)
+            values["mt5_password_encrypted"] = self.encryption.encrypt(
+                data.mt5_password
+            )
         if data.mt5_server is not None:
-            profile.mt5_server = data.mt5_server
+            values["broker_server"] = data.mt5_server
 
-        profile.updated_at = datetime.now(timezone.utc)
-        await self.db.commit()
-        await self.db.refresh(profile)
-
-        return profile
+        values["updated_at"] = func.now()
+        return await self._update(profile, **values)
 
     async def delete_profile(self, profile: MT5Profile) -> bool:
         """Delete a profile (must be disconnected first)."""
@@ -170,14 +242,14 @@ class ProfileService:
         self, profile: MT5Profile, connected: bool
     ) -> MT5Profile:
         """Update connection status."""
-        profile.is_connected = connected
+        values = {
+            "connection_status": _connection_status(connected),
+            "updated_at": func.now(),
+        }
         if connected:
-            profile.last_connected_at = datetime.now(timezone.utc)
-        profile.updated_at = datetime.now(timezone.utc)
+            values["last_connected_at"] = func.now()
 
-        await self.db.commit()
-        await self.db.refresh(profile)
-        return profile
+        return await self._update(profile, **values)
 
     async def set_trading_enabled(
         self, profile: MT5Profile, enabled: bool
@@ -186,37 +258,63 @@ class ProfileService:
         if enabled and not profile.is_connected:
             raise ValueError("Cannot enable trading on disconnected profile")
 
-        profile.is_trading_enabled = enabled
-        profile.updated_at = datetime.now(timezone.utc)
-
-        await self.db.commit()
-        await self.db.refresh(profile)
-        return profile
+        return await self._update(
+            profile,
+            is_trading_enabled=enabled,
+            updated_at=func.now(),
+        )
 
     async def update_account_info(
         self,
         profile: MT5Profile,
         balance: float,
         equity: float,
-        margin: float,
-        free_margin: float,
-        margin_level: float,
-        leverage: int,
-        currency: str,
     ) -> MT5Profile:
-        """Update account information from MT5."""
-        profile.balance = balance
-        profile.equity = equity
-        profile.margin = margin
-        profile.free_margin = free_margin
-        profile.margin_level = margin_level
-        profile.leverage = leverage
-        profile.currency = currency
-        profile.last_sync_at = datetime.now(timezone.utc)
+        """Update the stored account balances from MT5."""
+        return await self._update(
+            profile,
+            balance=balance,
+            equity=equity,
+            last_sync_at=func.now(),
+        )
 
-        await self.db.commit()
-        await self.db.refresh(profile)
-        return profile
+    async def touch_connected(self, profile_id: UUID, connected: bool) -> None:
+        """Update connection status without reading the profile back."""
+        values = {
+            "connection_status": _connection_status(connected),
+            "updated_at": func.now(),
+        }
+        if connected:
+            values["last_connected_at"] = func.now()
+
+        await self._touch(profile_id, **values)
+
+    async def touch_trading_enabled(self, profile_id: UUID, enabled: bool) -> None:
+        """
+        Set the trading flag without reading the profile back.
+
+        Unlike set_trading_enabled(), the connection check is the
+        caller's responsibility.
+        """
+        await self._touch(
+            profile_id,
+            is_trading_enabled=enabled,
+            updated_at=func.now(),
+        )
+
+    async def touch_account_info(
+        self,
+        profile_id: UUID,
+        balance: float,
+        equity: float,
+    ) -> None:
+        """Persist the account balances from MT5 in a single UPDATE."""
+        await self._touch(
+            profile_id,
+            balance=balance,
+            equity=equity,
+            last_sync_at=func.now(),
+        )
 
     def get_decrypted_password(self, profile: MT5Profile) -> str:
         """Get decrypted MT5 password for connection."""
@@ -1,5 +1,9 @@
 """Shared services for ARCHON PRIME API."""
 
+from archon_prime.api.services.batch import (
+    batch_fetch_positions,
+    batch_update_account_info,
+)
 from archon_prime.api.services.encryption import EncryptionService, get_encryption_service
 from archon_prime.api.services.mt5_pool import (
     MT5ConnectionPool,
@@ -11,6 +15,8 @@ from archon_prime.api.services.mt5_pool import (
 )
 
 __all__ = [
+    "batch_fetch_positions",
+    "batch_update_account_info",
     "EncryptionService",
     "get_encryption_service",
     "MT5ConnectionPool",
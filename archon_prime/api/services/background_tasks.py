@@ -13,15 +13,42 @@ Responsibilities:
 These workers are boring, relentless, and invisible.
 """
 
-import asyncio
 import logging
+import time
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
 from uuid import UUID
 
+from archon_prime.api.db.session import get_readonly_session_maker, get_session_maker
+from archon_prime.api.services.batch import (
+    batch_fetch_positions,
+    batch_update_account_info,
+)
+from archon_prime.api.profiles.service import ProfileService
+from archon_prime.api.services.connection_health import ConnectionHealthWorker
+from archon_prime.api.services.mt5_pool import MT5ConnectionPool, get_mt5_pool
+from archon_prime.api.services.worker_base import (
+    WorkerScheduler,
+    WorkerStats,
+    for_each_profile,
+)
+from archon_prime.api.websocket.handlers import EventBroadcaster, get_broadcaster
+
+if TYPE_CHECKING:
+    from archon_prime.api.db.models import Position
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,7 +61,7 @@ class ReconciliationResult(str, Enum):
     STALE_DATA = "stale_data"          # Local data is outdated
 
 
-@dataclass
+@dataclass(slots=True)
 class DriftRecord:
     """Record of detected drift."""
     profile_id: UUID
@@ -47,7 +74,7 @@ class DriftRecord:
     corrected_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReconciliationReport:
     """Report from a reconciliation run."""
     profile_id: UUID
@@ -61,17 +88,6 @@ class ReconciliationReport:
     duration_ms: int = 0
 
 
-@dataclass
-class WorkerStats:
-    """Statistics for a background worker."""
-    name: str
-    started_at: datetime
-    last_run_at: Optional[datetime] = None
-    run_count: int = 0
-    error_count: int = 0
-    last_error: Optional[str] = None
-
-
 class PositionReconciliationWorker:
     """
     Reconciles local position state against MT5.
@@ -79,92 +95,90 @@ class PositionReconciliationWorker:
     Detects and corrects drift between local database and broker.
     """
 
+    # Drift records kept per profile; older ones are evicted
+    MAX_DRIFT_HISTORY_PER_PROFILE = 1000
+
     def __init__(
         self,
         interval_seconds: int = 30,
         max_drift_age_seconds: int = 60,
+        pool_getter: Callable[[], MT5ConnectionPool] = get_mt5_pool,
     ):
         self.interval = interval_seconds
         self.max_drift_age = max_drift_age_seconds
-        self._running = False
-        self._task: Optional[asyncio.Task] = None
+        self._get_pool = pool_getter
         self._stats = WorkerStats(
             name="position_reconciliation",
             started_at=datetime.now(timezone.utc),
         )
 
         # Track recent drifts
-        self._drift_history: Dict[UUID, List[DriftRecord]] = {}
-
-    async def start(self) -> None:
-        """Start the reconciliation worker."""
-        if self._running:
-            return
-
-        self._running = True
-        self._stats.started_at = datetime.now(timezone.utc)
-        self._task = asyncio.create_task(self._run_loop())
-        logger.info("Position reconciliation worker started")
+        self._drift_history: Dict[UUID, Deque[DriftRecord]] = defaultdict(
+            lambda: deque(maxlen=self.MAX_DRIFT_HISTORY_PER_PROFILE)
+        )
 
-    async def stop(self) -> None:
-        """Stop the reconciliation worker."""
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-        logger.info("Position reconciliation worker stopped")
-
-    async def _run_loop(self) -> None:
-        """Main worker loop."""
-        while self._running:
-            try:
-                await asyncio.sleep(self.interval)
-                await self._reconcile_all()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Reconciliation error: {e}")
-                self._stats.error_count += 1
-                self._stats.last_error = str(e)
+    async def run_once(self) -> None:
+        """Run one pass, recording any error in the worker stats."""
+        try:
+            await self._reconcile_all()
+        except Exception as e:
+            logger.error(f"Reconciliation error: {e}")
+            self._stats.error_count += 1
+            self._stats.last_error = str(e)
 
     async def _reconcile_all(self) -> None:
         """Reconcile all connected profiles."""
-        from archon_prime.api.services.mt5_pool import get_mt5_pool
-
-        pool = get_mt5_pool()
-        connections = pool.get_all_connections()
-
-        for profile_id, connection in connections.items():
-            if connection.connected:
-                try:
-                    await self._reconcile_profile(profile_id)
-                except Exception as e:
-                    logger.error(f"Reconciliation failed for {profile_id}: {e}")
+        pool = self._get_pool()
+        connections = pool.snapshot()
+        profile_ids = [
+            profile_id
+            for profile_id, connection in connections.items()
+            if connection.connected
+        ]
+
+        if profile_ids:
+            # One query for every profile's local positions
+            async with get_readonly_session_maker()() as session:
+                local_positions = await batch_fetch_positions(session, profile_ids)
+
+            await for_each_profile(
+                profile_ids,
+                lambda profile_id: self._reconcile_profile(
+                    profile_id, local_positions[profile_id]
+                ),
+                "Reconciliation",
+            )
 
         self._stats.run_count += 1
         self._stats.last_run_at = datetime.now(timezone.utc)
 
-    async def _reconcile_profile(self, profile_id: UUID) -> ReconciliationReport:
-        """Reconcile a single profile."""
-        import time
+    async def _reconcile_profile(
+        self,
+        profile_id: UUID,
+        local_positions: List["Position"],
+    ) -> ReconciliationReport:
+        """
+        Reconcile a single profile.
+
+        Args:
+            profile_id: Profile to reconcile
+            local_positions: The profile's open positions from the local
+                database (batch-loaded by _reconcile_all)
+        """
         start = time.monotonic()
 
         report = ReconciliationReport(
             profile_id=profile_id,
             timestamp=datetime.now(timezone.utc),
-            positions_checked=0,
+            positions_checked=len(local_positions),
             matched=0,
         )
 
         # TODO: Actual reconciliation logic
         # 1. Get positions from MT5 via connection pool
-        # 2. Get positions from local database
-        # 3. Compare and detect drift
-        # 4. Correct drift or log for manual review
-        # 5. Handle missing positions
+        # 2. Compare against local_positions and detect drift
+        # 3. Correct drift or log for manual review
+        # 4. Handle missing positions
 
         # Placeholder - in production this would:
         # - Query MT5 for current positions
@@ -172,6 +186,9 @@ class PositionReconciliationWorker:
         # - Update stale data
         # - Create alerts for discrepancies
 
+        for drift in report.drifts:
+            self._drift_history[profile_id].append(drift)
+
         report.duration_ms = int((time.monotonic() - start) * 1000)
         return report
 
@@ -180,8 +197,8 @@ class PositionReconciliationWorker:
         return self._stats
 
     def get_drift_history(self, profile_id: UUID) -> List[DriftRecord]:
-        """Get drift history for a profile."""
-        return self._drift_history.get(profile_id, [])
+        """Get drift history for a profile, oldest first."""
+        return list(self._drift_history.get(profile_id, ()))
 
 
 class AccountSyncWorker:
@@ -191,158 +208,65 @@ class AccountSyncWorker:
     Updates balance, equity, margin for connected profiles.
     """
 
-    def __init__(self, interval_seconds: int = 10):
-        self.interval = interval_seconds
-        self._running = False
-        self._task: Optional[asyncio.Task] = None
-        self._stats = WorkerStats(
-            name="account_sync",
-            started_at=datetime.now(timezone.utc),
-        )
-
-    async def start(self) -> None:
-        """Start the account sync worker."""
-        if self._running:
-            return
-
-        self._running = True
-        self._stats.started_at = datetime.now(timezone.utc)
-        self._task = asyncio.create_task(self._run_loop())
-        logger.info("Account sync worker started")
-
-    async def stop(self) -> None:
-        """Stop the account sync worker."""
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-        logger.info("Account sync worker stopped")
-
-    async def _run_loop(self) -> None:
-        """Main worker loop."""
-        while self._running:
-            try:
-                await asyncio.sleep(self.interval)
-                await self._sync_all()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Account sync error: {e}")
-                self._stats.error_count += 1
-                self._stats.last_error = str(e)
-
-    async def _sync_all(self) -> None:
-        """Sync all connected accounts."""
-        from archon_prime.api.services.mt5_pool import get_mt5_pool
-        from archon_prime.api.websocket.handlers import get_broadcaster
-
-        pool = get_mt5_pool()
-        broadcaster = get_broadcaster()
-        connections = pool.get_all_connections()
-
-        for profile_id, connection in connections.items():
-            if connection.connected:
-                try:
-                    # Broadcast account update via WebSocket
-                    await broadcaster.account_update(
-                        profile_id=profile_id,
-                        balance=connection.balance,
-                        equity=connection.equity,
-                        margin=connection.margin,
-                        free_margin=connection.free_margin,
-                        profit=connection.equity - connection.balance,
-                        margin_level=connection.margin_level,
-                    )
-                except Exception as e:
-                    logger.error(f"Account sync failed for {profile_id}: {e}")
-
-        self._stats.run_count += 1
-        self._stats.last_run_at = datetime.now(timezone.utc)
-
-    def get_stats(self) -> WorkerStats:
-        """Get worker statistics."""
-        return self._stats
-
-
-class ConnectionHealthWorker:
-    """
-    Monitors connection health and handles recovery.
-
-    Detects disconnections and attempts reconnection.
-    """
-
     def __init__(
         self,
-        interval_seconds: int = 15,
-        max_reconnect_attempts: int = 5,
+        interval_seconds: int = 10,
+        pool_getter: Callable[[], MT5ConnectionPool] = get_mt5_pool,
+        broadcaster_getter: Callable[[], EventBroadcaster] = get_broadcaster,
     ):
         self.interval = interval_seconds
-        self.max_reconnect_attempts = max_reconnect_attempts
-        self._running = False
-        self._task: Optional[asyncio.Task] = None
+        self._get_pool = pool_getter
+        self._get_broadcaster = broadcaster_getter
         self._stats = WorkerStats(
-            name="connection_health",
+            name="account_sync",
             started_at=datetime.now(timezone.utc),
         )
 
-        # Track reconnection attempts
-        self._reconnect_attempts: Dict[UUID, int] = {}
+    async def run_once(self) -> None:
+        """Run one pass, recording any error in the worker stats."""
+        try:
+            await self._sync_all()
+        except Exception as e:
+            logger.error(f"Account sync error: {e}")
+            self._stats.error_count += 1
+            self._stats.last_error = str(e)
 
-    async def start(self) -> None:
-        """Start the connection health worker."""
-        if self._running:
-            return
-
-        self._running = True
-        self._stats.started_at = datetime.now(timezone.utc)
-        self._task = asyncio.create_task(self._run_loop())
-        logger.info("Connection health worker started")
+    async def _sync_all(self) -> None:
+        """Sync all connected accounts."""
+        pool = self._get_pool()
+        broadcaster = self._get_broadcaster()
+        connections = {
+            profile_id: connection
+            for profile_id, connection in pool.snapshot().items()
+            if connection.connected
+        }
 
-    async def stop(self) -> None:
-        """Stop the connection health worker."""
-        self._running = False
-        if self._task:
-            self._task.cancel()
+        # Persist every connected account with one statement; a database
+        # failure must not hold back the live updates below
+        if connections:
             try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-        logger.info("Connection health worker stopped")
-
-    async def _run_loop(self) -> None:
-        """Main worker loop."""
-        while self._running:
-            try:
-                await asyncio.sleep(self.interval)
-                await self._check_health()
-            except asyncio.CancelledError:
-                break
+                async with get_session_maker()() as session:
+                    await batch_update_account_info(session, connections)
+                    await session.commit()
             except Exception as e:
-                logger.error(f"Health check error: {e}")
+                logger.error(f"Account persist error: {e}")
                 self._stats.error_count += 1
                 self._stats.last_error = str(e)
 
-    async def _check_health(self) -> None:
-        """Check health of all connections."""
-        from archon_prime.api.services.mt5_pool import get_mt5_pool
-
-        pool = get_mt5_pool()
-        stats = pool.get_stats()
-
-        # Log connection stats
-        if stats.failed_connections > 0:
-            logger.warning(
-                f"Connection health: {stats.active_connections} active, "
-                f"{stats.failed_connections} failed"
+        async def sync(profile_id: UUID) -> None:
+            # Broadcast account update via WebSocket
+            connection = connections[profile_id]
+            await broadcaster.account_update(
+                profile_id=profile_id,
+                balance=connection.balance,
+                equity=connection.equity,
+                margin=connection.margin,
+                free_margin=connection.free_margin,
+                profit=connection.equity - connection.balance,
+                margin_level=connection.margin_level,
             )
 
-        # TODO: Implement reconnection logic
-        # 1. Detect failed connections
-        # 2. Attempt reconnection with backoff
-        # 3. Alert after max attempts
+        await for_each_profile(list(connections), sync, "Account sync")
 
         self._stats.run_count += 1
         self._stats.last_run_at = datetime.now(timezone.utc)
@@ -361,46 +285,19 @@ class SignalExpirationWorker:
 
     def __init__(self, interval_seconds: int = 60):
         self.interval = interval_seconds
-        self._running = False
-        self._task: Optional[asyncio.Task] = None
         self._stats = WorkerStats(
             name="signal_expiration",
             started_at=datetime.now(timezone.utc),
         )
 
-    async def start(self) -> None:
-        """Start the signal expiration worker."""
-        if self._running:
-            return
-
-        self._running = True
-        self._stats.started_at = datetime.now(timezone.utc)
-        self._task = asyncio.create_task(self._run_loop())
-        logger.info("Signal expiration worker started")
-
-    async def stop(self) -> None:
-        """Stop the signal expiration worker."""
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-        logger.info("Signal expiration worker stopped")
-
-    async def _run_loop(self) -> None:
-        """Main worker loop."""
-        while self._running:
-            try:
-                await asyncio.sleep(self.interval)
-                await self._expire_stale_signals()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Signal expiration error: {e}")
-                self._stats.error_count += 1
-                self._stats.last_error = str(e)
+    async def run_once(self) -> None:
+        """Run one pass, recording any error in the worker stats."""
+        try:
+            await self._expire_stale_signals()
+        except Exception as e:
+            logger.error(f"Signal expiration error: {e}")
+            self._stats.error_count += 1
+            self._stats.last_error = str(e)
 
     async def _expire_stale_signals(self) -> None:
         """Expire signals past their valid_until time."""
@@ -418,7 +315,9 @@ class BackgroundWorkerManager:
     """
     Manages all background workers.
 
-    Provides unified start/stop and status monitoring.
+    Provides unified start/stop and status monitoring. The workers
+    are driven by one WorkerScheduler task instead of one sleep loop
+    per worker.
     """
 
     def __init__(self):
@@ -427,29 +326,32 @@ class BackgroundWorkerManager:
         self.connection_health = ConnectionHealthWorker()
         self.signal_expiration = SignalExpirationWorker()
 
-        self._started = False
+        self._scheduler = WorkerScheduler(self._workers())
+
+    def _workers(self) -> list:
+        """All managed workers."""
+        return [
+            self.reconciliation,
+            self.account_sync,
+            self.connection_health,
+            self.signal_expiration,
+        ]
 
     async def start_all(self) -> None:
         """Start all background workers."""
-        if self._started:
+        if self._scheduler.started:
             return
 
-        await self.reconciliation.start()
-        await self.account_sync.start()
-        await self.connection_health.start()
-        await self.signal_expiration.start()
+        now = datetime.now(timezone.utc)
+        for worker in self._workers():
+            worker.get_stats().started_at = now
 
-        self._started = True
+        self._scheduler.start()
         logger.info("All background workers started")
 
     async def stop_all(self) -> None:
         """Stop all background workers."""
-        await self.reconciliation.stop()
-        await self.account_sync.stop()
-        await self.connection_health.stop()
-        await self.signal_expiration.stop()
-
-        self._started = False
+        await self._scheduler.stop()
         logger.info("All background workers stopped")
 
     def get_all_stats(self) -> Dict[str, WorkerStats]:
@@ -474,6 +376,38 @@ def get_worker_manager() -> BackgroundWorkerManager:
     return _worker_manager
 
 
+async def warm_up_mt5_pool() -> int:
+    """
+    Connect trading-enabled profiles before the first request.
+
+    Opens up to the pool's min_connections, most recently connected
+    profiles first. Profiles whose credentials cannot be decrypted
+    are skipped.
+
+    Returns:
+        Number of profiles connected
+    """
+    pool = get_mt5_pool()
+    if pool.min_connections <= 0:
+        return 0
+
+    async with get_readonly_session_maker()() as session:
+        service = ProfileService(session)
+        profiles = await service.get_warm_up_profiles(pool.min_connections)
+        credentials = []
+        for profile in profiles:
+            try:
+                password = service.get_decrypted_password(profile)
+            except Exception as e:
+                logger.error(f"Skipping warm-up of profile {profile.id}: {e}")
+                continue
+            credentials.append(
+                (profile.id, str(profile.mt5_login), password, profile.mt5_server)
+            )
+
+    return await pool.warm_up(credentials)
+
+
 async def init_background_workers() -> None:
     """Initialize and start all background workers."""
     manager = get_worker_manager()
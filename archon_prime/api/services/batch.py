@@ -0,0 +1,145 @@
+"""
+Batch Loaders
+
+Load and update rows for many profiles with one statement instead of
+one per profile.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+from uuid import UUID
+
+from sqlalchemy import Float, Update, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from archon_prime.api.db.models import MT5Profile, Position
+
+# Account info columns synced from MT5, with the element types of the
+# arrays they are sent in (float8 values are cast to numeric on assignment).
+# Only columns mapped on MT5Profile; margin figures are broadcast, not stored.
+ACCOUNT_INFO_COLUMNS = {
+    "balance": Float(),
+    "equity": Float(),
+}
+
+
+async def batch_fetch_positions(
+    session: AsyncSession,
+    profile_ids: Iterable[UUID],
+    status: Optional[str] = "open",
+) -> Dict[UUID, List[Position]]:
+    """
+    Fetch positions for several profiles in a single query.
+
+    Args:
+        session: Database session
+        profile_ids: Profiles to load positions for
+        status: Only positions with this status (None for all)
+
+    Returns:
+        Positions grouped by profile ID; every requested profile has
+        an entry, empty if it has no positions
+    """
+    ids = set(profile_ids)
+    grouped: Dict[UUID, List[Position]] = {profile_id: [] for profile_id in ids}
+    if not ids:
+        return grouped
+
+    stmt = select(Position).where(Position.profile_id.in_(ids))
+    if status is not None:
+        stmt = stmt.where(Position.status == status)
+
+    result = await session.execute(stmt)
+    for position in result.scalars():
+        grouped[position.profile_id].append(position)
+    return grouped
+
+
+def _account_info_rows(accounts: Mapping[UUID, Any]) -> List[Dict[str, Any]]:
+    """One parameter dict per profile, keyed by column name."""
+    return [
+        {
+            "id": profile_id,
+            **{name: getattr(account, name) for name in ACCOUNT_INFO_COLUMNS},
+        }
+        for profile_id, account in accounts.items()
+    ]
+
+
+def _update_from_arrays() -> Update:
+    """
+    Build UPDATE mt5_profiles ... FROM unnest(...) AS v.
+
+    Each column is bound as one array parameter, so the SQL text is the
+    same for any number of profiles and is compiled and prepared once
+    (SQLAlchemy's compiled cache and asyncpg's statement cache).
+    last_sync_at is stamped by the database with now().
+
+    Returns:
+        UPDATE statement taking the parameters from _array_params()
+    """
+    data = (
+        func.unnest(
+            bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True))),
+            *(
+                bindparam(f"{name}_values", type_=ARRAY(type_))
+                for name, type_ in ACCOUNT_INFO_COLUMNS.items()
+            ),
+        )
+        .table_valued("id", *ACCOUNT_INFO_COLUMNS)
+        .render_derived(name="v")
+    )
+
+    return (
+        update(MT5Profile)
+        .where(MT5Profile.id == data.c.id)
+        .values(
+            {
+                **{name: data.c[name] for name in ACCOUNT_INFO_COLUMNS},
+                "last_sync_at": func.now(),
+            }
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _array_params(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Transpose parameter rows into the arrays _update_from_arrays() binds."""
+    return {
+        "ids": [row["id"] for row in rows],
+        **{
+            f"{name}_values": [row[name] for row in rows]
+            for name in ACCOUNT_INFO_COLUMNS
+        },
+    }
+
+
+async def batch_update_account_info(
+    session: AsyncSession,
+    accounts: Mapping[UUID, Any],
+) -> None:
+    """
+    Persist account info for several profiles in a single statement.
+
+    PostgreSQL gets one UPDATE ... FROM unnest(...) over array
+    parameters; other dialects get an executemany UPDATE by primary
+    key. The caller commits.
+
+    Args:
+        session: Database session
+        accounts: Objects with the ACCOUNT_INFO_COLUMNS attributes
+            (e.g. MT5Connection), keyed by profile ID
+    """
+    if not accounts:
+        return
+
+    rows = _account_info_rows(accounts)
+    if session.get_bind().dialect.name == "postgresql":
+        await session.execute(_update_from_arrays(), _array_params(rows))
+    else:
+        synced_at = datetime.now(timezone.utc)
+        for row in rows:
+            row["last_sync_at"] = synced_at
+        await session.execute(update(MT5Profile), rows)
@@ -0,0 +1,169 @@
+"""
+Connection Health Worker
+
+Watches the MT5 connection pool and reconnects dropped profiles with
+jittered exponential backoff.
+"""
+
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+from uuid import UUID
+
+from archon_prime.api.db.session import get_readonly_session_maker
+from archon_prime.api.profiles.service import ProfileService
+from archon_prime.api.services.mt5_pool import (
+    MT5Connection,
+    MT5ConnectionPool,
+    get_mt5_pool,
+)
+from archon_prime.api.services.worker_base import WorkerStats, for_each_profile
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionHealthWorker:
+    """
+    Monitors connection health and handles recovery.
+
+    Detects disconnections and attempts reconnection with per-profile
+    exponential backoff, giving up after max_reconnect_attempts.
+    Delays are fully jittered so profiles that dropped together (e.g.
+    in a broker outage) do not all retry on the same tick.
+    """
+
+    # Delay after the n-th failed attempt: uniform(0, base * 2**n), capped
+    RECONNECT_BASE_DELAY_SEC = 1.0
+    RECONNECT_MAX_DELAY_SEC = 300.0
+
+    def __init__(
+        self,
+        interval_seconds: int = 15,
+        max_reconnect_attempts: int = 5,
+        pool_getter: Callable[[], MT5ConnectionPool] = get_mt5_pool,
+        reconnect: Optional[
+            Callable[[MT5ConnectionPool, MT5Connection], Awaitable[bool]]
+        ] = None,
+    ):
+        self.interval = interval_seconds
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self._get_pool = pool_getter
+        self._reconnect = reconnect or self._reconnect_profile
+        self._stats = WorkerStats(
+            name="connection_health",
+            started_at=datetime.now(timezone.utc),
+        )
+
+        # Track reconnection attempts and when each profile may retry
+        self._reconnect_attempts: Dict[UUID, int] = {}
+        self._next_retry_at: Dict[UUID, float] = {}
+
+    async def run_once(self) -> None:
+        """Run one pass, recording any error in the worker stats."""
+        try:
+            await self._check_health()
+        except Exception as e:
+            logger.error(f"Health check error: {e}")
+            self._stats.error_count += 1
+            self._stats.last_error = str(e)
+
+    async def _check_health(self) -> None:
+        """Check health of all connections."""
+        pool = self._get_pool()
+        stats = pool.get_stats()
+
+        # Log connection stats
+        if stats.failed_connections > 0:
+            logger.warning(
+                f"Connection health: {stats.active_connections} active, "
+                f"{stats.failed_connections} failed"
+            )
+
+        failed = {
+            profile_id: connection
+            for profile_id, connection in pool.snapshot().items()
+            if not connection.connected
+        }
+
+        # Forget profiles that recovered or were removed
+        for profile_id in list(self._reconnect_attempts):
+            if profile_id not in failed:
+                del self._reconnect_attempts[profile_id]
+                self._next_retry_at.pop(profile_id, None)
+
+        now = time.monotonic()
+        due = [
+            profile_id
+            for profile_id in failed
+            if self._reconnect_attempts.get(profile_id, 0)
+            < self.max_reconnect_attempts
+            and self._next_retry_at.get(profile_id, 0.0) <= now
+        ]
+
+        async def reconnect(profile_id: UUID) -> None:
+            connected = False
+            try:
+                connected = await self._reconnect(pool, failed[profile_id])
+            finally:
+                self._record_attempt(profile_id, connected)
+
+        await for_each_profile(due, reconnect, "Reconnection")
+
+        self._stats.run_count += 1
+        self._stats.last_run_at = datetime.now(timezone.utc)
+
+    def _record_attempt(self, profile_id: UUID, connected: bool) -> None:
+        """
+        Update backoff state after a reconnection attempt.
+
+        Errors are logged and recorded in the stats only when a profile
+        starts failing or runs out of attempts, not on every retry.
+        """
+        if connected:
+            attempts = self._reconnect_attempts.pop(profile_id, 0)
+            self._next_retry_at.pop(profile_id, None)
+            logger.info(f"Reconnected {profile_id} after {attempts + 1} attempts")
+            return
+
+        attempts = self._reconnect_attempts.get(profile_id, 0) + 1
+        self._reconnect_attempts[profile_id] = attempts
+        delay = random.uniform(
+            0,
+            min(
+                self.RECONNECT_MAX_DELAY_SEC,
+                self.RECONNECT_BASE_DELAY_SEC * 2 ** attempts,
+            ),
+        )
+        self._next_retry_at[profile_id] = time.monotonic() + delay
+
+        if attempts == 1:
+            error = f"Reconnection failed for {profile_id}, retrying with backoff"
+        elif attempts >= self.max_reconnect_attempts:
+            error = f"Giving up on {profile_id} after {attempts} reconnection attempts"
+        else:
+            return
+        logger.warning(error)
+        self._stats.error_count += 1
+        self._stats.last_error = error
+
+    async def _reconnect_profile(
+        self, pool: MT5ConnectionPool, connection: MT5Connection
+    ) -> bool:
+        """Reconnect a profile with its stored credentials."""
+        async with get_readonly_session_maker()() as session:
+            service = ProfileService(session)
+            profile = await service.get_profile_by_id(connection.profile_id)
+            if profile is None:
+                return False
+            password = service.get_decrypted_password(profile)
+
+        connected, _ = await pool.connect(
+            connection.profile_id, connection.login, password, connection.server
+        )
+        return connected
+
+    def get_stats(self) -> WorkerStats:
+        """Get worker statistics."""
+        return self._stats
@@ -2,15 +2,22 @@
 Encryption Service
 
 AES-256 encryption for sensitive data like MT5 credentials.
-Uses PBKDF2 key derivation and Fernet symmetric encryption.
+
+Records are AES-256-GCM with a key derived once from the master key
+via HKDF, tagged with a leading version byte. Records written before
+the version tag (PBKDF2 salt + Fernet token) still decrypt.
 """
 
 import base64
 import os
+from collections import OrderedDict
 from typing import Optional
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from archon_prime.api.config import settings
@@ -20,12 +27,24 @@ class EncryptionService:
     """
     Service for encrypting and decrypting sensitive data.
 
-    Uses AES-256 via Fernet with PBKDF2 key derivation.
-    Each encryption includes a unique salt for added security.
+    New records are version byte + 96-bit nonce + AES-256-GCM
+    ciphertext and tag. Legacy records (salt + Fernet token, no version
+    byte) are decrypted with their per-record PBKDF2 key; only records
+    shaped like one reach the costly derivation.
     """
 
+    VERSION_AESGCM = 1
+    NONCE_SIZE = 12  # 96 bits, the GCM standard
+    # Part of the key derivation: changing it orphans every stored record
+    HKDF_INFO = b"archon-prime credential encryption v1"
+
+    # Legacy Fernet records
     SALT_SIZE = 16  # 128 bits
     ITERATIONS = 480000  # OWASP recommended
+    KEY_CACHE_SIZE = 1024  # Derived keys kept per service instance
+    # Every Fernet token starts with this (version 0x80, then the high
+    # bytes of its timestamp), base64-encoded after the salt
+    LEGACY_TOKEN_PREFIX = b"gAAAAA"
 
     def __init__(self, master_key: Optional[str] = None):
         """
@@ -35,6 +54,19 @@ class EncryptionService:
             master_key: Master encryption key. Uses settings if not provided.
         """
         self._master_key = (master_key or settings.MASTER_ENCRYPTION_KEY).encode()
+        self._aead = AESGCM(
+            HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=None,
+                info=self.HKDF_INFO,
+            ).derive(self._master_key)
+        )
+        # salt -> Fernet; PBKDF2 runs once per salt, not once per call.
+        # Per instance, so a service with a rotated key starts empty.
+        self._fernets: OrderedDict[bytes, Fernet] = OrderedDict()
+        # Target of rotate_encryption(), reused while the new key is the same
+        self._rotation_target: Optional[EncryptionService] = None
 
     def _derive_key(self, salt: bytes) -> bytes:
         """
@@ -55,6 +87,38 @@ class EncryptionService:
         key = kdf.derive(self._master_key)
         return base64.urlsafe_b64encode(key)
 
+    def _get_fernet(self, salt: bytes, cache: bool = True) -> Fernet:
+        """
+        Get the Fernet for a salt, deriving its key on first use.
+
+        Args:
+            salt: Salt stored with the ciphertext
+            cache: Whether to cache a newly derived key; pass False to
+                cache it only once it has decrypted something
+
+        Returns:
+            Fernet instance for the derived key
+        """
+        fernet = self._fernets.get(salt)
+        if fernet is not None:
+            self._fernets.move_to_end(salt)
+            return fernet
+
+        fernet = Fernet(self._derive_key(salt))
+        if cache:
+            self._cache_fernet(salt, fernet)
+        return fernet
+
+    def _cache_fernet(self, salt: bytes, fernet: Fernet) -> None:
+        """Add a derived Fernet to the LRU key cache."""
+        self._fernets[salt] = fernet
+        if len(self._fernets) > self.KEY_CACHE_SIZE:
+            self._fernets.popitem(last=False)
+
+    def _is_legacy(self, encrypted_data: bytes) -> bool:
+        """Whether a record has the legacy salt + Fernet token layout."""
+        return encrypted_data.startswith(self.LEGACY_TOKEN_PREFIX, self.SALT_SIZE)
+
     def encrypt(self, plaintext: str) -> bytes:
         """
         Encrypt a string value.
@@ -63,28 +127,22 @@ class EncryptionService:
             plaintext: String to encrypt
 
         Returns:
-            Encrypted bytes (salt + ciphertext)
+            Encrypted bytes (version + nonce + ciphertext)
         """
         if not plaintext:
             raise ValueError("Cannot encrypt empty string")
 
-        # Generate random salt
-        salt = os.urandom(self.SALT_SIZE)
-
-        # Derive key and encrypt
-        key = self._derive_key(salt)
-        fernet = Fernet(key)
-        ciphertext = fernet.encrypt(plaintext.encode())
-
-        # Prepend salt to ciphertext
-        return salt + ciphertext
+        nonce = os.urandom(self.NONCE_SIZE)
+        ciphertext = self._aead.encrypt(nonce, plaintext.encode(), None)
+        return bytes((self.VERSION_AESGCM,)) + nonce + ciphertext
 
     def decrypt(self, encrypted_data: bytes) -> str:
         """
         Decrypt encrypted data.
 
         Args:
-            encrypted_data: Encrypted bytes (salt + ciphertext)
+            encrypted_data: Encrypted bytes from encrypt(), or a legacy
+                salt + Fernet record
 
         Returns:
             Decrypted string
@@ -95,20 +153,54 @@ class EncryptionService:
         if not encrypted_data or len(encrypted_data) <= self.SALT_SIZE:
             raise ValueError("Invalid encrypted data")
 
+        legacy = self._is_legacy(encrypted_data)
+        if encrypted_data[0] == self.VERSION_AESGCM:
+            nonce_end = 1 + self.NONCE_SIZE
+            try:
+                plaintext = self._aead.decrypt(
+                    encrypted_data[1:nonce_end], encrypted_data[nonce_end:], None
+                )
+                return plaintext.decode()
+            except InvalidTag:
+                # A legacy salt can start with the version byte too
+                if not legacy:
+                    raise ValueError(
+                        "Decryption failed - invalid key or corrupted data"
+                    ) from None
+
+        if not legacy:
+            raise ValueError("Invalid encrypted data")
+        return self._decrypt_legacy(encrypted_data)
+
+    def _decrypt_legacy(self, encrypted_data: bytes) -> str:
+        """
+        Decrypt a legacy record (salt + Fernet token).
+
+        Args:
+            encrypted_data: Encrypted bytes (salt + ciphertext)
+
+        Returns:
+            Decrypted string
+
+        Raises:
+            ValueError: If decryption fails
+        """
+
         # Extract salt and ciphertext
         salt = encrypted_data[: self.SALT_SIZE]
         ciphertext = encrypted_data[self.SALT_SIZE :]
 
-        # Derive key and decrypt
-        key = self._derive_key(salt)
-        fernet = Fernet(key)
-
+        # Derive key (cached per salt) and decrypt
+        fernet = self._get_fernet(salt, cache=False)
         try:
             plaintext = fernet.decrypt(ciphertext)
-            return plaintext.decode()
         except InvalidToken:
             raise ValueError("Decryption failed - invalid key or corrupted data")
 
+        # Only keys that decrypted something are worth a cache slot
+        self._cache_fernet(salt, fernet)
+        return plaintext.decode()
+
     def rotate_encryption(self, encrypted_data: bytes, new_master_key: str) -> bytes:
         """
         Re-encrypt data with a new master key.
@@ -123,8 +215,11 @@ class EncryptionService:
         # Decrypt with current key
         plaintext = self.decrypt(encrypted_data)
 
-        # Re-encrypt with new key
-        new_service = EncryptionService(new_master_key)
+        # Re-encrypt with new key, reusing its cipher across records
+        new_service = self._rotation_target
+        if new_service is None or new_service._master_key != new_master_key.encode():
+            new_service = EncryptionService(new_master_key)
+            self._rotation_target = new_service
         return new_service.encrypt(plaintext)
 
 
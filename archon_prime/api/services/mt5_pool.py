@@ -7,17 +7,27 @@ Provides connection pooling, auto-reconnection, and health monitoring.
 
 import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Dict, Optional, Callable, Awaitable
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from types import MappingProxyType
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Coroutine, Dict, Iterable, List,
+    Mapping, Optional, Set, Tuple,
+)
 from uuid import UUID
 
 from archon_prime.api.config import settings
+from archon_prime.api.services.pool_tracking import (
+    IDLE_STATS_SEC, ConnectionColumns, IdleExpiry,
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MT5Connection:
     """Represents a single MT5 connection."""
 
@@ -25,7 +35,7 @@ class MT5Connection:
     login: str
     server: str
     connected: bool = False
-    last_heartbeat: Optional[datetime] = None
+    last_heartbeat_ts: Optional[float] = None  # time.monotonic()
     reconnect_attempts: int = 0
     error_message: Optional[str] = None
 
@@ -38,8 +48,16 @@ class MT5Connection:
     leverage: int = 0
     currency: str = ""
 
+    @property
+    def last_heartbeat(self) -> Optional[datetime]:
+        """Wall-clock time of the last heartbeat (for display)."""
+        if self.last_heartbeat_ts is None:
+            return None
+        age = time.monotonic() - self.last_heartbeat_ts
+        return datetime.now(timezone.utc) - timedelta(seconds=age)
 
-@dataclass
+
+@dataclass(slots=True)
 class PoolStats:
     """Connection pool statistics."""
 
@@ -67,6 +85,7 @@ class MT5ConnectionPool:
         max_connections: int = None,
         idle_timeout: int = None,
         reconnect_interval: int = None,
+        min_connections: int = None,
     ):
         """
         Initialize connection pool.
@@ -75,16 +94,40 @@ class MT5ConnectionPool:
             max_connections: Maximum concurrent connections
             idle_timeout: Seconds before idle connection is closed
             reconnect_interval: Seconds between reconnection attempts
+            min_connections: Connections opened by warm_up() and kept
+                open by the idle cleanup
         """
         self.max_connections = max_connections or settings.MT5_POOL_MAX_CONNECTIONS
+        self.min_connections = min(
+            min_connections or settings.MT5_POOL_MIN_CONNECTIONS,
+            self.max_connections,
+        )
         self.idle_timeout = idle_timeout or settings.MT5_POOL_IDLE_TIMEOUT_SEC
         self.reconnect_interval = reconnect_interval or settings.MT5_RECONNECT_DELAY_SEC
 
         self._connections: Dict[UUID, MT5Connection] = {}
-        self._lock = asyncio.Lock()
+        self._snapshot = MappingProxyType(self._connections)
+        self._columns = ConnectionColumns(self.max_connections)
+        # profile_id -> [lock, users]; serializes connect/disconnect per
+        # profile so a slow handshake never blocks another profile.
+        # Entries are dropped once unused (see _profile_lock).
+        self._profile_locks: Dict[UUID, List] = {}
+        # Profiles mid-handshake, counted against max_connections
+        self._connecting: Set[UUID] = set()
+
+        self._expiry = IdleExpiry(self.idle_timeout)
+
+        # Stats kept up to date by _store()/_remove(), so the capacity
+        # check doesn't scan the pool
+        self._active = 0
+        self._failed = 0
+        self._reconnects = 0
         self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
 
+        # Running callback tasks; the event loop only keeps weak references
+        self._callback_tasks: Set[asyncio.Task] = set()
+
         # Callbacks
         self._on_connect: Optional[Callable[[UUID], Awaitable[None]]] = None
         self._on_disconnect: Optional[Callable[[UUID], Awaitable[None]]] = None
@@ -113,12 +156,58 @@ class MT5ConnectionPool:
                 pass
 
         # Close all connections
-        async with self._lock:
-            for profile_id in list(self._connections.keys()):
+        for profile_id in list(self._connections.keys()):
+            async with self._profile_lock(profile_id):
                 await self._close_connection(profile_id)
 
+        # Let pending connect/disconnect callbacks finish
+        if self._callback_tasks:
+            await asyncio.gather(*self._callback_tasks, return_exceptions=True)
+
         logger.info("MT5 connection pool stopped")
 
+    async def warm_up(
+        self, credentials: Iterable[Tuple[UUID, str, str, str]]
+    ) -> int:
+        """
+        Open connections ahead of the first request.
+
+        Handshakes run concurrently for the first min_connections
+        entries, so early signals do not pay the connection cost.
+
+        Args:
+            credentials: (profile_id, login, password, server) tuples,
+                most important first
+
+        Returns:
+            Number of profiles connected
+        """
+        batch = list(islice(credentials, self.min_connections))
+        if not batch:
+            return 0
+
+        results = await asyncio.gather(
+            *(self.connect(*entry) for entry in batch)
+        )
+        connected = sum(1 for ok, _ in results if ok)
+        logger.info(f"MT5 pool warmed up: {connected}/{len(batch)} connected")
+        return connected
+
+    @asynccontextmanager
+    async def _profile_lock(self, profile_id: UUID) -> AsyncIterator[None]:
+        """Hold a profile's lock, dropping it once nobody else needs it."""
+        entry = self._profile_locks.get(profile_id)
+        if entry is None:
+            entry = self._profile_locks[profile_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._profile_locks[profile_id]
+
     async def connect(
         self,
         profile_id: UUID,
@@ -138,62 +227,73 @@ class MT5ConnectionPool:
         Returns:
             Tuple of (success, message)
         """
-        async with self._lock:
-            # Check if already connected
-            if profile_id in self._connections:
-                conn = self._connections[profile_id]
-                if conn.connected:
-                    return True, "Already connected"
-
-            # Check pool capacity
-            active_count = sum(
-                1 for c in self._connections.values() if c.connected
-            )
-            if active_count >= self.max_connections:
+        # Fast path: no lock needed to see an existing connection
+        if self.is_connected(profile_id):
+            return True, "Already connected"
+
+        async with self._profile_lock(profile_id):
+            # Another connect for this profile may have won the race
+            if self.is_connected(profile_id):
+                return True, "Already connected"
+
+            # Check pool capacity and reserve a slot (no await in between).
+            # O(1): _active is a counter and _connecting holds in-flight
+            # handshakes, so racing connects cannot over-admit.
+            if self._active + len(self._connecting) >= self.max_connections:
                 return False, f"Connection pool full ({self.max_connections})"
+            self._connecting.add(profile_id)
 
-            # Create connection
-            conn = MT5Connection(
-                profile_id=profile_id,
-                login=login,
-                server=server,
-            )
-
-            # TODO: Actual MT5 connection logic
-            # This would use the MT5 adapter to establish connection
-            # For now, simulate successful connection
             try:
-                # Simulate connection
-                conn.connected = True
-                conn.last_heartbeat = datetime.now(timezone.utc)
-                conn.reconnect_attempts = 0
-                conn.error_message = None
+                return await self._open_connection(profile_id, login, server)
+            finally:
+                self._connecting.discard(profile_id)
 
-                # Simulate account info fetch
-                conn.balance = 10000.0
-                conn.equity = 10000.0
-                conn.margin = 0.0
-                conn.free_margin = 10000.0
-                conn.margin_level = 0.0
-                conn.leverage = 100
-                conn.currency = "USD"
-
-                self._connections[profile_id] = conn
-
-                logger.info(f"Connected to MT5: {login}@{server}")
-
-                # Notify callback
-                if self._on_connect:
-                    asyncio.create_task(self._on_connect(profile_id))
-
-                return True, "Connected successfully"
+    async def _open_connection(
+        self, profile_id: UUID, login: str, server: str
+    ) -> tuple[bool, str]:
+        """Handshake with MT5 and publish the connection (internal)."""
+        # Create connection
+        conn = MT5Connection(
+            profile_id=profile_id,
+            login=login,
+            server=server,
+        )
 
-            except Exception as e:
-                conn.connected = False
-                conn.error_message = str(e)
-                self._connections[profile_id] = conn
-                logger.error(f"Failed to connect to MT5: {e}")
-                return False, str(e)
+        # TODO: Actual MT5 connection logic
+        # This would use the MT5 adapter to establish connection
+        # For now, simulate successful connection
+        try:
+            # Simulate connection
+            conn.connected = True
+            conn.last_heartbeat_ts = time.monotonic()
+            conn.reconnect_attempts = 0
+            conn.error_message = None
+
+            # Simulate account info fetch
+            conn.balance = 10000.0
+            conn.equity = 10000.0
+            conn.margin = 0.0
+            conn.free_margin = 10000.0
+            conn.margin_level = 0.0
+            conn.leverage = 100
+            conn.currency = "USD"
+
+            self._store(profile_id, conn)
+
+            logger.info(f"Connected to MT5: {login}@{server}")
+
+            # Notify callback
+            if self._on_connect:
+                self._spawn(self._on_connect(profile_id))
+
+            return True, "Connected successfully"
+
+        except Exception as e:
+            conn.connected = False
+            conn.error_message = str(e)
+            self._store(profile_id, conn)
+            logger.error(f"Failed to connect to MT5: {e}")
+            return False, str(e)
 
     async def disconnect(self, profile_id: UUID) -> tuple[bool, str]:
         """
@@ -205,7 +305,7 @@ class MT5ConnectionPool:
         Returns:
             Tuple of (success, message)
         """
-        async with self._lock:
+        async with self._profile_lock(profile_id):
             if profile_id not in self._connections:
                 return True, "Not connected"
 
@@ -217,17 +317,50 @@ class MT5ConnectionPool:
         if profile_id not in self._connections:
             return
 
-        conn = self._connections[profile_id]
+        conn = self._remove(profile_id)
 
         # TODO: Actual MT5 disconnection logic
         conn.connected = False
-        del self._connections[profile_id]
 
         logger.info(f"Disconnected from MT5: {conn.login}@{conn.server}")
 
         # Notify callback
         if self._on_disconnect:
-            asyncio.create_task(self._on_disconnect(profile_id))
+            self._spawn(self._on_disconnect(profile_id))
+
+    def _count(self, conn: MT5Connection, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a connection from the stats."""
+        if conn.connected:
+            self._active += sign
+        elif conn.error_message:
+            self._failed += sign
+        self._reconnects += sign * conn.reconnect_attempts
+
+    def _store(self, profile_id: UUID, conn: MT5Connection) -> None:
+        """Add or replace a profile's connection (internal)."""
+        old = self._connections.get(profile_id)
+        if old is not None:
+            self._count(old, -1)
+        self._connections[profile_id] = conn
+        self._count(conn, 1)
+        self._columns.set(profile_id, conn)
+        self._expiry.schedule(profile_id, conn)
+
+    def _remove(self, profile_id: UUID) -> MT5Connection:
+        """Remove a profile's connection (internal)."""
+        conn = self._connections.pop(profile_id)
+        self._count(conn, -1)
+        self._columns.remove(profile_id)
+        self._expiry.discard(profile_id)
+        return conn
+
+    def heartbeat(self, profile_id: UUID) -> None:
+        """Record a heartbeat from a profile's terminal."""
+        conn = self._connections.get(profile_id)
+        if conn is not None:
+            conn.last_heartbeat_ts = time.monotonic()
+            self._columns.set(profile_id, conn)
+            self._expiry.schedule(profile_id, conn)
 
     def get_connection(self, profile_id: UUID) -> Optional[MT5Connection]:
         """Get connection for a profile."""
@@ -240,56 +373,88 @@ class MT5ConnectionPool:
 
     def get_stats(self) -> PoolStats:
         """Get connection pool statistics."""
-        connections = list(self._connections.values())
         return PoolStats(
-            total_connections=len(connections),
-            active_connections=sum(1 for c in connections if c.connected),
-            idle_connections=sum(
-                1 for c in connections
-                if c.connected and c.last_heartbeat
-                and (datetime.now(timezone.utc) - c.last_heartbeat).seconds > 60
+            total_connections=len(self._connections),
+            active_connections=self._active,
+            idle_connections=self._columns.count_idle(
+                time.monotonic() - IDLE_STATS_SEC
             ),
-            failed_connections=sum(
-                1 for c in connections if not c.connected and c.error_message
-            ),
-            total_reconnects=sum(c.reconnect_attempts for c in connections),
+            failed_connections=self._failed,
+            total_reconnects=self._reconnects,
         )
 
-    def get_all_connections(self) -> Dict[UUID, MT5Connection]:
-        """Get all connections (for admin monitoring)."""
-        return dict(self._connections)
+    def get_all_connections(
+        self, copy: bool = False
+    ) -> Mapping[UUID, MT5Connection]:
+        """
+        Get all connections (for admin monitoring).
+
+        Args:
+            copy: Return a dict copy instead of the live read-only view
+                (needed to iterate across an await)
+
+        Returns:
+            Profile id -> connection
+        """
+        return dict(self._connections) if copy else self._snapshot
+
+    def snapshot(self) -> Mapping[UUID, MT5Connection]:
+        """
+        Get a read-only view of all connections without copying.
+
+        The view tracks the pool, so iterate it without awaiting in
+        between (or copy what you need first).
+        """
+        return self._snapshot
 
     async def _cleanup_loop(self):
-        """Background task for connection cleanup and health checks."""
+        """
+        Background task closing connections as they go idle.
+
+        Sleeps until the earliest idle deadline (or until an earlier one
+        is queued) rather than polling. Failed connections are
+        reconnected, with backoff, by ConnectionHealthWorker, which
+        holds the credentials.
+        """
         while self._running:
             try:
-                await asyncio.sleep(30)  # Check every 30 seconds
-
-                async with self._lock:
-                    now = datetime.now(timezone.utc)
-
-                    for profile_id, conn in list(self._connections.items()):
-                        # Check for idle connections
-                        if (
-                            conn.connected
-                            and conn.last_heartbeat
-                            and (now - conn.last_heartbeat).seconds > self.idle_timeout
-                        ):
-                            logger.info(
-                                f"Closing idle connection: {conn.login}@{conn.server}"
-                            )
-                            await self._close_connection(profile_id)
-
-                        # Check for failed connections needing reconnect
-                        elif not conn.connected and conn.reconnect_attempts < 5:
-                            # TODO: Attempt reconnection
-                            pass
-
+                await self._expiry.wait()
+                await self._close_idle(time.monotonic())
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in cleanup loop: {e}")
 
+    async def _close_idle(self, now: float) -> None:
+        """Close connections whose idle deadline has passed."""
+        for profile_id in self._expiry.pop_due(now):
+            # Re-check under the profile lock: the connection may have
+            # been replaced or refreshed while waiting for it
+            async with self._profile_lock(profile_id):
+                conn = self._connections.get(profile_id)
+                if conn is None:
+                    continue
+                if not self._expiry.is_idle(conn, now):
+                    self._expiry.schedule(profile_id, conn)
+                elif self._active <= self.min_connections:
+                    # Kept open for min_connections; check again later
+                    self._expiry.schedule(profile_id, conn, now + self.idle_timeout)
+                else:
+                    logger.info(f"Closing idle connection: {conn.login}@{conn.server}")
+                    await self._close_connection(profile_id)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a callback in the background, keeping a reference until done."""
+        task = asyncio.create_task(coro)
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._callback_done)
+
+    def _callback_done(self, task: asyncio.Task) -> None:
+        """Forget a finished callback task and log its failure."""
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Pool callback failed: {task.exception()}")
+
     # Callback setters
     def on_connect(self, callback: Callable[[UUID], Awaitable[None]]):
         """Set callback for connection events."""
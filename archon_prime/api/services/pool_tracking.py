@@ -0,0 +1,157 @@
+"""
+MT5 Pool Tracking
+
+Bookkeeping behind MT5ConnectionPool's idle handling: columnar
+heartbeat flags for the idle count in get_stats(), and the deadline
+heap the cleanup loop sleeps on.
+"""
+
+import asyncio
+import heapq
+import time
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from archon_prime.api.services.mt5_pool import MT5Connection
+
+# Heartbeat age after which get_stats() counts a connection as idle
+IDLE_STATS_SEC = 60
+
+
+class ConnectionColumns:
+    """
+    Slot-indexed copy of the fields the idle count reads.
+
+    Connected flags and heartbeat times (monotonic seconds, +inf when
+    unknown) sit in parallel NumPy arrays so idle connections are
+    counted with one vectorized comparison instead of touching every
+    MT5Connection. Freed slots are reused; the arrays grow by doubling
+    when every slot is taken.
+    """
+
+    __slots__ = ("_connected", "_heartbeats", "_slot_of", "_free")
+
+    def __init__(self, capacity: int = 8):
+        capacity = max(1, capacity)
+        self._connected = np.zeros(capacity, dtype=np.bool_)
+        self._heartbeats = np.full(capacity, np.inf)
+        self._slot_of: Dict[UUID, int] = {}
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def set(self, profile_id: UUID, conn: "MT5Connection") -> None:
+        """Record a connection's current flags in its slot."""
+        slot = self._slot_of.get(profile_id)
+        if slot is None:
+            if not self._free:
+                self._grow()
+            slot = self._free.pop()
+            self._slot_of[profile_id] = slot
+        self._connected[slot] = conn.connected
+        self._heartbeats[slot] = (
+            np.inf if conn.last_heartbeat_ts is None else conn.last_heartbeat_ts
+        )
+
+    def remove(self, profile_id: UUID) -> None:
+        """Free a profile's slot."""
+        slot = self._slot_of.pop(profile_id)
+        self._connected[slot] = False
+        self._heartbeats[slot] = np.inf
+        self._free.append(slot)
+
+    def count_idle(self, cutoff: float) -> int:
+        """Number of connected profiles with no heartbeat since cutoff (monotonic)."""
+        return int(np.count_nonzero(self._connected & (self._heartbeats < cutoff)))
+
+    def _grow(self) -> None:
+        """Double the number of slots."""
+        size = len(self._connected)
+        self._connected = np.concatenate(
+            [self._connected, np.zeros(size, dtype=np.bool_)]
+        )
+        self._heartbeats = np.concatenate([self._heartbeats, np.full(size, np.inf)])
+        self._free.extend(range(2 * size - 1, size - 1, -1))
+
+
+class IdleExpiry:
+    """
+    Idle deadlines as a (deadline, profile_id) min-heap.
+
+    Holds at most one live entry per profile (its deadline is kept in
+    a dict). Heartbeats don't push: a due entry whose connection has a
+    newer heartbeat is pushed again at its real deadline. Discarding a
+    profile only drops the dict entry; the stale heap entry no longer
+    matches and is skipped when it comes due.
+    """
+
+    __slots__ = ("idle_timeout", "_heap", "_deadlines", "_changed")
+
+    def __init__(self, idle_timeout: float):
+        self.idle_timeout = idle_timeout
+        self._heap: List[Tuple[float, UUID]] = []
+        self._deadlines: Dict[UUID, float] = {}
+        # Set when a new entry becomes the earliest deadline
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def deadline(self, profile_id: UUID) -> Optional[float]:
+        """A profile's queued deadline, or None."""
+        return self._deadlines.get(profile_id)
+
+    def is_idle(self, conn: "MT5Connection", now: float) -> bool:
+        """Whether a connection has had no heartbeat for idle_timeout."""
+        return (
+            conn.connected
+            and conn.last_heartbeat_ts is not None
+            and now - conn.last_heartbeat_ts > self.idle_timeout
+        )
+
+    def schedule(
+        self, profile_id: UUID, conn: "MT5Connection", deadline: float = None
+    ) -> None:
+        """Queue a profile's idle check unless one is already queued."""
+        if (
+            profile_id in self._deadlines
+            or not conn.connected
+            or conn.last_heartbeat_ts is None
+        ):
+            return
+        if deadline is None:
+            deadline = conn.last_heartbeat_ts + self.idle_timeout
+
+        self._deadlines[profile_id] = deadline
+        heapq.heappush(self._heap, (deadline, profile_id))
+        if self._heap[0] == (deadline, profile_id):
+            self._changed.set()
+
+    def discard(self, profile_id: UUID) -> None:
+        """Drop a profile's deadline, if any."""
+        self._deadlines.pop(profile_id, None)
+
+    async def wait(self) -> None:
+        """Sleep until the earliest deadline or until an earlier one is queued."""
+        self._changed.clear()
+        timeout = None
+        if self._heap:
+            timeout = max(0.0, self._heap[0][0] - time.monotonic())
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except TimeoutError:
+            pass
+
+    def pop_due(self, now: float) -> Iterator[UUID]:
+        """
+        Yield profiles whose deadline has passed, removing them.
+
+        Entries scheduled while iterating are picked up if already due.
+        """
+        while self._heap and self._heap[0][0] <= now:
+            deadline, profile_id = heapq.heappop(self._heap)
+            if self._deadlines.get(profile_id) != deadline:
+                continue  # removed, or superseded by a later entry
+            del self._deadlines[profile_id]
+            yield profile_id
@@ -0,0 +1,142 @@
+"""
+Background Worker Base
+
+Pieces shared by the background workers: the stats record, the
+bounded per-profile fan-out and the scheduler that drives them all
+from one task.
+"""
+
+import asyncio
+import heapq
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Protocol, Sequence
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+# Max profiles a worker handles at once (bounds load on MT5)
+MAX_CONCURRENT_PROFILES = 32
+
+
+async def for_each_profile(
+    profile_ids: List[UUID],
+    handler: Callable[[UUID], Awaitable[object]],
+    action: str,
+) -> None:
+    """
+    Run a per-profile coroutine for many profiles concurrently.
+
+    Failures are logged per profile and do not affect the others.
+
+    Args:
+        profile_ids: Profiles to process
+        handler: Coroutine function taking a profile ID
+        action: Name used in error logs (e.g. "Reconciliation")
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROFILES)
+
+    async def run(profile_id: UUID) -> None:
+        async with semaphore:
+            try:
+                await handler(profile_id)
+            except Exception as e:
+                logger.error(f"{action} failed for {profile_id}: {e}")
+
+    await asyncio.gather(*(run(profile_id) for profile_id in profile_ids))
+
+
+@dataclass(slots=True)
+class WorkerStats:
+    """Statistics for a background worker."""
+    name: str
+    started_at: datetime
+    last_run_at: Optional[datetime] = None
+    run_count: int = 0
+    error_count: int = 0
+    last_error: Optional[str] = None
+
+
+class ScheduledWorker(Protocol):
+    """A worker the scheduler can run: an interval and one pass."""
+
+    interval: float
+
+    async def run_once(self) -> None:
+        """Run one pass; errors are recorded by the worker itself."""
+        ...
+
+
+class WorkerScheduler:
+    """
+    Runs workers every `interval` seconds from one task.
+
+    The task holds a heap of (next_run, index) entries instead of one
+    sleep loop per worker. Due workers are launched as their own tasks,
+    so a slow pass never delays another worker; a worker whose previous
+    pass is still running skips the slot. A pass that overruns its
+    interval skips the missed slots rather than running back to back.
+    """
+
+    def __init__(self, workers: Sequence[ScheduledWorker]):
+        self._workers = list(workers)
+        self._task: Optional[asyncio.Task] = None
+        self._passes: Dict[int, asyncio.Task] = {}
+
+    @property
+    def started(self) -> bool:
+        """Whether the scheduler task is running."""
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start the scheduler task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._schedule_loop())
+
+    async def stop(self) -> None:
+        """Cancel the scheduler and any passes still running."""
+        tasks = list(self._passes.values())
+        if self._task:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._task = None
+        self._passes.clear()
+
+    async def _schedule_loop(self) -> None:
+        """Launch each worker when its slot comes up."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        schedule = [
+            (start + worker.interval, i) for i, worker in enumerate(self._workers)
+        ]
+        heapq.heapify(schedule)
+
+        while True:
+            await asyncio.sleep(max(0.0, schedule[0][0] - loop.time()))
+
+            now = loop.time()
+            due = []
+            while schedule and schedule[0][0] <= now:
+                due.append(heapq.heappop(schedule))
+
+            for run_at, i in due:
+                self._launch(i)
+                interval = self._workers[i].interval
+                next_run = run_at + interval
+                if next_run <= now:
+                    next_run = now + interval
+                heapq.heappush(schedule, (next_run, i))
+
+    def _launch(self, i: int) -> None:
+        """Start a pass of worker i unless its previous pass is still running."""
+        if i in self._passes:
+            logger.debug(f"Skipping {type(self._workers[i]).__name__}: still running")
+            return
+
+        task = asyncio.create_task(self._workers[i].run_once())
+        self._passes[i] = task
+        task.add_done_callback(lambda _, i=i: self._passes.pop(i, None))
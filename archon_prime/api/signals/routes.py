@@ -11,11 +11,15 @@ Invariants enforced:
 """
 
 import math
-from typing import Optional
+from typing import Callable, Coroutine, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter, Depends, HTTPException, Query, Request, Response, status,
+)
+from fastapi.routing import APIRoute
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Message
 
 from archon_prime.api.db.session import get_db
 from archon_prime.api.db.models import User, MT5Profile
@@ -37,6 +41,75 @@ from archon_prime.api.signals.service import SignalGateService
 
 router = APIRouter()
 
+# Query-string value -> decision, for the list filter
+_DECISION_BY_VALUE = {d.value: d for d in SignalDecision}
+
+# Largest accepted batch body: 64KB per signal at the schema's max of 10
+MAX_BATCH_BODY_BYTES = 64 * 1024 * 10
+
+
+class BatchBodyLimitRoute(APIRoute):
+    """
+    Route that rejects oversized bodies before they are parsed.
+
+    FastAPI reads and JSON-decodes the body before any dependency
+    runs, so the limit is enforced here: on Content-Length when sent,
+    and while streaming otherwise (chunked uploads).
+    """
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[None, None, Response]]:
+        handler = super().get_route_handler()
+
+        async def limited_handler(request: Request) -> Response:
+            length = request.headers.get("content-length", "")
+            if length.isdigit() and int(length) > MAX_BATCH_BODY_BYTES:
+                raise _body_too_large()
+
+            body = bytearray()
+            async for chunk in request.stream():
+                body += chunk
+                if len(body) > MAX_BATCH_BODY_BYTES:
+                    raise _body_too_large()
+            return await handler(_replay_body(request, bytes(body)))
+
+        return limited_handler
+
+
+def _replay_body(request: Request, body: bytes) -> Request:
+    """
+    Rebuild a request whose stream yields an already-read body.
+
+    The original receive channel is drained, so the new one serves the
+    buffered body first, then defers to it (for disconnects).
+    """
+    receive = request.receive
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request(request.scope, receive=replay)
+
+
+def _body_too_large() -> HTTPException:
+    """413 for a batch body over MAX_BATCH_BODY_BYTES."""
+    return HTTPException(
+        # Literal: the constant's name differs across Starlette versions
+        status_code=413,
+        detail=f"Batch body exceeds {MAX_BATCH_BODY_BYTES} bytes",
+    )
+
+
+def get_signal_service(db: AsyncSession = Depends(get_db)) -> SignalGateService:
+    """Dependency to get signal gate service."""
+    return SignalGateService(db)
+
 
 # ==================== Signal Submission ====================
 
@@ -49,7 +122,7 @@ router = APIRouter()
 async def submit_signal(
     data: SignalSubmitRequest,
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
 ) -> SignalResponse:
     """
     Submit a trade signal through the Signal Gate.
@@ -65,19 +138,13 @@ async def submit_signal(
     Use idempotency_key to safely retry failed requests.
     The same key within 24 hours returns the cached decision.
     """
-    service = SignalGateService(db)
     return await service.submit_signal(profile, data)
 
 
-@router.post(
-    "/{profile_id}/submit/batch",
-    response_model=list[SignalResponse],
-    summary="Submit batch signals",
-)
 async def submit_batch(
     data: SignalBatchRequest,
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
 ) -> list[SignalResponse]:
     """
     Submit multiple signals in a batch.
@@ -86,14 +153,18 @@ async def submit_batch(
     Rate limits apply to the batch as a whole.
     Max 10 signals per batch.
     """
-    service = SignalGateService(db)
-    results = []
+    return await service.submit_batch(profile, data.signals)
 
-    for signal in data.signals:
-        result = await service.submit_signal(profile, signal)
-        results.append(result)
 
-    return results
+# Registered directly: the decorators do not take a route class
+router.add_api_route(
+    "/{profile_id}/submit/batch",
+    submit_batch,
+    methods=["POST"],
+    response_model=list[SignalResponse],
+    summary="Submit batch signals",
+    route_class_override=BatchBodyLimitRoute,
+)
 
 
 # ==================== Signal Query ====================
@@ -106,7 +177,7 @@ async def submit_batch(
 )
 async def list_signals(
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     decision: Optional[str] = Query(
@@ -115,17 +186,12 @@ async def list_signals(
     ),
 ) -> SignalListResponse:
     """Get paginated list of signals for a profile."""
-    service = SignalGateService(db)
-
-    decision_enum = None
-    if decision:
-        try:
-            decision_enum = SignalDecision(decision)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid decision filter: {decision}",
-            )
+    decision_enum = _DECISION_BY_VALUE.get(decision) if decision else None
+    if decision and decision_enum is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid decision filter: {decision}",
+        )
 
     signals, total = await service.get_signals(
         profile.id,
@@ -134,7 +200,8 @@ async def list_signals(
         decision=decision_enum,
     )
 
-    return SignalListResponse(
+    # Signals were validated by the service; skip re-checking the wrapper
+    return SignalListResponse.model_construct(
         signals=signals,
         total=total,
         page=page,
@@ -150,10 +217,9 @@ async def list_signals(
 async def get_signal(
     signal_id: UUID,
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
 ) -> SignalResponse:
     """Get a specific signal by ID."""
-    service = SignalGateService(db)
     signal = await service.get_signal_by_id(profile.id, signal_id)
 
     if not signal:
@@ -175,7 +241,7 @@ async def get_signal(
 )
 async def get_stats(
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
     hours: int = Query(24, ge=1, le=168, description="Hours to analyze"),
 ) -> SignalStatsResponse:
     """
@@ -183,7 +249,6 @@ async def get_stats(
 
     Returns approval rate, execution rate, rejection reasons, etc.
     """
-    service = SignalGateService(db)
     return await service.get_stats(profile.id, hours=hours)
 
 
@@ -194,10 +259,9 @@ async def get_stats(
 )
 async def get_rate_limit(
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
 ) -> RateLimitStatus:
     """Get current rate limit status for this profile."""
-    service = SignalGateService(db)
     return service.check_rate_limit(profile.id)
 
 
@@ -211,14 +275,13 @@ async def get_rate_limit(
 )
 async def get_gate_config(
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
 ) -> GateConfigResponse:
     """
     Get Signal Gate configuration for this profile.
 
     Returns thresholds, limits, and risk parameters.
     """
-    service = SignalGateService(db)
     return await service.get_gate_config(profile.id)
 
 
@@ -230,14 +293,13 @@ async def get_gate_config(
 async def update_gate_config(
     data: GateConfigUpdateRequest,
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
 ) -> GateConfigResponse:
     """
     Update Signal Gate configuration.
 
     Only provided fields are updated.
     """
-    service = SignalGateService(db)
     return await service.update_gate_config(
         profile.id,
         data.model_dump(exclude_unset=True),
@@ -255,7 +317,7 @@ async def update_gate_config(
 async def execute_signal(
     signal_id: UUID,
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
 ) -> SignalResponse:
     """
     Execute an approved signal.
@@ -263,7 +325,6 @@ async def execute_signal(
     Only signals with decision=APPROVED can be executed.
     This triggers the actual trade placement via MT5.
     """
-    service = SignalGateService(db)
     signal = await service.get_signal_by_id(profile.id, signal_id)
 
     if not signal:
@@ -272,22 +333,11 @@ async def execute_signal(
             detail="Signal not found",
         )
 
-    if signal.decision != SignalDecision.APPROVED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot execute signal with decision: {signal.decision}",
-        )
-
-    if not profile.is_connected:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Profile not connected",
-        )
-
-    if not profile.is_trading_enabled:
+    reason = service.validate_executable(signal, profile)
+    if reason:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Trading not enabled",
+            detail=reason,
         )
 
     # TODO: Execute via MT5 connection pool
@@ -312,14 +362,13 @@ async def execute_signal(
 async def cancel_signal(
     signal_id: UUID,
     profile: MT5Profile = Depends(get_profile_with_access),
-    db: AsyncSession = Depends(get_db),
+    service: SignalGateService = Depends(get_signal_service),
 ) -> MessageResponse:
     """
     Cancel a pending or approved signal.
 
     Cannot cancel already executed signals.
     """
-    service = SignalGateService(db)
     signal = await service.get_signal_by_id(profile.id, signal_id)
 
     if not signal:
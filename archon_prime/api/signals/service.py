@@ -13,15 +13,17 @@ Invariants:
 
 import hashlib
 import time
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 from uuid import UUID, uuid4
 
 from sqlalchemy import select, func, and_, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from archon_prime.api.db.models import MT5Profile, Position
+from archon_prime.api.signals import store
 from archon_prime.api.signals.schemas import (
     SignalDirection,
     SignalSource,
@@ -36,14 +38,8 @@ from archon_prime.api.signals.schemas import (
 )
 
 
-# In-memory stores (production: use Redis)
-_idempotency_cache: Dict[str, Tuple[datetime, SignalResponse]] = {}
-_rate_limit_windows: Dict[UUID, Dict[str, int]] = {}  # profile_id -> {window_key: count}
-_signal_store: Dict[UUID, List[dict]] = {}  # profile_id -> signals (production: database table)
-
-
-# Default gate configuration
-DEFAULT_GATE_CONFIG = {
+# Default gate configuration (read-only: shared by every profile)
+DEFAULT_GATE_CONFIG: Mapping[str, object] = MappingProxyType({
     "min_confidence": Decimal("0.7"),
     "max_daily_signals": 50,
     "max_concurrent_positions": 2,
@@ -55,7 +51,9 @@ DEFAULT_GATE_CONFIG = {
     "no_trade_after_news_minutes": 30,
     "allow_manual_override": True,
     "require_guardian_approval": True,
-}
+})
+
+_ZERO = Decimal("0")
 
 
 class SignalGateService:
@@ -73,89 +71,13 @@ class SignalGateService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    # ==================== Idempotency ====================
-
-    def _get_idempotency_key(self, profile_id: UUID, key: str) -> str:
-        """Create composite idempotency key."""
-        return f"{profile_id}:{key}"
-
-    def _check_idempotency(
-        self, profile_id: UUID, key: str
-    ) -> Optional[SignalResponse]:
-        """
-        Check if signal was already processed.
-
-        Returns cached response if found within 24 hours.
-        """
-        composite_key = self._get_idempotency_key(profile_id, key)
-
-        if composite_key in _idempotency_cache:
-            cached_at, response = _idempotency_cache[composite_key]
-            # Valid for 24 hours
-            if datetime.now(timezone.utc) - cached_at < timedelta(hours=24):
-                return response
-            else:
-                del _idempotency_cache[composite_key]
-
-        return None
-
-    def _cache_response(
-        self, profile_id: UUID, key: str, response: SignalResponse
-    ) -> None:
-        """Cache response for idempotency."""
-        composite_key = self._get_idempotency_key(profile_id, key)
-        _idempotency_cache[composite_key] = (datetime.now(timezone.utc), response)
-
     # ==================== Rate Limiting ====================
 
-    def _get_rate_limit_window(self) -> str:
-        """Get current rate limit window key (1-minute windows)."""
-        now = datetime.now(timezone.utc)
-        return now.strftime("%Y%m%d%H%M")
-
     def check_rate_limit(
         self, profile_id: UUID, max_per_minute: int = 10
     ) -> RateLimitStatus:
         """Check rate limit for profile."""
-        window_key = self._get_rate_limit_window()
-
-        if profile_id not in _rate_limit_windows:
-            _rate_limit_windows[profile_id] = {}
-
-        windows = _rate_limit_windows[profile_id]
-
-        # Clean old windows
-        current_keys = [window_key]
-        for key in list(windows.keys()):
-            if key not in current_keys:
-                del windows[key]
-
-        current_count = windows.get(window_key, 0)
-        remaining = max(0, max_per_minute - current_count)
-
-        # Calculate reset time
-        now = datetime.now(timezone.utc)
-        reset_at = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
-
-        return RateLimitStatus(
-            profile_id=profile_id,
-            window_seconds=60,
-            max_signals=max_per_minute,
-            current_count=current_count,
-            remaining=remaining,
-            reset_at=reset_at,
-            is_limited=remaining == 0,
-        )
-
-    def _increment_rate_limit(self, profile_id: UUID) -> None:
-        """Increment rate limit counter."""
-        window_key = self._get_rate_limit_window()
-
-        if profile_id not in _rate_limit_windows:
-            _rate_limit_windows[profile_id] = {}
-
-        windows = _rate_limit_windows[profile_id]
-        windows[window_key] = windows.get(window_key, 0) + 1
+        return store.rate_limit_status(profile_id, max_per_minute)
 
     # ==================== Decision Hash ====================
 
@@ -174,16 +96,24 @@ class SignalGateService:
         This hash proves the decision was made at this time
         with these exact parameters.
         """
-        data = f"{signal_id}|{profile_id}|{symbol}|{direction}|{decision}|{timestamp.isoformat()}"
-        return hashlib.sha256(data.encode()).hexdigest()[:32]
+        data = b"|".join((
+            signal_id.bytes,
+            profile_id.bytes,
+            symbol.encode(),
+            direction.encode(),
+            decision.encode(),
+            str(int(timestamp.timestamp() * 1_000_000)).encode(),  # microseconds
+        ))
+        # 128-bit digest: BLAKE2b emits it directly (no truncation)
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
 
     # ==================== Gate Checks ====================
 
     async def _check_confidence(
-        self, signal: SignalSubmitRequest, config: dict
+        self, signal: SignalSubmitRequest, config: Mapping[str, object]
     ) -> GateCheckResult:
         """Check minimum confidence threshold."""
-        min_conf = config.get("min_confidence", Decimal("0.7"))
+        min_conf = config.get("min_confidence", DEFAULT_GATE_CONFIG["min_confidence"])
         passed = signal.confidence >= min_conf
 
         return GateCheckResult(
@@ -193,17 +123,27 @@ class SignalGateService:
             details={"required": str(min_conf), "actual": str(signal.confidence)},
         )
 
+    async def _count_open_positions(self, profile_id: UUID) -> int:
+        """Count a profile's open positions."""
+        result = await self.db.execute(
+            select(func.count(Position.id)).where(Position.profile_id == profile_id)
+        )
+        return result.scalar() or 0
+
     async def _check_position_limit(
-        self, profile_id: UUID, config: dict
+        self,
+        profile_id: UUID,
+        config: Mapping[str, object],
+        current: Optional[int] = None,
     ) -> GateCheckResult:
         """Check concurrent position limit."""
-        max_positions = config.get("max_concurrent_positions", 2)
-
-        # Count open positions
-        result = await self.db.execute(
-            select(func.count(Position.id)).where(Position.profile_id == profile_id)
+        max_positions = config.get(
+            "max_concurrent_positions", DEFAULT_GATE_CONFIG["max_concurrent_positions"]
         )
-        current = result.scalar() or 0
+
+        # Count open positions unless the caller already has
+        if current is None:
+            current = await self._count_open_positions(profile_id)
 
         passed = current < max_positions
 
@@ -215,16 +155,18 @@ class SignalGateService:
         )
 
     async def _check_drawdown(
-        self, profile: MT5Profile, config: dict
+        self, profile: MT5Profile, config: Mapping[str, object]
     ) -> GateCheckResult:
         """Check if drawdown is within tradeable range."""
-        max_dd = config.get("max_drawdown_to_trade", Decimal("0.15"))
+        max_dd = config.get(
+            "max_drawdown_to_trade", DEFAULT_GATE_CONFIG["max_drawdown_to_trade"]
+        )
 
         # Calculate current drawdown (simplified)
         if profile.balance and profile.equity and profile.balance > 0:
             current_dd = (profile.balance - profile.equity) / profile.balance
         else:
-            current_dd = Decimal("0")
+            current_dd = _ZERO
 
         passed = current_dd < max_dd
 
@@ -236,21 +178,19 @@ class SignalGateService:
         )
 
     async def _check_daily_limit(
-        self, profile_id: UUID, config: dict
+        self,
+        profile_id: UUID,
+        config: Mapping[str, object],
+        now: Optional[datetime] = None,
     ) -> GateCheckResult:
         """Check daily signal limit."""
-        max_daily = config.get("max_daily_signals", 50)
-
-        # Count today's signals
-        today_start = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0
+        max_daily = config.get(
+            "max_daily_signals", DEFAULT_GATE_CONFIG["max_daily_signals"]
         )
-        signals_today = 0
 
-        if profile_id in _signal_store:
-            for sig in _signal_store[profile_id]:
-                if sig.get("created_at", datetime.min) >= today_start:
-                    signals_today += 1
+        # Today's count, kept by store.store_signal()
+        today = (now or datetime.now(timezone.utc)).date()
+        signals_today = store.signals_on(profile_id, today)
 
         passed = signals_today < max_daily
 
@@ -283,7 +223,9 @@ class SignalGateService:
         self,
         signal: SignalSubmitRequest,
         profile: MT5Profile,
-        config: dict,
+        config: Mapping[str, object],
+        open_positions: Optional[int] = None,
+        now: Optional[datetime] = None,
     ) -> Tuple[bool, List[GateCheckResult]]:
         """
         Run all gate checks.
@@ -292,12 +234,17 @@ class SignalGateService:
         """
         checks = []
 
-        # Required checks
+        # Required checks, awaited in order. Not gathered: none of them
+        # suspends once open_positions is known (_gate_inputs counts it
+        # once per batch), so tasks would only add scheduling cost, and
+        # a fallback count must not run concurrently on the one session.
         checks.append(await self._check_trading_enabled(profile))
         checks.append(await self._check_confidence(signal, config))
-        checks.append(await self._check_position_limit(profile.id, config))
+        checks.append(
+            await self._check_position_limit(profile.id, config, open_positions)
+        )
         checks.append(await self._check_drawdown(profile, config))
-        checks.append(await self._check_daily_limit(profile.id, config))
+        checks.append(await self._check_daily_limit(profile.id, config, now))
 
         # All must pass
         all_passed = all(c.passed for c in checks)
@@ -316,33 +263,80 @@ class SignalGateService:
 
         This is the ONLY path for signal ingress.
         """
+        return await self._submit(profile, signal, {})
+
+    async def submit_batch(
+        self,
+        profile: MT5Profile,
+        signals: List[SignalSubmitRequest],
+    ) -> List[SignalResponse]:
+        """
+        Submit signals for one profile through the gate, in order.
+
+        Each signal is evaluated on its own, but the gate config and
+        open-position count are loaded once for the batch. Signals run
+        one after another so each sees the rate and daily limits left
+        by the ones before it.
+        """
+        batch_inputs: dict = {}
+        return [
+            await self._submit(profile, signal, batch_inputs)
+            for signal in signals
+        ]
+
+    async def _gate_inputs(
+        self, profile_id: UUID, batch_inputs: dict
+    ) -> Tuple[Mapping[str, object], int]:
+        """Load the gate config and open-position count once per batch."""
+        if not batch_inputs:
+            batch_inputs["config"] = await self._get_gate_config_dict(profile_id)
+            batch_inputs["open_positions"] = await self._count_open_positions(
+                profile_id
+            )
+        return batch_inputs["config"], batch_inputs["open_positions"]
+
+    async def _submit(
+        self,
+        profile: MT5Profile,
+        signal: SignalSubmitRequest,
+        batch_inputs: dict,
+    ) -> SignalResponse:
+        """Gate one signal (see submit_signal)."""
+        # Read the clocks once: start_time for expiry and rate-limit
+        # bookkeeping, now for every wall-clock field and check
         start_time = time.monotonic()
+        now = datetime.now(timezone.utc)
 
         # 1. Check idempotency
-        cached = self._check_idempotency(profile.id, signal.idempotency_key)
+        cached = store.cached_response(
+            profile.id, signal.idempotency_key, start_time
+        )
         if cached:
             return cached
 
         # 2. Check rate limit (unless critical priority)
         if signal.priority != SignalPriority.CRITICAL:
-            rate_status = self.check_rate_limit(profile.id)
-            if rate_status.is_limited:
-                response = self._create_rejected_response(
+            if store.is_rate_limited(profile.id, start_time):
+                response = self._create_response(
                     profile.id,
                     signal,
+                    SignalDecision.REJECTED,
                     "Rate limit exceeded",
                     [],
                     start_time,
+                    now,
+                )
+                store.cache_response(
+                    profile.id, signal.idempotency_key, response, start_time
                 )
-                self._cache_response(profile.id, signal.idempotency_key, response)
                 return response
 
-        # 3. Get gate configuration
-        config = await self.get_gate_config(profile.id)
+        # 3. Get gate configuration and open positions (once per batch)
+        config, open_positions = await self._gate_inputs(profile.id, batch_inputs)
 
         # 4. Run gate checks
         all_passed, gate_checks = await self._run_gate_checks(
-            signal, profile, config.model_dump()
+            signal, profile, config, open_positions, now
         )
 
         # 5. Make decision
@@ -355,55 +349,39 @@ class SignalGateService:
             decision_reason = "; ".join(c.reason for c in failed_checks if c.reason)
 
         # 6. Create response with provenance
-        signal_id = uuid4()
-        now = datetime.now(timezone.utc)
-
-        processing_time = int((time.monotonic() - start_time) * 1000)
-
-        response = SignalResponse(
-            id=signal_id,
-            idempotency_key=signal.idempotency_key,
-            profile_id=profile.id,
-            symbol=signal.symbol,
-            direction=signal.direction,
-            source=signal.source,
-            priority=signal.priority,
-            confidence=signal.confidence,
-            decision=decision,
-            decision_reason=decision_reason,
-            decision_at=now,
-            gate_checks=gate_checks,
-            created_at=now,
-            valid_until=signal.valid_until,
-            processing_time_ms=processing_time,
-            strategy_name=signal.strategy_name,
-            model_version=signal.model_version,
+        response = self._create_response(
+            profile.id, signal, decision, decision_reason, gate_checks, start_time, now
         )
 
         # 7. Store for audit
-        self._store_signal(profile.id, response)
+        store.store_signal(profile.id, response)
 
         # 8. Cache for idempotency
-        self._cache_response(profile.id, signal.idempotency_key, response)
+        store.cache_response(
+            profile.id, signal.idempotency_key, response, start_time
+        )
 
         # 9. Increment rate limit
-        self._increment_rate_limit(profile.id)
+        store.take_rate_limit_token(profile.id, now=start_time)
 
         # 10. Broadcast via WebSocket
         await self._broadcast_signal_event(response)
 
         return response
 
-    def _create_rejected_response(
+    def _create_response(
         self,
         profile_id: UUID,
         signal: SignalSubmitRequest,
+        decision: SignalDecision,
         reason: str,
         gate_checks: List[GateCheckResult],
         start_time: float,
+        now: Optional[datetime] = None,
     ) -> SignalResponse:
-        """Create a rejected signal response."""
-        now = datetime.now(timezone.utc)
+        """Create the response recording a signal's gate decision."""
+        if now is None:
+            now = datetime.now(timezone.utc)
         processing_time = int((time.monotonic() - start_time) * 1000)
 
         return SignalResponse(
@@ -415,25 +393,17 @@ class SignalGateService:
             source=signal.source,
             priority=signal.priority,
             confidence=signal.confidence,
-            decision=SignalDecision.REJECTED,
+            decision=decision,
             decision_reason=reason,
             decision_at=now,
             gate_checks=gate_checks,
             created_at=now,
+            valid_until=signal.valid_until,
             processing_time_ms=processing_time,
+            strategy_name=signal.strategy_name,
+            model_version=signal.model_version,
         )
 
-    def _store_signal(self, profile_id: UUID, response: SignalResponse) -> None:
-        """Store signal for audit trail."""
-        if profile_id not in _signal_store:
-            _signal_store[profile_id] = []
-
-        _signal_store[profile_id].append(response.model_dump(mode="json"))
-
-        # Keep last 1000 signals per profile
-        if len(_signal_store[profile_id]) > 1000:
-            _signal_store[profile_id] = _signal_store[profile_id][-1000:]
-
     async def _broadcast_signal_event(self, response: SignalResponse) -> None:
         """Broadcast signal decision via WebSocket."""
         try:
@@ -462,122 +432,51 @@ class SignalGateService:
         page_size: int = 20,
         decision: Optional[SignalDecision] = None,
     ) -> Tuple[List[SignalResponse], int]:
-        """Get signals for a profile."""
-        signals = _signal_store.get(profile_id, [])
-
-        # Filter by decision
-        if decision:
-            signals = [s for s in signals if s.get("decision") == decision.value]
-
-        total = len(signals)
-
-        # Sort by created_at desc
-        signals = sorted(
-            signals,
-            key=lambda s: s.get("created_at", ""),
-            reverse=True,
-        )
-
-        # Paginate
-        start = (page - 1) * page_size
-        end = start + page_size
-        page_signals = signals[start:end]
-
-        return [SignalResponse(**s) for s in page_signals], total
+        """Get signals for a profile, newest first, and the match count."""
+        return store.page_signals(profile_id, page, page_size, decision)
 
     async def get_signal_by_id(
         self, profile_id: UUID, signal_id: UUID
     ) -> Optional[SignalResponse]:
         """Get a specific signal."""
-        signals = _signal_store.get(profile_id, [])
+        return store.get_signal(profile_id, signal_id)
 
-        for sig in signals:
-            if sig.get("id") == str(signal_id):
-                return SignalResponse(**sig)
+    def validate_executable(
+        self, signal: SignalResponse, profile: MT5Profile
+    ) -> Optional[str]:
+        """
+        Check whether a stored signal may be executed now.
 
+        Returns None if it may, else the reason it may not.
+        """
+        if signal.decision != SignalDecision.APPROVED:
+            return f"Cannot execute signal with decision: {signal.decision}"
+        if not profile.is_connected:
+            return "Profile not connected"
+        if not profile.is_trading_enabled:
+            return "Trading not enabled"
         return None
 
     async def get_stats(
         self, profile_id: UUID, hours: int = 24
     ) -> SignalStatsResponse:
         """Get signal statistics for a profile."""
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        signals = _signal_store.get(profile_id, [])
-
-        # Filter to time window
-        recent = [
-            s for s in signals
-            if datetime.fromisoformat(s.get("created_at", "2000-01-01T00:00:00+00:00").replace("Z", "+00:00")) >= cutoff
-        ]
-
-        if not recent:
-            return SignalStatsResponse(profile_id=profile_id, period_hours=hours)
-
-        # Calculate stats
-        total = len(recent)
-        approved = sum(1 for s in recent if s.get("decision") == "approved")
-        rejected = sum(1 for s in recent if s.get("decision") == "rejected")
-        expired = sum(1 for s in recent if s.get("decision") == "expired")
-        executed = sum(1 for s in recent if s.get("decision") == "executed")
-        failed = sum(1 for s in recent if s.get("decision") == "failed")
-
-        # Rates
-        approval_rate = Decimal(str(approved / total * 100)) if total > 0 else Decimal("0")
-        execution_rate = Decimal(str(executed / approved * 100)) if approved > 0 else Decimal("0")
-
-        # Average confidence
-        confidences = [Decimal(str(s.get("confidence", 0))) for s in recent]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else Decimal("0")
-
-        # Average processing time
-        times = [s.get("processing_time_ms", 0) for s in recent]
-        avg_time = sum(times) // len(times) if times else 0
-
-        # By source
-        by_source: Dict[str, int] = {}
-        for s in recent:
-            source = s.get("source", "unknown")
-            by_source[source] = by_source.get(source, 0) + 1
-
-        # Top rejection reasons
-        rejection_reasons: Dict[str, int] = {}
-        for s in recent:
-            if s.get("decision") == "rejected":
-                reason = s.get("decision_reason", "unknown")
-                rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-
-        top_reasons = sorted(
-            [{"reason": k, "count": v} for k, v in rejection_reasons.items()],
-            key=lambda x: x["count"],
-            reverse=True,
-        )[:5]
-
-        return SignalStatsResponse(
-            profile_id=profile_id,
-            period_hours=hours,
-            total_signals=total,
-            approved=approved,
-            rejected=rejected,
-            expired=expired,
-            executed=executed,
-            failed=failed,
-            approval_rate=approval_rate.quantize(Decimal("0.01")),
-            execution_rate=execution_rate.quantize(Decimal("0.01")),
-            avg_confidence=avg_confidence.quantize(Decimal("0.001")),
-            avg_processing_time_ms=avg_time,
-            by_source=by_source,
-            top_rejection_reasons=top_reasons,
-        )
+        return store.signal_stats(profile_id, hours)
 
     # ==================== Configuration ====================
 
-    async def get_gate_config(self, profile_id: UUID) -> GateConfigResponse:
-        """Get gate configuration for a profile."""
+    async def _get_gate_config_dict(self, profile_id: UUID) -> Mapping[str, object]:
+        """Get a profile's gate settings as a read-only mapping (for checks)."""
         # In production, this would come from database
         # For now, return defaults
-        return GateConfigResponse(
+        return DEFAULT_GATE_CONFIG
+
+    async def get_gate_config(self, profile_id: UUID) -> GateConfigResponse:
+        """Get gate configuration for a profile."""
+        # The settings are trusted, so skip validation (model_construct)
+        return GateConfigResponse.model_construct(
             profile_id=profile_id,
-            **DEFAULT_GATE_CONFIG,
+            **await self._get_gate_config_dict(profile_id),
         )
 
     async def update_gate_config(
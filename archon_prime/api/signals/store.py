@@ -0,0 +1,266 @@
+"""
+Signal Stores
+
+In-memory idempotency cache, rate-limit buckets, signal history and
+daily counts shared by every SignalGateService, with the reads the
+service runs over them. Production would back these with Redis and a
+database table.
+"""
+
+import time
+from collections import Counter, OrderedDict, deque
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from archon_prime.api.config import settings
+from archon_prime.api.signals.schemas import (
+    RateLimitStatus,
+    SignalDecision,
+    SignalResponse,
+    SignalStatsResponse,
+)
+
+# (profile_id, idempotency_key) -> (expires_at, response), least recently
+# used first. Bounded by SIGNAL_IDEMPOTENCY_CACHE_SIZE; expired entries
+# are dropped when looked up.
+_idempotency_cache: "OrderedDict[Tuple[UUID, str], Tuple[float, SignalResponse]]" = (
+    OrderedDict()
+)
+_rate_limit_buckets: Dict[UUID, List[float]] = {}  # profile_id -> [tokens, last_refill (monotonic)]
+_signal_store: Dict[UUID, Deque[SignalResponse]] = {}  # profile_id -> signals (production: database table)
+_signal_index: Dict[UUID, Dict[UUID, SignalResponse]] = {}  # profile_id -> {signal_id: signal}
+_daily_counts: Dict[UUID, list] = {}  # profile_id -> [UTC date, signals stored that day]
+
+# Signals kept per profile; older ones are dropped
+SIGNALS_PER_PROFILE = 1000
+
+# Decimal constants, built once instead of parsed per call
+_ZERO = Decimal("0")
+_CENTS = Decimal("0.01")
+_THOUSANDTHS = Decimal("0.001")
+
+
+# ==================== Idempotency ====================
+
+
+def cached_response(
+    profile_id: UUID, key: str, now: Optional[float] = None
+) -> Optional[SignalResponse]:
+    """
+    Get the response already given for an idempotency key.
+
+    Entries live for SIGNAL_IDEMPOTENCY_TTL_SEC (24 hours by default).
+    now is a time.monotonic() reading, taken here if not given.
+    """
+    composite_key = (profile_id, key)
+
+    entry = _idempotency_cache.get(composite_key)
+    if entry is None:
+        return None
+    if entry[0] <= (time.monotonic() if now is None else now):
+        del _idempotency_cache[composite_key]
+        return None
+    _idempotency_cache.move_to_end(composite_key)
+    return entry[1]
+
+
+def cache_response(
+    profile_id: UUID,
+    key: str,
+    response: SignalResponse,
+    now: Optional[float] = None,
+) -> None:
+    """Cache response for idempotency (now: time.monotonic())."""
+    composite_key = (profile_id, key)
+    if now is None:
+        now = time.monotonic()
+    expires_at = now + settings.SIGNAL_IDEMPOTENCY_TTL_SEC
+    _idempotency_cache[composite_key] = (expires_at, response)
+    _idempotency_cache.move_to_end(composite_key)
+    if len(_idempotency_cache) > settings.SIGNAL_IDEMPOTENCY_CACHE_SIZE:
+        _idempotency_cache.popitem(last=False)
+
+
+# ==================== Rate Limiting ====================
+
+
+def rate_limit_bucket(
+    profile_id: UUID, max_per_minute: int, now: Optional[float] = None
+) -> List[float]:
+    """
+    Refill and return a profile's token bucket.
+
+    The bucket holds up to max_per_minute tokens and refills at
+    max_per_minute per 60 seconds, lazily on access. now is a
+    time.monotonic() reading, taken here if not given.
+    """
+    if now is None:
+        now = time.monotonic()
+    bucket = _rate_limit_buckets.get(profile_id)
+    if bucket is None:
+        bucket = _rate_limit_buckets[profile_id] = [float(max_per_minute), now]
+    else:
+        refill = (now - bucket[1]) * max_per_minute / 60.0
+        bucket[0] = min(float(max_per_minute), bucket[0] + refill)
+        bucket[1] = now
+    return bucket
+
+
+def rate_limit_status(profile_id: UUID, max_per_minute: int = 10) -> RateLimitStatus:
+    """Report a profile's token bucket as a rate-limit status."""
+    tokens = rate_limit_bucket(profile_id, max_per_minute)[0]
+    remaining = int(tokens)
+
+    # When the bucket will be full again
+    refill_seconds = (max_per_minute - tokens) * 60.0 / max_per_minute
+    reset_at = datetime.now(timezone.utc) + timedelta(seconds=refill_seconds)
+
+    return RateLimitStatus(
+        profile_id=profile_id,
+        window_seconds=60,
+        max_signals=max_per_minute,
+        current_count=max_per_minute - remaining,
+        remaining=remaining,
+        reset_at=reset_at,
+        is_limited=remaining == 0,
+    )
+
+
+def is_rate_limited(profile_id: UUID, now: float, max_per_minute: int = 10) -> bool:
+    """Whether a profile has no token left (no status object built)."""
+    return rate_limit_bucket(profile_id, max_per_minute, now)[0] < 1.0
+
+
+def take_rate_limit_token(
+    profile_id: UUID,
+    max_per_minute: int = 10,
+    now: Optional[float] = None,
+) -> None:
+    """Take a token for a processed signal (never below zero)."""
+    bucket = rate_limit_bucket(profile_id, max_per_minute, now)
+    bucket[0] = max(0.0, bucket[0] - 1.0)
+
+
+# ==================== Signal History ====================
+
+
+def store_signal(profile_id: UUID, response: SignalResponse) -> None:
+    """Store signal for audit trail."""
+    if profile_id not in _signal_store:
+        _signal_store[profile_id] = deque(maxlen=SIGNALS_PER_PROFILE)
+        _signal_index[profile_id] = {}
+    signals = _signal_store[profile_id]
+    index = _signal_index[profile_id]
+
+    # Store the response itself; JSON is only produced for the API.
+    # A full deque drops its oldest signal on append.
+    if len(signals) == SIGNALS_PER_PROFILE:
+        index.pop(signals[0].id, None)
+    signals.append(response)
+    index[response.id] = response
+
+    # Count toward the daily limit, starting over each UTC day
+    day = response.created_at.date()
+    entry = _daily_counts.setdefault(profile_id, [day, 0])
+    if entry[0] != day:
+        entry[:] = [day, 0]
+    entry[1] += 1
+
+
+def signals_on(profile_id: UUID, day: date) -> int:
+    """Signals a profile stored on a UTC day (0 once the day has passed)."""
+    entry = _daily_counts.get(profile_id)
+    return entry[1] if entry is not None and entry[0] == day else 0
+
+
+def page_signals(
+    profile_id: UUID,
+    page: int,
+    page_size: int,
+    decision: Optional[SignalDecision] = None,
+) -> Tuple[List[SignalResponse], int]:
+    """
+    Get a page of a profile's signals, newest first, and the match count.
+
+    Signals are stored in arrival order, so pages are read from the
+    end of the store without sorting.
+    """
+    signals = _signal_store.get(profile_id, ())
+    start = (page - 1) * page_size
+    end = start + page_size
+
+    if decision is None:
+        return list(islice(reversed(signals), start, end)), len(signals)
+
+    # One pass: count every match, keep those on this page
+    total = 0
+    matches = []
+    for s in reversed(signals):
+        if s.decision == decision:
+            if start <= total < end:
+                matches.append(s)
+            total += 1
+    return matches, total
+
+
+def get_signal(profile_id: UUID, signal_id: UUID) -> Optional[SignalResponse]:
+    """Get a specific signal."""
+    return _signal_index.get(profile_id, {}).get(signal_id)
+
+
+def signal_stats(profile_id: UUID, hours: int = 24) -> SignalStatsResponse:
+    """Aggregate a profile's signals from the last `hours` hours."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+    # One pass, newest first; signals are stored in arrival order,
+    # so the first one older than the cutoff ends the window
+    decisions: Counter = Counter()
+    by_source: Counter = Counter()
+    rejection_reasons: Counter = Counter()
+    confidence_sum = _ZERO
+    time_sum = 0
+    for s in reversed(_signal_store.get(profile_id, ())):
+        if s.created_at < cutoff:
+            break
+        decisions[s.decision] += 1
+        by_source[s.source.value] += 1
+        if s.decision == SignalDecision.REJECTED:
+            rejection_reasons[s.decision_reason or "unknown"] += 1
+        confidence_sum += s.confidence
+        time_sum += s.processing_time_ms or 0
+
+    total = sum(decisions.values())
+    if not total:
+        return SignalStatsResponse(profile_id=profile_id, period_hours=hours)
+
+    approved = decisions[SignalDecision.APPROVED]
+    executed = decisions[SignalDecision.EXECUTED]
+
+    # Rates
+    approval_rate = Decimal(str(approved / total * 100))
+    execution_rate = Decimal(str(executed / approved * 100)) if approved > 0 else _ZERO
+
+    top_reasons = [
+        {"reason": reason, "count": count}
+        for reason, count in rejection_reasons.most_common(5)
+    ]
+
+    return SignalStatsResponse(
+        profile_id=profile_id,
+        period_hours=hours,
+        total_signals=total,
+        approved=approved,
+        rejected=decisions[SignalDecision.REJECTED],
+        expired=decisions[SignalDecision.EXPIRED],
+        executed=executed,
+        failed=decisions[SignalDecision.FAILED],
+        approval_rate=approval_rate.quantize(_CENTS),
+        execution_rate=execution_rate.quantize(_CENTS),
+        avg_confidence=(confidence_sum / total).quantize(_THOUSANDTHS),
+        avg_processing_time_ms=time_sum // total,
+        by_source=dict(by_source),
+        top_rejection_reasons=top_reasons,
+    )
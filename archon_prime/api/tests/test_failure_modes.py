@@ -331,14 +331,11 @@ async def test_reconciliation_worker_handles_exceptions():
     worker = PositionReconciliationWorker(interval_seconds=1)
 
     with patch.object(worker, "_reconcile_all", side_effect=Exception("Reconciliation failed")):
-        await worker.start()
-        await asyncio.sleep(0.1)
-        await worker.stop()
+        await worker.run_once()
 
-    # Worker should have tracked the error
+    # Worker should have tracked the error instead of crashing
     stats = worker.get_stats()
-    # Error count may or may not increment depending on timing
-    # Key assertion: worker didn't crash
+    assert stats.error_count == 1
 
 
 @pytest.mark.asyncio
@@ -350,12 +347,10 @@ async def test_account_sync_worker_handles_disconnection():
 
     with patch("archon_prime.api.services.mt5_pool.get_mt5_pool") as mock_pool:
         pool = MagicMock()
-        pool.get_all_connections = MagicMock(return_value={})
+        pool.snapshot = MagicMock(return_value={})
         mock_pool.return_value = pool
 
-        await worker.start()
-        await asyncio.sleep(0.1)
-        await worker.stop()
+        await worker.run_once()
 
     # Worker completed without crash
     stats = worker.get_stats()
@@ -378,9 +373,8 @@ async def test_signal_expiration_worker_continues_after_error():
         return
 
     with patch.object(worker, "_expire_stale_signals", side_effect=failing_then_working):
-        await worker.start()
-        await asyncio.sleep(0.1)
-        await worker.stop()
+        for _ in range(3):
+            await worker.run_once()
 
     # Worker should have continued running despite errors
     stats = worker.get_stats()
@@ -546,7 +540,7 @@ async def test_background_worker_cleanup_on_shutdown():
 
     with patch("archon_prime.api.services.mt5_pool.get_mt5_pool") as mock_pool:
         pool = MagicMock()
-        pool.get_all_connections = MagicMock(return_value={})
+        pool.snapshot = MagicMock(return_value={})
         pool.get_stats = MagicMock(return_value=MagicMock(
             active_connections=0, failed_connections=0
         ))
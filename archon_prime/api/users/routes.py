@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from archon_prime.api.db.session import get_db
 from archon_prime.api.db.models import User
-from archon_prime.api.dependencies import get_current_user
+from archon_prime.api.dependencies import get_current_user, invalidate_user_cache
 from archon_prime.api.auth.schemas import UserResponse, MessageResponse
 from archon_prime.api.auth.service import AuthService
 
@@ -75,6 +75,7 @@ async def update_me(
 
     await db.commit()
     await db.refresh(user)
+    invalidate_user_cache(user.id)
 
     return UserResponse.model_validate(user)
 
@@ -105,5 +106,6 @@ async def change_password(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
+    invalidate_user_cache(user.id)
 
     return MessageResponse(message="Password changed successfully")
@@ -53,6 +53,15 @@ class ClientConnection:
             logger.error(f"Failed to send to client {self.client_id}: {e}")
             return False
 
+    async def send_encoded(self, payload: str) -> bool:
+        """Send an event already serialized to JSON text."""
+        try:
+            await self.websocket.send_text(payload)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send to client {self.client_id}: {e}")
+            return False
+
     async def send_json(self, data: dict) -> bool:
         """Send raw JSON data."""
         try:
@@ -220,48 +229,74 @@ class ConnectionManager:
         """
         Broadcast an event to all clients connected to a profile.
 
+        The event is serialized once and sent to every client.
+
         Args:
             profile_id: Target profile ID
             event: Event to broadcast
             exclude_client: Optional client ID to exclude
         """
+        await self.broadcast_encoded(
+            profile_id, event.model_dump_json(), exclude_client
+        )
+
+    async def broadcast_encoded(
+        self,
+        profile_id: UUID,
+        payload: str,
+        exclude_client: Optional[str] = None,
+    ):
+        """
+        Send a pre-serialized event to all clients connected to a profile.
+
+        Sends to the profile's clients run concurrently.
+
+        Args:
+            profile_id: Target profile ID
+            payload: Event serialized to JSON text
+            exclude_client: Optional client ID to exclude
+        """
         async with self._lock:
-            connections = self._connections.get(profile_id, [])
+            connections = [
+                conn
+                for conn in self._connections.get(profile_id, [])
+                if not (exclude_client and conn.client_id == exclude_client)
+            ]
 
-        failed_clients = []
-        for conn in connections:
-            if exclude_client and conn.client_id == exclude_client:
-                continue
+        if not connections:
+            return
 
-            success = await conn.send_event(event)
-            if not success:
-                failed_clients.append(conn.client_id)
+        results = await asyncio.gather(
+            *(conn.send_encoded(payload) for conn in connections)
+        )
 
         # Clean up failed connections
-        for client_id in failed_clients:
-            await self.disconnect(client_id)
+        for conn, success in zip(connections, results, strict=True):
+            if not success:
+                await self.disconnect(conn.client_id)
 
     async def broadcast_to_user(self, user_id: UUID, event: BaseEvent):
         """Broadcast an event to all connections for a user."""
         async with self._lock:
-            profile_ids = self._user_profiles.get(user_id, set())
+            profile_ids = list(self._user_profiles.get(user_id, ()))
 
+        payload = event.model_dump_json()
         for profile_id in profile_ids:
-            await self.broadcast_to_profile(profile_id, event)
+            await self.broadcast_encoded(profile_id, payload)
 
     async def broadcast_to_all(self, event: BaseEvent):
         """Broadcast an event to all connected clients."""
         async with self._lock:
             all_clients = list(self._clients.values())
 
-        failed_clients = []
-        for conn in all_clients:
-            success = await conn.send_event(event)
-            if not success:
-                failed_clients.append(conn.client_id)
+        payload = event.model_dump_json()
+        results = await asyncio.gather(
+            *(conn.send_encoded(payload) for conn in all_clients)
+        )
 
-        for client_id in failed_clients:
-            await self.disconnect(client_id)
+        for conn, success in zip(all_clients, results, strict=True):
+            if not success:
+                await self.disconnect(conn.client_id)
 
     async def send_to_client(self, client_id: str, event: BaseEvent) -> bool:
         """Send an event to a specific client."""
@@ -307,7 +342,7 @@ class ConnectionManager:
 
                 for client_id, conn in all_clients:
                     # Check if connection is stale (no ping in 2 minutes)
-                    if (now - conn.last_ping).seconds > 120:
+                    if (now - conn.last_ping).total_seconds() > 120:
                         stale_clients.append(client_id)
                     else:
                         # Send ping
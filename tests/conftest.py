@@ -10,6 +10,12 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timezone
 
+from archon_prime.api.compliance.provenance import (
+    DecisionSource,
+    DecisionType,
+    ProvenanceTracker,
+)
+
 
 @pytest.fixture
 def sample_returns():
@@ -75,3 +81,34 @@ def pip_value():
 def stop_distance():
     """Standard stop distance in pips."""
     return 50.0
+
+
+@pytest.fixture
+def provenance_tracker():
+    """Create a tracker with one chain of three decisions."""
+    tracker = ProvenanceTracker()
+    tracker.start_chain(
+        "sig_1",
+        DecisionType.SIGNAL_GENERATED,
+        DecisionSource.AI_AGENT,
+        {"symbol": "EURUSD", "features": {"rsi": 71.2}},
+        "Momentum breakout",
+        confidence=0.82,
+    )
+    tracker.add_decision(
+        "sig_1",
+        DecisionType.GATE_PASSED,
+        DecisionSource.SIGNAL_GATE,
+        {"checks": 5},
+        {"passed": True},
+        "All gate checks passed",
+    )
+    tracker.add_decision(
+        "sig_1",
+        DecisionType.POSITION_OPENED,
+        DecisionSource.POSITION_MANAGER,
+        {"volume": 0.1},
+        {"ticket": 1001},
+        "Order filled",
+    )
+    return tracker
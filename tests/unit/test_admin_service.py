@@ -0,0 +1,83 @@
+"""
+Tests for ARCHON PRIME Admin Service
+=====================================
+
+Tests the admin user listing.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from archon_prime.api.admin.service import AdminService
+from archon_prime.api.db.models import MT5Profile, User
+
+
+@pytest.fixture
+async def db():
+    """In-memory SQLite session with the users and profiles tables."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.__table__.create)
+        await conn.run_sync(MT5Profile.__table__.create)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def users(db):
+    """Three users holding two, one and no profiles."""
+    users = [
+        User(email=f"user{i}@example.com", password_hash="x") for i in range(3)
+    ]
+    db.add_all(users)
+    await db.flush()
+
+    for i, (owner, status, balance) in enumerate(
+        [
+            (users[0], "connected", "100.00"),
+            (users[0], "disconnected", "50.50"),
+            (users[1], "disconnected", "10.00"),
+        ]
+    ):
+        db.add(
+            MT5Profile(
+                user_id=owner.id,
+                name=f"Profile {i}",
+                broker_server="Demo-Server",
+                mt5_login=1000 + i,
+                mt5_password_encrypted=b"secret",
+                connection_status=status,
+                balance=Decimal(balance),
+            )
+        )
+    await db.commit()
+    return users
+
+
+class TestGetUsers:
+    """Tests for AdminService.get_users."""
+
+    async def test_profile_stats_in_one_query(self, db, users):
+        """Profile counts for the whole page should take one query."""
+        statements = []
+        event.listen(
+            db.bind.sync_engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+
+        responses, total = await AdminService(db).get_users()
+        by_email = {r.email: r for r in responses}
+
+        assert total == 3
+        assert len(statements) == 3
+        assert by_email["user0@example.com"].profile_count == 2
+        assert by_email["user0@example.com"].connected_profile_count == 1
+        assert by_email["user0@example.com"].total_balance == Decimal("150.50")
+        assert by_email["user1@example.com"].connected_profile_count == 0
+        assert by_email["user2@example.com"].profile_count == 0
+        assert by_email["user2@example.com"].total_balance == Decimal("0")
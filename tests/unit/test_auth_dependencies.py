@@ -0,0 +1,246 @@
+"""
+Tests for ARCHON PRIME Auth Dependencies
+=========================================
+
+Tests caching of access token verification and user lookups.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from archon_prime.api import dependencies
+from archon_prime.api.auth.jwt import create_access_token, create_refresh_token
+from archon_prime.api.config import settings
+from archon_prime.api.db.models import MT5Profile, User
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start each test with an empty token cache."""
+    dependencies._token_cache.clear()
+    yield
+    dependencies._token_cache.clear()
+
+
+@pytest.fixture
+def verify_calls(monkeypatch):
+    """Count calls to the underlying token verification."""
+    calls = []
+    verify = dependencies.verify_token
+
+    def counting_verify(token, token_type="access"):
+        calls.append(token)
+        return verify(token, token_type)
+
+    monkeypatch.setattr(dependencies, "verify_token", counting_verify)
+    return calls
+
+
+def bearer(user_id):
+    """Bearer credentials for a user."""
+    return HTTPAuthorizationCredentials(
+        scheme="Bearer",
+        credentials=create_access_token(user_id, "user@example.com"),
+    )
+
+
+def count_statements(db):
+    """Record SQL statements executed on the session's engine."""
+    statements = []
+    event.listen(
+        db.bind.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
+
+
+class TestTokenCache:
+    """Tests for _cached_verify."""
+
+    def test_valid_token_verified_once(self, verify_calls):
+        """Repeated lookups of a valid token should hit the cache."""
+        user_id = uuid4()
+        token = create_access_token(user_id, "user@example.com")
+
+        first = dependencies._cached_verify(token, "access")
+        second = dependencies._cached_verify(token, "access")
+
+        assert first["sub"] == str(user_id)
+        assert first["_sub_uuid"] == user_id
+        assert second is first
+        assert len(verify_calls) == 1
+
+    def test_cached_payload_read_only(self):
+        """Callers should not be able to change a cached payload."""
+        token = create_access_token(uuid4(), "user@example.com")
+        payload = dependencies._cached_verify(token, "access")
+
+        with pytest.raises(TypeError):
+            payload["sub"] = str(uuid4())
+        assert dependencies._cached_verify(token, "access") == payload
+
+    def test_invalid_token_not_cached(self, verify_calls):
+        """Failed verifications should be retried, not cached."""
+        assert dependencies._cached_verify("not-a-token", "access") is None
+        assert dependencies._cached_verify("not-a-token", "access") is None
+        assert len(verify_calls) == 2
+        assert not dependencies._token_cache
+
+    def test_malformed_subject_rejected(self):
+        """Tokens whose subject is not a UUID should fail verification."""
+        token = jwt.encode(
+            {
+                "sub": "not-a-uuid",
+                "type": "access",
+                "exp": datetime.now(timezone.utc) + timedelta(minutes=5),
+            },
+            settings.JWT_SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM,
+        )
+        assert dependencies._cached_verify(token, "access") is None
+        assert not dependencies._token_cache
+
+    def test_token_type_checked(self):
+        """A refresh token should not pass as an access token."""
+        token = create_refresh_token(uuid4())
+        assert dependencies._cached_verify(token, "refresh") is not None
+        assert dependencies._cached_verify(token, "access") is None
+
+    def test_expired_entry_reverified(self, verify_calls, monkeypatch):
+        """Entries past the cache TTL should be verified again."""
+        token = create_access_token(uuid4(), "user@example.com")
+        dependencies._cached_verify(token, "access")
+
+        now = dependencies.time.time()
+        monkeypatch.setattr(dependencies.time, "time", lambda: now + 60)
+        dependencies._cached_verify(token, "access")
+
+        assert len(verify_calls) == 2
+
+
+@pytest.fixture
+async def db():
+    """In-memory SQLite session with the users and profiles tables."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.__table__.create)
+        await conn.run_sync(MT5Profile.__table__.create)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def user(db):
+    """An active user row."""
+    user = User(email="user@example.com", password_hash="x", is_active=True)
+    db.add(user)
+    await db.commit()
+    dependencies._user_cache.clear()
+    yield user
+    dependencies._user_cache.clear()
+
+
+class TestUserCache:
+    """Tests for the cached user lookup in get_current_user."""
+
+    async def test_cached_user_skips_select(self, db, user):
+        """A second lookup should not query the database."""
+        statements = count_statements(db)
+
+        first = await dependencies._load_user(db, user.id)
+        db.expunge_all()
+        second = await dependencies._load_user(db, user.id)
+
+        assert first.id == second.id == user.id
+        assert second.email == "user@example.com"
+        assert len(statements) == 1
+
+    async def test_cached_user_can_be_updated(self, db, user):
+        """Merged cached users should persist changes on commit."""
+        await dependencies._load_user(db, user.id)
+        db.expunge_all()
+
+        cached = await dependencies._load_user(db, user.id)
+        cached.first_name = "Ada"
+        await db.commit()
+        dependencies.invalidate_user_cache(user.id)
+        db.expunge_all()
+
+        reloaded = await dependencies._load_user(db, user.id)
+        assert reloaded.first_name == "Ada"
+
+    async def test_inactive_user_not_cached(self, db, user):
+        """Inactive users should always be read from the database."""
+        user.is_active = False
+        await db.commit()
+
+        assert not (await dependencies._load_user(db, user.id)).is_active
+        assert user.id not in dependencies._user_cache
+
+
+class TestProfileAccess:
+    """Tests for get_profile_with_access."""
+
+    @pytest.fixture
+    async def profile(self, db, user):
+        """A profile owned by the test user."""
+        profile = MT5Profile(
+            user_id=user.id,
+            name="Main",
+            broker_server="Demo-Server",
+            mt5_login=12345,
+            mt5_password_encrypted=b"secret",
+        )
+        db.add(profile)
+        await db.commit()
+        db.expunge_all()
+        return profile
+
+    async def test_owner_loaded_in_one_query(self, db, user, profile):
+        """User and profile should be read with a single statement."""
+        statements = count_statements(db)
+        loaded = await dependencies.get_profile_with_access(
+            profile.id, bearer(user.id), db
+        )
+        assert loaded.id == profile.id
+        assert len(statements) == 1
+
+    async def test_other_user_denied(self, db, user, profile):
+        """Users should not reach profiles they do not own."""
+        other = User(email="other@example.com", password_hash="x", is_active=True)
+        db.add(other)
+        await db.commit()
+
+        with pytest.raises(HTTPException) as exc:
+            await dependencies.get_profile_with_access(profile.id, bearer(other.id), db)
+        assert exc.value.status_code == 403
+
+    async def test_missing_profile(self, db, user):
+        """Unknown profile ids should give 404, with and without a cached user."""
+        for cached in (False, True):
+            if cached:
+                await dependencies._load_user(db, user.id)
+            with pytest.raises(HTTPException) as exc:
+                await dependencies.get_profile_with_access(uuid4(), bearer(user.id), db)
+            assert exc.value.status_code == 404
+
+    async def test_join_selects_only_access_columns(self, db, user, profile):
+        """The uncached path should not read full user rows."""
+        statements = count_statements(db)
+        await dependencies.get_profile_with_access(profile.id, bearer(user.id), db)
+        assert "password_hash" not in statements[0]
+
+    async def test_unknown_user_rejected(self, db, profile):
+        """Tokens for users that do not exist should give 401."""
+        with pytest.raises(HTTPException) as exc:
+            await dependencies.get_profile_with_access(profile.id, bearer(uuid4()), db)
+        assert exc.value.status_code == 401
@@ -0,0 +1,498 @@
+"""
+Tests for ARCHON PRIME Background Workers
+==========================================
+
+Tests batched position loading, batched account persistence,
+concurrent per-profile work, worker scheduling and reconnect backoff.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from archon_prime.api.db.models import MT5Profile, Position, User
+from archon_prime.api.services import (
+    background_tasks,
+    batch,
+    batch_fetch_positions,
+    batch_update_account_info,
+    connection_health,
+    worker_base,
+)
+
+
+@pytest.fixture
+async def session_maker():
+    """In-memory SQLite session maker with the position tables."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (User, MT5Profile, Position):
+            await conn.run_sync(model.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def profile_ids(session_maker):
+    """Three profile IDs; the first two hold positions."""
+    ids = [uuid4() for _ in range(3)]
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        (ids[0], 1, "open"),
+        (ids[0], 2, "open"),
+        (ids[0], 3, "closed"),
+        (ids[1], 4, "open"),
+    ]
+    async with session_maker() as session:
+        for profile_id, ticket, status in rows:
+            session.add(
+                Position(
+                    profile_id=profile_id,
+                    ticket=ticket,
+                    symbol="EURUSD",
+                    direction=1,
+                    volume=0.1,
+                    entry_price=1.1,
+                    status=status,
+                    opened_at=now,
+                )
+            )
+        await session.commit()
+    return ids
+
+
+def count_statements(session_maker):
+    """Record SQL statements executed through a session maker."""
+    statements = []
+    event.listen(
+        session_maker.kw["bind"].sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
+
+
+class TestBatchFetchPositions:
+    """Tests for batch_fetch_positions."""
+
+    async def test_groups_open_positions_by_profile(self, session_maker, profile_ids):
+        """Open positions should be grouped per profile in one query."""
+        statements = count_statements(session_maker)
+        async with session_maker() as session:
+            grouped = await batch_fetch_positions(session, profile_ids)
+
+        assert sorted(p.ticket for p in grouped[profile_ids[0]]) == [1, 2]
+        assert [p.ticket for p in grouped[profile_ids[1]]] == [4]
+        assert grouped[profile_ids[2]] == []
+        assert len(statements) == 1
+
+    async def test_all_statuses(self, session_maker, profile_ids):
+        """status=None should include closed positions."""
+        async with session_maker() as session:
+            grouped = await batch_fetch_positions(
+                session, [profile_ids[0]], status=None
+            )
+        assert len(grouped[profile_ids[0]]) == 3
+
+    async def test_no_profiles_skips_query(self, session_maker):
+        """An empty profile set should not touch the database."""
+        statements = count_statements(session_maker)
+        async with session_maker() as session:
+            assert await batch_fetch_positions(session, []) == {}
+        assert statements == []
+
+
+class TestBatchUpdateAccountInfo:
+    """Tests for batch_update_account_info."""
+
+    @pytest.fixture
+    async def accounts(self, session_maker):
+        """Account snapshots for two stored profiles."""
+        async with session_maker() as session:
+            user = User(email="user@example.com", password_hash="x")
+            session.add(user)
+            await session.flush()
+            profiles = [
+                MT5Profile(
+                    user_id=user.id,
+                    name=f"Profile {i}",
+                    broker_server="Demo-Server",
+                    mt5_login=1000 + i,
+                    mt5_password_encrypted=b"secret",
+                )
+                for i in range(2)
+            ]
+            session.add_all(profiles)
+            await session.commit()
+
+        return {
+            profile.id: SimpleNamespace(
+                connected=True, balance=100.0 * (i + 1), equity=90.0 * (i + 1)
+            )
+            for i, profile in enumerate(profiles)
+        }
+
+    async def read_balances(self, session_maker):
+        """Stored balances and sync times, keyed by profile ID."""
+        async with session_maker() as session:
+            result = await session.execute(
+                select(MT5Profile.id, MT5Profile.balance, MT5Profile.last_sync_at)
+            )
+            return {row.id: row for row in result}
+
+    async def test_updates_all_profiles_in_one_statement(
+        self, session_maker, accounts
+    ):
+        """Every profile should be written by a single executemany."""
+        statements = count_statements(session_maker)
+        async with session_maker() as session:
+            await batch_update_account_info(session, accounts)
+            await session.commit()
+
+        assert len(statements) == 1
+        rows = await self.read_balances(session_maker)
+        for profile_id, account in accounts.items():
+            assert float(rows[profile_id].balance) == account.balance
+            assert rows[profile_id].last_sync_at is not None
+
+    def test_columns_mapped_on_model(self):
+        """Every synced column should exist on MT5Profile."""
+        assert set(batch.ACCOUNT_INFO_COLUMNS) <= set(MT5Profile.__table__.c.keys())
+
+    def test_postgres_statement_independent_of_row_count(self):
+        """PostgreSQL should get one UPDATE over unnest()ed array parameters."""
+        sql = str(batch._update_from_arrays().compile(dialect=postgresql.dialect()))
+        account = SimpleNamespace(balance=1.0, equity=2.0)
+        params = batch._array_params(
+            batch._account_info_rows({uuid4(): account, uuid4(): account})
+        )
+
+        assert "FROM unnest(" in sql
+        assert "balance=v.balance, equity=v.equity" in sql
+        assert "WHERE mt5_profiles.id = v.id" in sql
+        assert "last_sync_at=now()" in sql
+        assert params["balance_values"] == [1.0, 1.0]
+        assert len(params["ids"]) == 2
+
+    async def test_account_sync_persists_once(
+        self, session_maker, accounts, monkeypatch
+    ):
+        """The account sync worker should persist with one statement."""
+        broadcasts = []
+
+        async def account_update(profile_id, **fields):
+            broadcasts.append(profile_id)
+
+        for account in accounts.values():
+            account.margin = account.free_margin = account.margin_level = 0.0
+        monkeypatch.setattr(
+            background_tasks, "get_session_maker", lambda: session_maker
+        )
+        worker = background_tasks.AccountSyncWorker(
+            pool_getter=lambda: SimpleNamespace(snapshot=lambda: accounts),
+            broadcaster_getter=lambda: SimpleNamespace(account_update=account_update),
+        )
+        statements = count_statements(session_maker)
+
+        await worker._sync_all()
+
+        assert len(statements) == 1
+        assert sorted(broadcasts) == sorted(accounts)
+
+    async def test_persist_failure_still_broadcasts(self, accounts, monkeypatch):
+        """A failed UPDATE should be recorded without skipping the broadcasts."""
+        broadcasts = []
+
+        async def account_update(profile_id, **fields):
+            broadcasts.append(profile_id)
+
+        def broken_session_maker():
+            raise RuntimeError("database unavailable")
+
+        for account in accounts.values():
+            account.margin = account.free_margin = account.margin_level = 0.0
+        monkeypatch.setattr(
+            background_tasks, "get_session_maker", broken_session_maker
+        )
+        worker = background_tasks.AccountSyncWorker(
+            pool_getter=lambda: SimpleNamespace(snapshot=lambda: accounts),
+            broadcaster_getter=lambda: SimpleNamespace(account_update=account_update),
+        )
+
+        await worker.run_once()
+
+        assert sorted(broadcasts) == sorted(accounts)
+        assert worker.get_stats().error_count == 1
+        assert worker.get_stats().last_error == "database unavailable"
+
+
+class TestReconcileAll:
+    """Tests for PositionReconciliationWorker._reconcile_all."""
+
+    async def test_one_query_for_all_profiles(
+        self, session_maker, profile_ids, monkeypatch
+    ):
+        """Connected profiles should share one position query."""
+        connections = {
+            profile_ids[0]: SimpleNamespace(connected=True),
+            profile_ids[1]: SimpleNamespace(connected=True),
+            profile_ids[2]: SimpleNamespace(connected=False),
+        }
+        monkeypatch.setattr(
+            background_tasks, "get_readonly_session_maker", lambda: session_maker
+        )
+
+        worker = background_tasks.PositionReconciliationWorker(
+            pool_getter=lambda: SimpleNamespace(snapshot=lambda: connections)
+        )
+        reports = {}
+        reconcile = worker._reconcile_profile
+
+        async def record(profile_id, local_positions):
+            reports[profile_id] = await reconcile(profile_id, local_positions)
+            return reports[profile_id]
+
+        monkeypatch.setattr(worker, "_reconcile_profile", record)
+        statements = count_statements(session_maker)
+
+        await worker._reconcile_all()
+
+        assert len(statements) == 1
+        assert set(reports) == {profile_ids[0], profile_ids[1]}
+        assert reports[profile_ids[0]].positions_checked == 2
+        assert worker.get_stats().run_count == 1
+
+
+class TestDriftHistory:
+    """Tests for the bounded drift history."""
+
+    def test_oldest_records_evicted(self, monkeypatch):
+        """Each profile should keep only the newest drift records."""
+        monkeypatch.setattr(
+            background_tasks.PositionReconciliationWorker,
+            "MAX_DRIFT_HISTORY_PER_PROFILE",
+            3,
+        )
+        worker = background_tasks.PositionReconciliationWorker()
+        profile_id = uuid4()
+        now = datetime.now(timezone.utc)
+        for ticket in range(5):
+            worker._drift_history[profile_id].append(
+                background_tasks.DriftRecord(
+                    profile_id, ticket, "volume", "0.1", "0.2", now
+                )
+            )
+
+        assert [d.ticket for d in worker.get_drift_history(profile_id)] == [2, 3, 4]
+        assert worker.get_drift_history(uuid4()) == []
+
+
+class TestProfileFanOut:
+    """Tests for concurrent per-profile processing."""
+
+    async def test_profiles_run_concurrently_up_to_cap(self, monkeypatch):
+        """Handlers should overlap, bounded by MAX_CONCURRENT_PROFILES."""
+        monkeypatch.setattr(worker_base, "MAX_CONCURRENT_PROFILES", 3)
+        active = 0
+        peak = 0
+        done = []
+
+        async def handler(profile_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            done.append(profile_id)
+
+        ids = [uuid4() for _ in range(10)]
+        await worker_base.for_each_profile(ids, handler, "Test")
+
+        assert peak == 3
+        assert sorted(done) == sorted(ids)
+
+    async def test_failures_isolated(self, caplog):
+        """One failing profile should not stop the others."""
+        ids = [uuid4() for _ in range(3)]
+        done = []
+
+        async def handler(profile_id):
+            if profile_id == ids[0]:
+                raise RuntimeError("boom")
+            done.append(profile_id)
+
+        await worker_base.for_each_profile(ids, handler, "Test")
+
+        assert done == ids[1:]
+        assert f"Test failed for {ids[0]}: boom" in caplog.text
+
+
+class TestWorkerScheduler:
+    """Tests for the BackgroundWorkerManager scheduler."""
+
+    async def test_workers_run_on_their_intervals(self, monkeypatch):
+        """One scheduler task should run every worker at its own interval."""
+        manager = background_tasks.BackgroundWorkerManager()
+        runs = {}
+        for name, interval in [
+            ("reconciliation", 0.02),
+            ("account_sync", 0.01),
+            ("connection_health", 10),
+            ("signal_expiration", 10),
+        ]:
+            worker = getattr(manager, name)
+            worker.interval = interval
+            runs[name] = 0
+
+            async def run_once(name=name):
+                runs[name] += 1
+
+            monkeypatch.setattr(worker, "run_once", run_once)
+
+        tasks_before = len(asyncio.all_tasks())
+        await manager.start_all()
+        assert len(asyncio.all_tasks()) == tasks_before + 1
+
+        await asyncio.sleep(0.075)
+        await manager.stop_all()
+
+        assert runs["account_sync"] >= 4
+        assert 2 <= runs["reconciliation"] < runs["account_sync"]
+        assert runs["connection_health"] == runs["signal_expiration"] == 0
+
+    async def test_slow_pass_does_not_delay_others(self, monkeypatch):
+        """A long pass should neither hold back other workers nor overlap itself."""
+        manager = background_tasks.BackgroundWorkerManager()
+        runs = {"reconciliation": 0, "account_sync": 0}
+        cancelled = []
+
+        async def slow_pass():
+            runs["reconciliation"] += 1
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def fast_pass():
+            runs["account_sync"] += 1
+
+        monkeypatch.setattr(manager.reconciliation, "run_once", slow_pass)
+        monkeypatch.setattr(manager.account_sync, "run_once", fast_pass)
+        manager.reconciliation.interval = manager.account_sync.interval = 0.01
+        manager.connection_health.interval = manager.signal_expiration.interval = 10
+
+        await manager.start_all()
+        await asyncio.sleep(0.075)
+        await manager.stop_all()
+
+        assert runs["reconciliation"] == 1
+        assert runs["account_sync"] >= 4
+        assert cancelled == [True]
+
+    async def test_failed_pass_recorded(self):
+        """Errors in a pass should be counted, not propagated."""
+        worker = background_tasks.SignalExpirationWorker()
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        worker._expire_stale_signals = boom
+        await worker.run_once()
+
+        assert worker.get_stats().error_count == 1
+        assert worker.get_stats().last_error == "boom"
+
+
+class TestReconnectBackoff:
+    """Tests for ConnectionHealthWorker reconnection."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable monotonic clock for the worker module."""
+        now = [1000.0]
+        monkeypatch.setattr(connection_health.time, "monotonic", lambda: now[0])
+        return now
+
+    @pytest.fixture
+    def no_jitter(self, monkeypatch):
+        """Always wait the full backoff delay."""
+        monkeypatch.setattr(connection_health.random, "uniform", lambda low, high: high)
+
+    def make_worker(self, connections, results):
+        """Worker over fake connections whose reconnects return `results`."""
+        attempts = []
+
+        async def reconnect(pool, connection):
+            attempts.append(connection.profile_id)
+            return results.pop(0)
+
+        pool = SimpleNamespace(
+            snapshot=lambda: connections,
+            get_stats=lambda: SimpleNamespace(
+                failed_connections=0, active_connections=0
+            ),
+        )
+        worker = connection_health.ConnectionHealthWorker(
+            max_reconnect_attempts=3,
+            pool_getter=lambda: pool,
+            reconnect=reconnect,
+        )
+        return worker, attempts
+
+    async def test_retries_back_off_then_give_up(self, clock, no_jitter):
+        """Failed profiles should retry at growing delays, then stop."""
+        profile_id = uuid4()
+        connections = {
+            profile_id: SimpleNamespace(profile_id=profile_id, connected=False)
+        }
+        worker, attempts = self.make_worker(connections, [False] * 5)
+
+        await worker._check_health()  # attempt 1, next retry in 2s
+        clock[0] += 1
+        await worker._check_health()  # backing off
+        clock[0] += 1
+        await worker._check_health()  # attempt 2, next retry in 4s
+        clock[0] += 4
+        await worker._check_health()  # attempt 3, gives up
+        clock[0] += 300
+        await worker._check_health()
+
+        assert len(attempts) == 3
+        assert worker.get_stats().error_count == 2
+        assert "Giving up" in worker.get_stats().last_error
+
+    async def test_success_resets_backoff(self, clock, no_jitter):
+        """A successful reconnect should clear the profile's backoff."""
+        profile_id = uuid4()
+        connection = SimpleNamespace(profile_id=profile_id, connected=False)
+        worker, attempts = self.make_worker({profile_id: connection}, [False, True])
+
+        await worker._check_health()
+        clock[0] += 2
+        await worker._check_health()
+
+        assert len(attempts) == 2
+        assert profile_id not in worker._reconnect_attempts
+        assert profile_id not in worker._next_retry_at
+
+    async def test_retry_delays_jittered(self, clock):
+        """Profiles failing together should get spread-out retry times."""
+        profile_ids = [uuid4() for _ in range(20)]
+        connections = {
+            profile_id: SimpleNamespace(profile_id=profile_id, connected=False)
+            for profile_id in profile_ids
+        }
+        worker, _ = self.make_worker(connections, [False] * 20)
+
+        await worker._check_health()
+
+        delays = [worker._next_retry_at[p] - clock[0] for p in profile_ids]
+        assert all(0 <= delay <= 2 for delay in delays)
+        assert len(set(delays)) > 1
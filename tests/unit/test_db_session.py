@@ -0,0 +1,89 @@
+"""
+Tests for ARCHON PRIME Database Session
+========================================
+
+Tests lazy engine creation, its binding to event loops and pool warmup.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from archon_prime.api.config import settings
+from archon_prime.api.db import session
+
+
+@pytest.fixture(autouse=True)
+def sqlite_settings(monkeypatch):
+    """Point the session module at SQLite and reset its globals."""
+    monkeypatch.setattr(
+        session,
+        "settings",
+        settings.model_copy(
+            update={
+                "DATABASE_URL": "sqlite+aiosqlite:///:memory:",
+                "USE_EXTERNAL_POOL": True,
+            }
+        ),
+    )
+    for name in (
+        "_engine",
+        "_engine_loop",
+        "_async_session_maker",
+        "_readonly_session_maker",
+    ):
+        monkeypatch.setattr(session, name, None)
+
+
+class TestEngineLifecycle:
+    """Tests for get_engine."""
+
+    def test_concurrent_callers_share_engine(self):
+        """Concurrent coroutines on one loop should get one engine."""
+
+        async def get():
+            await asyncio.sleep(0)
+            return session.get_engine()
+
+        async def main():
+            return await asyncio.gather(*(get() for _ in range(10)))
+
+        engines = asyncio.run(main())
+        assert all(e is engines[0] for e in engines)
+
+    def test_engine_created_outside_loop_is_adopted(self):
+        """An engine built before the loop starts should be reused in it."""
+        engine = session.get_engine()
+
+        async def main():
+            return session.get_engine()
+
+        assert asyncio.run(main()) is engine
+
+    def test_new_loop_gets_new_engine(self):
+        """A different running loop should get its own engine and makers."""
+
+        async def main():
+            return session.get_engine(), session.get_session_maker()
+
+        first_engine, first_maker = asyncio.run(main())
+        second_engine, second_maker = asyncio.run(main())
+
+        assert second_engine is not first_engine
+        assert second_maker is not first_maker
+
+
+class TestPoolWarmup:
+    """Tests for _warm_pool."""
+
+    async def test_fills_pool_to_size(self, tmp_path):
+        """Warmup should leave pool_size idle connections in the pool."""
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}", pool_size=3
+        )
+        try:
+            await session._warm_pool(engine)
+            assert engine.pool.checkedin() == 3
+        finally:
+            await engine.dispose()
@@ -0,0 +1,130 @@
+"""
+Tests for ARCHON PRIME Encryption Service
+==========================================
+
+Tests credential encryption round trips and key derivation caching.
+"""
+
+import os
+
+import pytest
+
+from archon_prime.api.services.encryption import EncryptionService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Encryption service with a cheap KDF and counted derivations."""
+    monkeypatch.setattr(EncryptionService, "ITERATIONS", 1000)
+    service = EncryptionService("test-master-key")
+    service.derivations = 0
+    derive = service._derive_key
+
+    def counting_derive(salt):
+        service.derivations += 1
+        return derive(salt)
+
+    service._derive_key = counting_derive
+    return service
+
+
+def legacy_encrypt(service, plaintext, salt=None):
+    """Build a pre-versioning record (salt + Fernet token)."""
+    salt = salt or os.urandom(EncryptionService.SALT_SIZE)
+    return salt + service._get_fernet(salt).encrypt(plaintext.encode())
+
+
+class TestEncryptionService:
+    """Tests for EncryptionService."""
+
+    def test_round_trip(self, service):
+        """Decrypting should return the original plaintext."""
+        assert service.decrypt(service.encrypt("hunter2")) == "hunter2"
+
+    def test_versioned_aesgcm_record(self, service):
+        """New records should be AES-GCM with no per-record key derivation."""
+        encrypted = service.encrypt("hunter2")
+        assert encrypted[0] == EncryptionService.VERSION_AESGCM
+        assert encrypted != service.encrypt("hunter2")
+        assert service.derivations == 0
+
+    def test_key_stable_across_instances(self, service):
+        """A fresh service with the same master key should read old records."""
+        encrypted = service.encrypt("hunter2")
+        assert EncryptionService("test-master-key").decrypt(encrypted) == "hunter2"
+
+    def test_tampered_record_rejected(self, service):
+        """Modified ciphertext should fail authentication."""
+        encrypted = bytearray(service.encrypt("hunter2"))
+        encrypted[-1] ^= 1
+        with pytest.raises(ValueError):
+            service.decrypt(bytes(encrypted))
+
+    def test_legacy_record_decrypts(self, service):
+        """Fernet records should decrypt even if the salt looks versioned."""
+        salt = bytes((EncryptionService.VERSION_AESGCM,)) + os.urandom(15)
+        encrypted = legacy_encrypt(service, "hunter2", salt)
+        assert service.decrypt(encrypted) == "hunter2"
+
+    def test_rotation_upgrades_legacy_record(self, service):
+        """Rotating a legacy record should produce a versioned record."""
+        rotated = service.rotate_encryption(legacy_encrypt(service, "x"), "new-key")
+        assert rotated[0] == EncryptionService.VERSION_AESGCM
+        assert EncryptionService("new-key").decrypt(rotated) == "x"
+
+    def test_rotation_reuses_target_cipher(self, service):
+        """Rotating many records to one key should build its cipher once."""
+        first = service._rotation_target
+        service.rotate_encryption(service.encrypt("a"), "new-key")
+        target = service._rotation_target
+        service.rotate_encryption(service.encrypt("b"), "new-key")
+
+        assert first is None
+        assert service._rotation_target is target
+        service.rotate_encryption(service.encrypt("c"), "newer-key")
+        assert service._rotation_target is not target
+
+    def test_key_derived_once_per_salt(self, service):
+        """Repeated decrypts of one legacy record should reuse the derived key."""
+        encrypted = legacy_encrypt(service, "hunter2")
+        for _ in range(3):
+            service.decrypt(encrypted)
+        assert service.derivations == 1
+
+    def test_key_cache_bounded(self, service, monkeypatch):
+        """The key cache should evict least recently used salts."""
+        monkeypatch.setattr(EncryptionService, "KEY_CACHE_SIZE", 2)
+        records = [legacy_encrypt(service, f"secret-{i}") for i in range(3)]
+
+        assert len(service._fernets) == 2
+        assert service.decrypt(records[0]) == "secret-0"
+        assert service.derivations == 4
+
+    def test_bad_aesgcm_record_skips_legacy_kdf(self, service):
+        """A versioned record that fails authentication should not hit PBKDF2."""
+        encrypted = bytearray(service.encrypt("hunter2"))
+        encrypted[-1] ^= 1
+        junk = b"\x02" + os.urandom(40)
+
+        for record in (bytes(encrypted), junk):
+            with pytest.raises(ValueError):
+                service.decrypt(record)
+        assert service.derivations == 0
+        assert not service._fernets
+
+    def test_tampered_legacy_record_not_cached(self, service):
+        """A legacy record that fails to decrypt should not take a cache slot."""
+        encrypted = bytearray(legacy_encrypt(service, "hunter2"))
+        service._fernets.clear()
+        encrypted[-1] ^= 1
+
+        with pytest.raises(ValueError):
+            service.decrypt(bytes(encrypted))
+        assert service.derivations == 2
+        assert not service._fernets
+
+    def test_wrong_master_key_fails(self, service):
+        """Another master key should not decrypt the record."""
+        encrypted = service.encrypt("hunter2")
+        with pytest.raises(ValueError):
+            EncryptionService("other-key").decrypt(encrypted)
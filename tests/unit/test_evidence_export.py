@@ -0,0 +1,99 @@
+"""
+Tests for ARCHON PRIME Evidence Export
+======================================
+
+Tests streaming export of evidence packages.
+"""
+
+import io
+import json
+import zipfile
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from archon_prime.api.compliance.evidence import EvidenceFormat, EvidencePackager
+from archon_prime.api.compliance.exporter import (
+    export_evidence_package,
+    export_evidence_package_streaming,
+)
+
+
+@pytest.fixture
+def package():
+    """Create an evidence package with a few items."""
+    packager = EvidencePackager()
+    now = datetime.now(timezone.utc)
+    pkg = packager.create_package(
+        title="Test Package",
+        purpose="audit",
+        requested_by="tester",
+        period_start=now - timedelta(days=1),
+        period_end=now,
+    )
+    packager.collect_trade_history(
+        pkg,
+        [
+            {"symbol": "EURUSD", "pnl": 12.5, "price": Decimal("1.1050")},
+            {"symbol": "GBPUSD", "pnl": -3.0, "price": Decimal("1.2710")},
+        ],
+    )
+    packager.collect_risk_alerts(pkg, [{"severity": "high", "acknowledged": True}])
+    return pkg
+
+
+class TestStreamingExport:
+    """Tests for export_evidence_package_streaming."""
+
+    def test_json_stream_matches_package(self, package):
+        """Streamed JSON should decode to the same package content."""
+        sink = io.BytesIO()
+        export_evidence_package_streaming(package, sink)
+
+        streamed = json.loads(sink.getvalue())
+        expected = json.loads(json.dumps(package.to_dict(), default=str))
+        assert streamed == expected
+
+    def test_json_stream_empty_package(self):
+        """Package without items should stream a valid document."""
+        now = datetime.now(timezone.utc)
+        pkg = EvidencePackager().create_package(
+            "Empty", "audit", "tester", now, now
+        )
+        sink = io.BytesIO()
+        export_evidence_package_streaming(pkg, sink)
+
+        assert json.loads(sink.getvalue())["items"] == []
+
+    def test_zip_stream_contains_items(self, package):
+        """Streamed ZIP should match the in-memory ZIP layout."""
+        sink = io.BytesIO()
+        export_evidence_package_streaming(package, sink, EvidenceFormat.ZIP)
+
+        with zipfile.ZipFile(sink) as zf:
+            names = set(zf.namelist())
+            for item in package.items:
+                name = f"evidence/{item.evidence_type.value}/{item.item_id}.json"
+                assert name in names
+                assert json.loads(zf.read(name))["hash"] == item.hash
+
+        data = export_evidence_package(package, EvidenceFormat.ZIP)
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            assert set(zf.namelist()) == names
+
+
+class TestJsonExport:
+    """Tests for in-memory JSON export."""
+
+    def test_json_export_matches_stream(self, package):
+        """In-memory JSON export should decode like the streamed one."""
+        data = export_evidence_package(package, EvidenceFormat.JSON)
+        sink = io.BytesIO()
+        export_evidence_package_streaming(package, sink)
+
+        exported = json.loads(data)
+        streamed = json.loads(sink.getvalue())
+        exported.pop("exported_at")
+        streamed.pop("exported_at")
+        assert exported == streamed
@@ -0,0 +1,362 @@
+"""
+Tests for ARCHON PRIME MT5 Connection Pool
+===========================================
+
+Tests per-profile connection locking, stats counters, the columnar
+idle count, idle expiry, warm-up, callback tasks and the read-only
+connection views.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from archon_prime.api.services.mt5_pool import (
+    MT5Connection,
+    MT5ConnectionPool,
+    PoolStats,
+)
+from archon_prime.api.services.pool_tracking import ConnectionColumns
+
+
+class TestSnapshot:
+    """Tests for MT5ConnectionPool.snapshot."""
+
+    def test_snapshot_is_shared_read_only_view(self):
+        """Snapshots should not copy and should not allow writes."""
+        pool = MT5ConnectionPool(max_connections=2)
+        snapshot = pool.snapshot()
+
+        assert pool.snapshot() is snapshot
+        with pytest.raises(TypeError):
+            snapshot[uuid4()] = None
+
+    def test_snapshot_tracks_pool(self):
+        """Connections added to the pool should appear in the view."""
+        pool = MT5ConnectionPool(max_connections=2)
+        snapshot = pool.snapshot()
+        profile_id = uuid4()
+
+        pool._connections[profile_id] = MT5Connection(
+            profile_id=profile_id, login="12345", server="Demo-Server"
+        )
+
+        assert list(snapshot) == [profile_id]
+        assert pool.get_all_connections() is snapshot
+
+    def test_get_all_connections_copy(self):
+        """copy=True should give a dict detached from the pool."""
+        pool = MT5ConnectionPool(max_connections=2)
+        copied = pool.get_all_connections(copy=True)
+        copied[uuid4()] = None
+        assert not pool.snapshot()
+
+
+class TestProfileLocks:
+    """Tests for per-profile serialization of connect/disconnect."""
+
+    async def test_busy_profile_does_not_block_others(self):
+        """A profile mid-handshake should not hold up other profiles."""
+        pool = MT5ConnectionPool(max_connections=2)
+        busy, other = uuid4(), uuid4()
+
+        async with pool._profile_lock(busy):
+            connected, _ = await asyncio.wait_for(
+                pool.connect(other, "1", "pw", "Demo-Server"), timeout=1
+            )
+
+        assert connected
+        assert pool.is_connected(other)
+
+    async def test_concurrent_connects_make_one_connection(self):
+        """Racing connects for one profile should connect it once."""
+        pool = MT5ConnectionPool(max_connections=2)
+        profile_id = uuid4()
+
+        results = await asyncio.gather(
+            pool.connect(profile_id, "1", "pw", "Demo-Server"),
+            pool.connect(profile_id, "1", "pw", "Demo-Server"),
+        )
+
+        assert sorted(message for _, message in results) == [
+            "Already connected",
+            "Connected successfully",
+        ]
+        assert len(pool.snapshot()) == 1
+
+    async def test_locks_released_when_idle(self):
+        """Profile locks should not outlive the operations using them."""
+        pool = MT5ConnectionPool(max_connections=2)
+        profile_id = uuid4()
+
+        await asyncio.gather(
+            pool.connect(profile_id, "1", "pw", "Demo-Server"),
+            pool.disconnect(profile_id),
+            pool.connect(uuid4(), "2", "pw", "Demo-Server"),
+        )
+
+        assert pool._profile_locks == {}
+
+    async def test_waiter_keeps_lock_alive(self):
+        """A queued operation should reuse the held lock, not a new one."""
+        pool = MT5ConnectionPool(max_connections=1)
+        profile_id = uuid4()
+
+        async with pool._profile_lock(profile_id):
+            waiter = asyncio.create_task(
+                pool.connect(profile_id, "1", "pw", "Demo-Server")
+            )
+            await asyncio.sleep(0)
+            assert pool._profile_locks[profile_id][1] == 2
+
+        assert (await waiter)[0]
+        assert pool._profile_locks == {}
+
+    async def test_handshakes_count_against_capacity(self):
+        """Connections still being opened should take a pool slot."""
+        pool = MT5ConnectionPool(max_connections=1)
+        pool._connecting.add(uuid4())
+
+        connected, message = await pool.connect(uuid4(), "1", "pw", "Demo-Server")
+
+        assert not connected
+        assert message == "Connection pool full (1)"
+
+    async def test_racing_connects_respect_capacity(self):
+        """Concurrent connects for different profiles should not over-admit."""
+        pool = MT5ConnectionPool(max_connections=2)
+
+        results = await asyncio.gather(*(
+            pool.connect(uuid4(), str(i), "pw", "Demo-Server") for i in range(4)
+        ))
+
+        assert sum(1 for connected, _ in results if connected) == 2
+        assert pool.get_stats().active_connections == 2
+
+    async def test_disconnect(self):
+        """Disconnecting should remove the profile's connection."""
+        pool = MT5ConnectionPool(max_connections=1)
+        profile_id = uuid4()
+        await pool.connect(profile_id, "1", "pw", "Demo-Server")
+
+        assert await pool.disconnect(profile_id) == (True, "Disconnected successfully")
+        assert not pool.is_connected(profile_id)
+
+
+class TestStats:
+    """Tests for the counters behind get_stats."""
+
+    async def test_counters_follow_transitions(self):
+        """Counts should track connect, failure, replacement and disconnect."""
+        pool = MT5ConnectionPool(max_connections=3)
+        first, second = uuid4(), uuid4()
+        await pool.connect(first, "1", "pw", "Demo-Server")
+        await pool.connect(second, "2", "pw", "Demo-Server")
+        pool._store(second, MT5Connection(
+            profile_id=second, login="2", server="Demo-Server",
+            error_message="timeout", reconnect_attempts=2,
+        ))
+
+        stats = pool.get_stats()
+        assert (stats.total_connections, stats.active_connections) == (2, 1)
+        assert (stats.failed_connections, stats.total_reconnects) == (1, 2)
+
+        await pool.disconnect(first)
+        await pool.disconnect(second)
+        assert pool.get_stats() == PoolStats()
+
+    async def test_capacity_uses_active_count(self):
+        """Failed connections should not take a pool slot."""
+        pool = MT5ConnectionPool(max_connections=1)
+        failed = uuid4()
+        pool._store(failed, MT5Connection(
+            profile_id=failed, login="1", server="Demo-Server", error_message="x"
+        ))
+
+        connected, _ = await pool.connect(uuid4(), "2", "pw", "Demo-Server")
+        assert connected
+
+
+class TestLayout:
+    """Tests for the pool's record types."""
+
+    def test_records_use_slots(self):
+        """Connections and stats should not carry an instance __dict__."""
+        conn = MT5Connection(profile_id=uuid4(), login="1", server="Demo-Server")
+        assert not hasattr(conn, "__dict__")
+        assert not hasattr(PoolStats(), "__dict__")
+
+
+class TestIdleDetection:
+    """Tests for MT5ConnectionPool._is_idle."""
+
+    def test_day_old_heartbeat_is_idle(self):
+        """Heartbeats over a day old should not wrap around to look fresh."""
+        pool = MT5ConnectionPool(max_connections=1, idle_timeout=300)
+        now = time.monotonic()
+        conn = make_connection(now - 25 * 3600)
+
+        assert pool._expiry.is_idle(conn, now)
+        assert not pool._expiry.is_idle(conn, now - 25 * 3600)
+
+    def test_wall_clock_heartbeat_for_display(self):
+        """last_heartbeat should map the monotonic time onto UTC."""
+        conn = make_connection(time.monotonic() - 60)
+        age = datetime.now(timezone.utc) - conn.last_heartbeat
+
+        assert timedelta(seconds=59) < age < timedelta(seconds=61)
+        assert make_connection(None).last_heartbeat is None
+
+
+def make_connection(heartbeat=None, connected=True):
+    """A connection with the given monotonic heartbeat time."""
+    return MT5Connection(
+        profile_id=uuid4(),
+        login="1",
+        server="Demo-Server",
+        connected=connected,
+        last_heartbeat_ts=heartbeat,
+    )
+
+
+class TestConnectionColumns:
+    """Tests for ConnectionColumns."""
+
+    def test_counts_connected_stale_profiles(self):
+        """Only connected profiles with an old heartbeat should count as idle."""
+        now = time.monotonic()
+        stale = make_connection(now - 600)
+        fresh = make_connection(now)
+        failed = make_connection(now - 600, connected=False)
+        unknown = make_connection(None)
+        columns = ConnectionColumns(2)
+        for conn in (stale, fresh, failed, unknown):
+            columns.set(conn.profile_id, conn)
+
+        assert columns.count_idle(now - 300) == 1
+
+    def test_slots_reused_after_remove(self):
+        """Removed profiles should free their slot for the next one."""
+        now = time.monotonic()
+        columns = ConnectionColumns(1)
+        old = make_connection(now - 3600)
+        columns.set(old.profile_id, old)
+        columns.remove(old.profile_id)
+        new = make_connection(now)
+        columns.set(new.profile_id, new)
+
+        assert len(columns._connected) == 1
+        assert columns.count_idle(now + 1) == 1
+
+    async def test_pool_heartbeat_updates_columns(self):
+        """Heartbeats recorded through the pool should reach the scan."""
+        pool = MT5ConnectionPool(max_connections=1, idle_timeout=300)
+        profile_id = uuid4()
+        await pool.connect(profile_id, "1", "pw", "Demo-Server")
+        conn = pool.get_connection(profile_id)
+        conn.last_heartbeat_ts -= 3600
+        pool._columns.set(profile_id, conn)
+        cutoff = time.monotonic() - 300
+
+        assert pool._columns.count_idle(cutoff) == 1
+        pool.heartbeat(profile_id)
+        assert pool._columns.count_idle(cutoff) == 0
+
+
+class TestIdleExpiry:
+    """Tests for the idle-deadline heap behind the cleanup loop."""
+
+    async def test_cleanup_loop_closes_at_deadline(self):
+        """The loop should wake for a new deadline and close when it passes."""
+        pool = MT5ConnectionPool(max_connections=1, idle_timeout=0.05)
+        await pool.start()
+        profile_id = uuid4()
+        await pool.connect(profile_id, "1", "pw", "Demo-Server")
+
+        await asyncio.sleep(0.2)
+
+        assert not pool.is_connected(profile_id)
+        assert len(pool._expiry) == 0 and not pool._expiry._heap
+        await pool.stop()
+
+    async def test_heartbeat_defers_expiry(self):
+        """A due entry for a refreshed connection should be pushed back once."""
+        pool = MT5ConnectionPool(max_connections=1, idle_timeout=300)
+        profile_id = uuid4()
+        await pool.connect(profile_id, "1", "pw", "Demo-Server")
+        for _ in range(3):
+            pool.heartbeat(profile_id)
+        deadline = pool._expiry.deadline(profile_id)
+        conn = pool.get_connection(profile_id)
+        conn.last_heartbeat_ts = deadline
+
+        await pool._close_idle(deadline)
+
+        assert pool.is_connected(profile_id)
+        assert pool._expiry._heap == [(deadline + 300, profile_id)]
+
+
+class TestWarmUp:
+    """Tests for warm-up and the min_connections floor."""
+
+    async def test_warm_up_connects_up_to_min(self):
+        """warm_up should connect only the first min_connections profiles."""
+        pool = MT5ConnectionPool(max_connections=5, min_connections=2)
+        credentials = [(uuid4(), str(i), "pw", "Demo-Server") for i in range(3)]
+
+        assert await pool.warm_up(credentials) == 2
+        assert list(pool.snapshot()) == [entry[0] for entry in credentials[:2]]
+
+    async def test_idle_cleanup_keeps_min_connections(self):
+        """Idle connections should only be closed down to min_connections."""
+        pool = MT5ConnectionPool(
+            max_connections=3, idle_timeout=300, min_connections=2
+        )
+        for i in range(3):
+            await pool.connect(uuid4(), str(i), "pw", "Demo-Server")
+
+        await pool._close_idle(time.monotonic() + 3600)
+
+        assert len(pool.snapshot()) == 2
+        assert pool.get_stats().active_connections == 2
+
+
+class TestCallbacks:
+    """Tests for connect/disconnect callback tasks."""
+
+    async def test_callback_tasks_held_until_done(self):
+        """Callback tasks should be referenced while running, then dropped."""
+        pool = MT5ConnectionPool(max_connections=1)
+        release = asyncio.Event()
+        seen = []
+
+        async def on_connect(profile_id):
+            await release.wait()
+            seen.append(profile_id)
+
+        pool.on_connect(on_connect)
+        profile_id = uuid4()
+        await pool.connect(profile_id, "1", "pw", "Demo-Server")
+        assert len(pool._callback_tasks) == 1
+
+        release.set()
+        await asyncio.gather(*pool._callback_tasks)
+        assert seen == [profile_id]
+        assert not pool._callback_tasks
+
+    async def test_stop_waits_for_callbacks(self, caplog):
+        """Stopping should drain callbacks and log ones that failed."""
+        pool = MT5ConnectionPool(max_connections=1)
+
+        async def on_disconnect(profile_id):
+            raise RuntimeError("listener gone")
+
+        pool.on_disconnect(on_disconnect)
+        await pool.connect(uuid4(), "1", "pw", "Demo-Server")
+        await pool.stop()
+
+        assert not pool._callback_tasks
+        assert "listener gone" in caplog.text
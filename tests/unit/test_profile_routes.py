@@ -0,0 +1,87 @@
+"""
+Tests for ARCHON PRIME Profile Routes
+======================================
+
+Tests conditional GETs on profile endpoints.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from archon_prime.api.dependencies import get_profile_with_access
+from archon_prime.api.profiles.routes import router
+
+
+@pytest.fixture
+def profile():
+    """A connected profile as returned by get_profile_with_access."""
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=uuid4(),
+        user_id=uuid4(),
+        name="Main",
+        mt5_login=12345,
+        mt5_server="Demo-Server",
+        broker_name=None,
+        account_type="demo",
+        is_connected=True,
+        is_trading_enabled=False,
+        last_connected_at=now,
+        last_sync_at=now,
+        balance=Decimal("1000.00"),
+        equity=Decimal("1000.00"),
+        margin=None,
+        free_margin=None,
+        margin_level=None,
+        leverage=100,
+        currency="USD",
+        risk_settings={},
+        trading_settings={},
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def client(profile):
+    """Test client serving the profile routes for one profile."""
+    app = FastAPI()
+    app.include_router(router, prefix="/profiles")
+    app.dependency_overrides[get_profile_with_access] = lambda: profile
+    return TestClient(app)
+
+
+class TestConditionalGet:
+    """Tests for ETag handling on GET routes."""
+
+    @pytest.mark.parametrize("suffix", ["", "/account"])
+    def test_matching_etag_returns_304(self, client, profile, suffix):
+        """A current If-None-Match should give an empty 304."""
+        url = f"/profiles/{profile.id}{suffix}"
+        first = client.get(url)
+        etag = first.headers["etag"]
+
+        second = client.get(url, headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_stale_etag_returns_body(self, client, profile):
+        """Changing the profile should change the ETag."""
+        url = f"/profiles/{profile.id}"
+        etag = client.get(url).headers["etag"]
+
+        profile.updated_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["name"] == "Main"
@@ -0,0 +1,262 @@
+"""
+Tests for ARCHON PRIME Profile Service
+=======================================
+
+Tests profile listing, profile writes and the profile response schemas.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from archon_prime.api.db.models import MT5Profile, User
+from archon_prime.api.profiles.schemas import (
+    ProfileCreateRequest,
+    ProfileCredentialsUpdateRequest,
+    ProfileListItemResponse,
+    ProfileResponse,
+    ProfileUpdateRequest,
+)
+from archon_prime.api.profiles.service import ProfileService
+
+
+@pytest.fixture
+async def db():
+    """In-memory SQLite session with the users and profiles tables."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(User.__table__.create)
+        await conn.run_sync(MT5Profile.__table__.create)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+async def user(db):
+    """A user with three profiles, created a minute apart."""
+    user = User(email="user@example.com", password_hash="x", subscription_tier="pro")
+    db.add(user)
+    await db.flush()
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(3):
+        db.add(
+            MT5Profile(
+                user_id=user.id,
+                name=f"Profile {i}",
+                broker_server="Demo-Server",
+                mt5_login=1000 + i,
+                mt5_password_encrypted=b"secret",
+                connection_status="connected" if i == 0 else "disconnected",
+                created_at=start + timedelta(minutes=i),
+            )
+        )
+    await db.commit()
+    return user
+
+
+def count_statements(db):
+    """Record SQL statements executed on the session's engine."""
+    statements = []
+    event.listen(
+        db.bind.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
+
+
+class TestListProfiles:
+    """Tests for ProfileService.get_user_profiles."""
+
+    async def test_pages_newest_first(self, db, user):
+        """Pages should be ordered newest first and report the total."""
+        service = ProfileService(db)
+
+        first, total = await service.get_user_profiles(user.id, page=1, page_size=2)
+        second, total_again = await service.get_user_profiles(
+            user.id, page=2, page_size=2
+        )
+
+        assert [r.name for r in first] == ["Profile 2", "Profile 1"]
+        assert [r.name for r in second] == ["Profile 0"]
+        assert total == total_again == 3
+
+    async def test_partial_page_skips_count(self, db, user):
+        """A partial first page should not need a COUNT query."""
+        statements = count_statements(db)
+        rows, total = await ProfileService(db).get_user_profiles(user.id)
+
+        assert total == 3
+        assert len(statements) == 1
+        assert "risk_settings" not in statements[0]
+        assert "mt5_password_encrypted" not in statements[0]
+
+    async def test_page_past_end_counts(self, db, user):
+        """An empty page past the end should still report the total."""
+        rows, total = await ProfileService(db).get_user_profiles(
+            user.id, page=5, page_size=2
+        )
+        assert rows == []
+        assert total == 3
+
+    async def test_list_item_from_row(self, db, user):
+        """Summary rows should map onto the list item schema."""
+        rows, _ = await ProfileService(db).get_user_profiles(user.id)
+        item = ProfileListItemResponse.from_row(rows[-1])
+
+        assert item.mt5_login == "1000"
+        assert item.mt5_server == "Demo-Server"
+        assert item.is_connected
+
+
+class TestProfileWrites:
+    """Tests for ProfileService updates."""
+
+    @pytest.fixture
+    async def profile(self, db, user):
+        """The user's connected profile."""
+        rows, _ = await ProfileService(db).get_user_profiles(user.id)
+        return await ProfileService(db).get_profile_by_id(rows[-1].id)
+
+    async def test_update_returns_row_in_one_statement(self, db, profile):
+        """Updates should read the row back with RETURNING, not a refresh."""
+        statements = count_statements(db)
+        updated = await ProfileService(db).update_profile(
+            profile, ProfileUpdateRequest(name="Renamed")
+        )
+
+        assert updated is profile
+        assert updated.name == "Renamed"
+        assert updated.updated_at is not None
+        assert len(statements) == 1
+        assert "RETURNING" in statements[0]
+
+    async def test_update_persists(self, db, profile):
+        """Committed updates should be visible to a fresh read."""
+        await ProfileService(db).set_trading_enabled(profile, True)
+        db.expunge_all()
+
+        reloaded = await ProfileService(db).get_profile_by_id(profile.id)
+        assert reloaded.is_trading_enabled
+
+    async def test_touch_skips_returning(self, db, profile):
+        """Status touches should be a bare UPDATE that still persists."""
+        statements = count_statements(db)
+        await ProfileService(db).touch_trading_enabled(profile.id, True)
+
+        assert len(statements) == 1
+        assert "RETURNING" not in statements[0]
+
+        db.expunge_all()
+        reloaded = await ProfileService(db).get_profile_by_id(profile.id)
+        assert reloaded.is_trading_enabled
+
+    async def test_status_and_account_writes(self, db, profile):
+        """Every status and account write should target mapped columns."""
+        service = ProfileService(db)
+
+        profile = await service.set_connected(profile, False)
+        assert not profile.is_connected
+        await service.touch_connected(profile.id, True)
+        profile = await service.update_account_info(profile, 1000.5, 990.0)
+        assert float(profile.balance) == 1000.5
+        assert profile.last_sync_at is not None
+        await service.touch_account_info(profile.id, 1200.0, 1100.0)
+
+        db.expunge_all()
+        reloaded = await service.get_profile_by_id(profile.id)
+        assert reloaded.is_connected
+        assert reloaded.last_connected_at is not None
+        assert float(reloaded.equity) == 1100.0
+
+    async def test_settings_and_credentials_writes(self, db, user):
+        """Settings and credential updates should persist on the real columns."""
+        service = ProfileService(db)
+        rows, _ = await service.get_user_profiles(user.id)
+        profile = await service.get_profile_by_id(rows[0].id)
+
+        profile = await service.update_profile(
+            profile,
+            ProfileUpdateRequest(
+                broker_name="Broker",
+                risk_settings={"max_risk": 0.01},
+                trading_settings={"lots": 0.1},
+            ),
+        )
+        profile = await service.update_credentials(
+            profile,
+            ProfileCredentialsUpdateRequest(
+                mt5_login="2002", mt5_password="new", mt5_server="Live-Server"
+            ),
+        )
+
+        assert profile.strategy_settings == {"lots": 0.1}
+        assert profile.mt5_server == "Live-Server"
+        assert profile.mt5_login == 2002
+        assert service.get_decrypted_password(profile) == "new"
+
+    async def test_create_profile(self, db, user):
+        """Created profiles should store the server as broker_server."""
+        profile, error = await ProfileService(db).create_profile(
+            user,
+            ProfileCreateRequest(
+                name="New", mt5_login="3003", mt5_password="pw", mt5_server="Srv"
+            ),
+        )
+
+        assert error == ""
+        assert profile.broker_server == "Srv"
+
+    async def test_trading_requires_connection(self, db, user):
+        """Trading should not be enabled on a disconnected profile."""
+        rows, _ = await ProfileService(db).get_user_profiles(user.id)
+        profile = await ProfileService(db).get_profile_by_id(rows[0].id)
+
+        with pytest.raises(ValueError):
+            await ProfileService(db).set_trading_enabled(profile, True)
+
+
+class TestProfileResponse:
+    """Tests for the unvalidated response constructors."""
+
+    def test_from_model_matches_validated(self):
+        """from_model should equal a validated response for the same data."""
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        profile = SimpleNamespace(
+            id=uuid4(),
+            user_id=uuid4(),
+            name="Main",
+            mt5_login=12345,
+            mt5_server="Demo-Server",
+            broker_name=None,
+            account_type="demo",
+            is_connected=False,
+            is_trading_enabled=True,
+            last_connected_at=None,
+            last_sync_at=now,
+            balance=Decimal("1000.50"),
+            equity=Decimal("990.00"),
+            margin=None,
+            free_margin=None,
+            margin_level=None,
+            leverage=100,
+            currency="USD",
+            risk_settings=None,
+            trading_settings={"lots": 0.1},
+            created_at=now,
+            updated_at=now,
+        )
+
+        response = ProfileResponse.from_model(profile)
+        validated = ProfileResponse.model_validate(response.model_dump())
+
+        assert response == validated
+        assert response.model_dump_json() == validated.model_dump_json()
+        assert response.risk_settings == {}
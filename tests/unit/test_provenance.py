@@ -0,0 +1,162 @@
+"""
+Tests for ARCHON PRIME Decision Provenance
+==========================================
+
+Tests the provenance tracker's hot cache, eviction and persistence.
+"""
+
+import asyncio
+from datetime import timedelta
+
+from archon_prime.api.compliance.persistence import ChainWriter
+from archon_prime.api.compliance.provenance import (
+    DecisionSource,
+    DecisionType,
+    ProvenanceQuery,
+    ProvenanceTracker,
+)
+
+
+class DictStorage:
+    """Minimal storage backend keeping chains in a dict."""
+
+    def __init__(self):
+        self.chains = {}
+
+    def save_chain(self, chain):
+        self.chains[chain.chain_id] = chain
+
+    def load_chain(self, chain_id):
+        return self.chains.get(chain_id)
+
+
+class BatchStorage(DictStorage):
+    """Storage backend recording batched async writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def save_chains(self, chains):
+        self.batches.append([c.chain_id for c in chains])
+        for chain in chains:
+            self.save_chain(chain)
+
+
+def start_and_complete(tracker, context_id):
+    """Start a one-node chain and complete it."""
+    tracker.start_chain(
+        context_id,
+        DecisionType.SIGNAL_GENERATED,
+        DecisionSource.AI_AGENT,
+        {},
+        "Signal",
+    )
+    return tracker.complete_chain(context_id, "executed")
+
+
+class TestHotCacheEviction:
+    """Tests for bounded in-memory chain retention."""
+
+    def test_size_bound_evicts_oldest_completed(self):
+        """Oldest completed chains should be evicted to storage first."""
+        storage = DictStorage()
+        tracker = ProvenanceTracker(storage, hot_cache_size=2, hot_ttl_sec=3600)
+        chains = [start_and_complete(tracker, f"sig_{i}") for i in range(4)]
+
+        assert set(tracker._chains) == {c.chain_id for c in chains[2:]}
+        assert len(tracker.query(ProvenanceQuery())) == 2
+        assert all(
+            chains[0].chain_id not in bucket
+            for bucket in tracker._index._by_day.values()
+        )
+        assert tracker.get_chain(chains[0].chain_id) is chains[0]
+
+    def test_ttl_evicts_completed_chains(self):
+        """Completed chains past the TTL should leave memory."""
+        tracker = ProvenanceTracker(DictStorage(), hot_cache_size=100, hot_ttl_sec=0)
+        tracker.start_chain(
+            "active", DecisionType.SIGNAL_GENERATED, DecisionSource.AI_AGENT, {}, "x"
+        )
+        start_and_complete(tracker, "done")
+        assert [c.outcome for c in tracker.query(ProvenanceQuery())] == ["pending"]
+
+    def test_evict_before_day(self):
+        """Completed chains from earlier days should be evictable by day."""
+        tracker = ProvenanceTracker(DictStorage())
+        chain = start_and_complete(tracker, "sig_1")
+        tracker.start_chain(
+            "active", DecisionType.SIGNAL_GENERATED, DecisionSource.AI_AGENT, {}, "x"
+        )
+        next_day = chain.created_at.date() + timedelta(days=1)
+
+        assert tracker.evict_before(chain.created_at.date()) == 0
+        assert tracker.evict_before(next_day) == 1
+        assert [c.outcome for c in tracker.query(ProvenanceQuery())] == ["pending"]
+        assert tracker.get_chain(chain.chain_id) is chain
+
+    def test_time_range_uses_day_buckets(self):
+        """Time-range queries should only return chains in range."""
+        tracker = ProvenanceTracker()
+        chain = start_and_complete(tracker, "sig_1")
+        day_after = chain.created_at + timedelta(days=1)
+        assert not tracker.query(ProvenanceQuery(start_time=day_after))
+        assert tracker.query(ProvenanceQuery(end_time=day_after)) == [chain]
+
+    async def test_async_writes_are_batched(self):
+        """Completions inside an event loop should be written in batches."""
+        storage = BatchStorage()
+        tracker = ProvenanceTracker(storage, hot_cache_size=1, hot_ttl_sec=3600)
+        chains = [start_and_complete(tracker, f"sig_{i}") for i in range(3)]
+
+        # Nothing is evicted before the write lands
+        assert not storage.chains
+        assert len(tracker._chains) == 3
+
+        await tracker.close()
+        assert storage.batches == [[c.chain_id for c in chains]]
+        assert len(tracker._chains) == 1
+
+    async def test_writer_survives_callback_error(self, caplog):
+        """A failing on_saved callback should not stop later writes."""
+        saved = []
+
+        async def save_batch(batch):
+            saved.extend(batch)
+
+        def on_saved(batch):
+            raise RuntimeError("callback failed")
+
+        writer = ChainWriter(save_batch, on_saved, window_sec=0)
+        writer.submit("a")
+        await writer.flush()
+        writer.submit("b")
+        await writer.flush()
+        await writer.close()
+
+        assert saved == ["a", "b"]
+        assert "callback failed" in caplog.text
+
+    async def test_restarted_writer_keeps_queued_chains(self):
+        """Chains queued for a stopped writer task should still be written."""
+        saved = []
+
+        async def save_batch(batch):
+            saved.extend(batch)
+
+        writer = ChainWriter(save_batch, lambda batch: None, window_sec=0)
+        writer.submit("a")
+        writer._task.cancel()
+        await asyncio.sleep(0)
+        writer.submit("b")
+        await asyncio.wait_for(writer.flush(), 1)
+        await writer.close()
+
+        assert saved == ["a", "b"]
+
+    def test_no_eviction_without_storage(self):
+        """Without storage, memory is the only copy and must be kept."""
+        tracker = ProvenanceTracker(hot_cache_size=1, hot_ttl_sec=0)
+        for i in range(3):
+            start_and_complete(tracker, f"sig_{i}")
+        assert len(tracker.query(ProvenanceQuery())) == 3
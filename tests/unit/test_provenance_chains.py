@@ -0,0 +1,174 @@
+"""
+Tests for ARCHON PRIME Decision Chains
+======================================
+
+Tests chain hashing, integrity verification and Merkle proofs.
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from archon_prime.api.compliance.merkle import (
+    INTERIOR_PREFIX,
+    hash_pair,
+    merkle_append,
+    merkle_build,
+    merkle_proof,
+    merkle_root,
+)
+from archon_prime.api.compliance.provenance import (
+    CHAIN_HASH_VERSION_JOINED,
+    DecisionChain,
+    DecisionNode,
+    ProvenanceQuery,
+    verify_decision_integrity,
+    verify_merkle_proof,
+)
+
+
+class TestChainIntegrity:
+    """Tests for chain-level integrity."""
+
+    def test_chain_verifies(self, provenance_tracker):
+        """A freshly built chain should verify."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        result = verify_decision_integrity(chain)
+        assert result["verified"]
+        assert len(result["nodes_verified"]) == 3
+
+    def test_incremental_hash_matches_full_recompute(self, provenance_tracker):
+        """Incremental chain hash should equal a full rebuild."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        assert chain.chain_hash == chain._compute_chain_hash()
+        stored = chain.chain_hash
+        assert chain.rebuild_chain_hash() == stored
+
+    def test_legacy_joined_chain_hash_verifies(self, provenance_tracker):
+        """Chains stored with the joined-hash format should still verify."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        joined = "|".join(n.hash for n in chain.nodes)
+        legacy = DecisionChain(
+            chain_id=chain.chain_id,
+            root_node_id=chain.root_node_id,
+            terminal_node_id=chain.terminal_node_id,
+            outcome=chain.outcome,
+            created_at=chain.created_at,
+            completed_at=chain.completed_at,
+            nodes=list(chain.nodes),
+            chain_hash=hashlib.sha256(joined.encode()).hexdigest(),
+            chain_hash_version=CHAIN_HASH_VERSION_JOINED,
+        )
+        assert legacy.verify_chain_integrity()
+
+        legacy.nodes.reverse()
+        assert not legacy.verify_chain_integrity()
+
+    def test_to_json_matches_to_dict(self, provenance_tracker):
+        """JSON export should decode to the dict export."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        assert json.loads(chain.to_json()) == chain.to_dict()
+
+    def test_bulk_export_matches_row_export(self, provenance_tracker):
+        """Column-oriented export should carry the same node data."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        bulk = json.loads(chain.to_json_bulk())
+        rows = chain.to_dict()["nodes"]
+
+        columns = bulk["nodes"]
+        assert columns["node_id"] == [r["node_id"] for r in rows]
+        assert [bulk["decision_types"][c] for c in columns["decision_type_code"]] == [
+            r["decision_type"] for r in rows
+        ]
+        assert [bulk["sources"][c] for c in columns["source_code"]] == [
+            r["source"] for r in rows
+        ]
+        assert columns["input_data"] == [r["input_data"] for r in rows]
+        assert columns["confidence"] == [r["confidence"] for r in rows]
+        assert columns["hash"] == [r["hash"] for r in rows]
+        assert bulk["chain_hash"] == chain.chain_hash
+
+    def test_nested_tampering_fails_verification(self, provenance_tracker):
+        """Chain verification should recompute node hashes by default."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        assert chain.verify_chain_integrity()
+
+        # Bypass __setattr__, as an in-place edit would
+        object.__setattr__(chain.nodes[0], "input_data", {"features": {"rsi": 0}})
+        assert chain.verify_chain_integrity(recompute=False)
+        assert not chain.verify_chain_integrity()
+        assert not verify_decision_integrity(chain)["verified"]
+
+    def test_report_verifies_nodes_once(self, provenance_tracker, monkeypatch):
+        """The report should rely on the batch pass for node checks."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        object.__setattr__(chain.nodes[0], "input_data", {"features": {"rsi": 0}})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("node verified outside verify_batch")
+
+        monkeypatch.setattr(DecisionNode, "verify_integrity", fail)
+        result = verify_decision_integrity(chain)
+
+        assert not result["verified"]
+        assert result["chain_hash_valid"]
+        assert [r["valid"] for r in result["nodes_verified"]] == [False, True, True]
+
+    def test_reordered_nodes_fail_verification(self, provenance_tracker):
+        """Swapping nodes should break the chain hash."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        chain.nodes[0], chain.nodes[1] = chain.nodes[1], chain.nodes[0]
+        assert not chain.verify_chain_integrity()
+
+
+class TestMerkleTree:
+    """Tests for Merkle roots and inclusion proofs."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 4, 5, 7, 8, 9, 16, 17])
+    def test_incremental_matches_build(self, size):
+        """Appending leaves one by one should match a bulk build."""
+        leaves = [hashlib.sha256(bytes([i])).digest() for i in range(size)]
+        levels = []
+        for leaf in leaves:
+            merkle_append(levels, leaf)
+        assert merkle_root(levels) == merkle_root(merkle_build(leaves))
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 6, 11])
+    def test_every_leaf_proof_verifies(self, size):
+        """Every leaf should have a valid inclusion proof."""
+        leaves = [hashlib.sha256(bytes([i])).digest() for i in range(size)]
+        levels = merkle_build(leaves)
+        root = merkle_root(levels)
+        for index, leaf in enumerate(leaves):
+            proof = merkle_proof(levels, index)
+            assert verify_merkle_proof(leaf, proof, root)
+            assert not verify_merkle_proof(b"\x00" * 32, proof, root)
+
+    def test_odd_leaf_promoted_not_duplicated(self):
+        """Repeating the last leaf should change the root."""
+        leaves = [hashlib.sha256(bytes([i])).digest() for i in range(3)]
+        assert merkle_root(merkle_build(leaves)) != merkle_root(
+            merkle_build(leaves + leaves[-1:])
+        )
+        assert merkle_root(merkle_build(leaves)) == hash_pair(
+            hash_pair(leaves[0], leaves[1]), leaves[2]
+        )
+
+    def test_interior_hash_is_domain_separated(self):
+        """Interior hashes should use the one-block prefix."""
+        left, right = b"\x01" * 32, b"\x02" * 32
+        assert len(INTERIOR_PREFIX) == 64
+        assert hash_pair(left, right) == hashlib.sha256(
+            INTERIOR_PREFIX + left + right
+        ).digest()
+        assert hash_pair(left, right) != hashlib.sha256(left + right).digest()
+
+    def test_chain_node_proof(self, provenance_tracker):
+        """Chain nodes should prove inclusion under the chain hash."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        node = chain.nodes[1]
+        proof = chain.merkle_proof(node.node_id)
+        assert chain.merkle_root().hex() == chain.chain_hash
+        assert verify_merkle_proof(node.hash_bytes, proof, chain.merkle_root())
+        assert chain.merkle_proof("node_missing") is None
@@ -0,0 +1,191 @@
+"""
+Tests for ARCHON PRIME Decision Nodes
+=====================================
+
+Tests node hashing, payload freezing and batch verification.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from archon_prime.api.compliance.columns import timestamp_ns
+from archon_prime.api.compliance.hashing import sha256_many
+from archon_prime.api.compliance.provenance import (
+    HASH_VERSION_CANONICAL,
+    HASH_VERSION_CANONICAL_ISO,
+    HASH_VERSION_JSON,
+    DecisionNode,
+    DecisionSource,
+    DecisionType,
+    ProvenanceQuery,
+    verify_batch,
+)
+
+
+def make_node(**overrides):
+    """Create a standalone decision node."""
+    fields = {
+        "node_id": "node_test",
+        "decision_type": DecisionType.RISK_APPROVED,
+        "source": DecisionSource.RISK_ENGINE,
+        "timestamp_ns": timestamp_ns(datetime(2026, 1, 1, 9, 30, 0, 123456, timezone.utc)),
+        "input_data": {"b": 2, "a": 1},
+        "output_data": {},
+        "rationale": "Within limits",
+        "confidence": 0.9,
+    }
+    fields.update(overrides)
+    return DecisionNode(**fields)
+
+
+class TestNodeHashing:
+    """Tests for node hash computation."""
+
+    def test_new_nodes_use_canonical_hash(self):
+        """New nodes should default to the canonical hash format."""
+        node = make_node()
+        assert node.hash_version == HASH_VERSION_CANONICAL
+        assert len(node.hash) == 64
+        assert node.verify_integrity()
+
+    def test_hash_ignores_key_order(self):
+        """Payload key order should not affect the hash."""
+        a = make_node(input_data={"a": 1, "b": 2})
+        b = make_node(input_data={"b": 2, "a": 1})
+        assert a.hash == b.hash
+
+    @pytest.mark.parametrize(
+        "version", [HASH_VERSION_JSON, HASH_VERSION_CANONICAL_ISO]
+    )
+    def test_legacy_hash_still_verifies(self, version):
+        """Older hash versions should still verify."""
+        node = make_node(hash_version=version)
+        assert node.hash != make_node().hash
+        assert node.verify_integrity()
+        assert verify_batch([node]) == [True]
+
+    def test_timestamp_round_trip(self):
+        """Nanosecond timestamps should round-trip through datetimes."""
+        ts = datetime(2026, 1, 1, 9, 30, 0, 123456, timezone.utc)
+        node = make_node()
+        assert node.timestamp == ts
+        assert node.to_dict()["timestamp"] == ts.isoformat()
+
+    def test_none_and_empty_parent_differ(self):
+        """Framing should distinguish a missing parent from an empty one."""
+        assert make_node(parent_node_id=None).hash != make_node(parent_node_id="").hash
+
+    def test_tampering_detected(self):
+        """Changing a hashed field should fail verification."""
+        node = make_node()
+        node.rationale = "Tampered"
+        assert not node.verify_integrity()
+
+
+    def test_payload_frozen_and_copied(self):
+        """Payloads should be copied and reject top-level edits."""
+        payload = {"a": 1}
+        node = make_node(input_data=payload)
+        payload["a"] = 2
+        assert node.input_data["a"] == 1
+        with pytest.raises(TypeError):
+            node.input_data["a"] = 3
+        assert isinstance(node.to_dict()["input_data"], dict)
+
+    def test_identical_payloads_shared(self):
+        """Nodes with equal payloads should share one frozen copy."""
+        a = make_node(input_data={"symbol": "EURUSD", "n": 1})
+        b = make_node(input_data={"n": 1, "symbol": "EURUSD"})
+        c = make_node(input_data={"symbol": "EURUSD", "n": 1.0})
+        assert a.input_data is b.input_data
+        assert a.input_data is not c.input_data
+        assert a.hash == b.hash
+
+    def test_typed_values_not_pooled_with_strings(self):
+        """Datetimes and UUIDs should not share a pool entry with their strings."""
+        ts = datetime(2026, 1, 1, 9, 30, tzinfo=timezone.utc)
+        uid = uuid4()
+        for value, text in ((ts, ts.isoformat()), (uid, str(uid))):
+            typed = make_node(input_data={"v": value}, hash_version=HASH_VERSION_JSON)
+            plain = make_node(input_data={"v": text}, hash_version=HASH_VERSION_JSON)
+            assert type(typed.input_data["v"]) is type(value)
+            assert type(plain.input_data["v"]) is str
+            assert plain.verify_integrity()
+
+    def test_nested_payload_frozen(self):
+        """Nested payload data should be read-only, even when shared."""
+        a = make_node(input_data={"features": {"rsi": 70}, "tags": ["x"]})
+        b = make_node(input_data={"features": {"rsi": 70}, "tags": ["x"]})
+        assert a.input_data is b.input_data
+        with pytest.raises(TypeError):
+            a.input_data["features"]["rsi"] = 10
+        assert a.input_data["tags"] == ("x",)
+        assert a.to_dict()["input_data"] == {"features": {"rsi": 70}, "tags": ["x"]}
+
+    def test_frozen_payload_hash_unchanged(self):
+        """Freezing nested data should not change the node hash."""
+        raw = {"features": {"rsi": 70}, "tags": ["x"]}
+        for version in (HASH_VERSION_JSON, HASH_VERSION_CANONICAL):
+            node = make_node(input_data=raw, hash_version=version)
+            object.__setattr__(node, "input_data", raw)
+            node.invalidate()
+            assert node._compute_hash() == node.hash
+
+    def test_verification_cached_until_invalidated(self):
+        """Tampering should be caught unless the cached result is trusted."""
+        node = make_node(input_data={"features": {"rsi": 70}})
+        assert node.verify_integrity()
+
+        # Bypass __setattr__, as an in-place edit would
+        object.__setattr__(node, "input_data", {"features": {"rsi": 10}})
+        assert node.verify_integrity(recompute=False)
+        assert not node.verify_integrity()
+
+        object.__setattr__(node, "input_data", {"features": {"rsi": 70}})
+        node.invalidate()
+        assert node.verify_integrity(recompute=False)
+
+    def test_canonical_bytes_kept_after_hashing(self):
+        """The bytes built for the initial hash should stay cached."""
+        node = make_node()
+        assert node._canonical == node._canonical_bytes()
+
+
+class TestNodeLayout:
+    """Tests for the compact node representation."""
+
+    def test_nodes_use_slots(self, provenance_tracker):
+        """Nodes and chains should not carry an instance __dict__."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        assert not hasattr(chain, "__dict__")
+        assert not hasattr(chain.nodes[0], "__dict__")
+
+    def test_metadata_allocated_lazily(self, provenance_tracker):
+        """Metadata should stay unset until something is attached."""
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        assert chain.nodes[-1].metadata is None
+        assert chain.nodes[-1].to_dict()["metadata"] == {}
+
+        provenance_tracker.complete_chain("sig_1", "executed", {"ticket": 1001})
+        assert chain.nodes[-1].metadata == {"final_data": {"ticket": 1001}}
+
+
+class TestBatchVerification:
+    """Tests for bulk node verification."""
+
+    @pytest.mark.parametrize("payload_size", [10, 5000])
+    def test_sha256_many_matches_hashlib(self, payload_size):
+        """Batched digests should match one-by-one hashing in order."""
+        buffers = [bytes([i % 256]) * payload_size for i in range(40)]
+        assert sha256_many(buffers) == [hashlib.sha256(b).digest() for b in buffers]
+
+    def test_verify_batch_flags_tampered_nodes(self):
+        """Only tampered nodes should fail batch verification."""
+        nodes = [make_node(node_id=f"node_{i}") for i in range(20)]
+        nodes.append(make_node(node_id="legacy", hash_version=HASH_VERSION_JSON))
+        nodes[3].rationale = "Tampered"
+        results = verify_batch(nodes)
+        assert results == [i != 3 for i in range(len(nodes))]
@@ -0,0 +1,136 @@
+"""
+Tests for ARCHON PRIME Provenance Queries
+=========================================
+
+Tests query filters, compiled matchers and the columnar scan.
+"""
+
+
+import numpy as np
+
+from archon_prime.api.compliance import _query_jit
+from archon_prime.api.compliance.columns import NodeColumns
+from archon_prime.api.compliance.provenance import (
+    DecisionSource,
+    DecisionType,
+    ProvenanceQuery,
+)
+from archon_prime.api.compliance.query import _compile_matcher, _query_shape
+
+
+class TestQueryFilters:
+    """Tests for columnar query filtering."""
+
+    def test_type_and_source_filters(self, provenance_tracker):
+        """Chains should match on any node's type or source."""
+        tracker = provenance_tracker
+        assert tracker.query(ProvenanceQuery(decision_types={DecisionType.GATE_PASSED}))
+        assert not tracker.query(
+            ProvenanceQuery(decision_types={DecisionType.RISK_REJECTED})
+        )
+        assert tracker.query(ProvenanceQuery(sources={DecisionSource.AI_AGENT}))
+        assert not tracker.query(ProvenanceQuery(sources={DecisionSource.ADMIN_USER}))
+
+    def test_emergency_chains_excluded(self, provenance_tracker):
+        """Chains containing emergency actions should be excludable."""
+        provenance_tracker.add_decision(
+            "sig_1",
+            DecisionType.KILL_SWITCH_ACTIVATED,
+            DecisionSource.SYSTEM_AUTO,
+            {},
+            {},
+            "Drawdown limit hit",
+        )
+        assert provenance_tracker.query(ProvenanceQuery())
+        assert not provenance_tracker.query(ProvenanceQuery(include_emergency=False))
+
+    def test_outcome_and_time_filters(self, provenance_tracker):
+        """Index-backed outcome and time filters should prune chains."""
+        provenance_tracker.start_chain(
+            "sig_2",
+            DecisionType.SIGNAL_GENERATED,
+            DecisionSource.EXTERNAL_SIGNAL,
+            {},
+            "Webhook signal",
+        )
+        provenance_tracker.complete_chain("sig_1", "executed")
+        first, second = sorted(
+            provenance_tracker.query(ProvenanceQuery()), key=lambda c: c.created_at
+        )
+
+        executed = provenance_tracker.query(ProvenanceQuery(outcome="executed"))
+        assert [c.chain_id for c in executed] == [first.chain_id]
+        assert not provenance_tracker.query(ProvenanceQuery(outcome="pending", sources={
+            DecisionSource.AI_AGENT,
+        }))
+
+        recent = provenance_tracker.query(ProvenanceQuery(start_time=second.created_at))
+        assert second in recent
+        assert (first in recent) == (first.created_at == second.created_at)
+        window = provenance_tracker.query(ProvenanceQuery(
+            start_time=first.created_at, end_time=first.created_at
+        ))
+        assert first in window
+
+    def test_matcher_compiled_per_shape(self, provenance_tracker):
+        """Queries of the same shape should share one compiled matcher."""
+        a = ProvenanceQuery(outcome="executed")
+        b = ProvenanceQuery(outcome="pending")
+        assert _query_shape(a) == _query_shape(b)
+        assert _compile_matcher(_query_shape(a)) is _compile_matcher(_query_shape(b))
+
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        assert not _compile_matcher(_query_shape(a))(chain, a)
+        assert _compile_matcher(_query_shape(b))(chain, b)
+
+    def test_columns_track_long_chains(self, provenance_tracker):
+        """Columns should grow with the chain and mirror its nodes."""
+        for i in range(20):
+            provenance_tracker.add_decision(
+                "sig_1",
+                DecisionType.POSITION_MODIFIED,
+                DecisionSource.POSITION_MANAGER,
+                {"step": i},
+                {},
+                "Trailing stop moved",
+            )
+        chain = provenance_tracker.query(ProvenanceQuery())[0]
+        assert len(chain._columns) == len(chain.nodes) == 23
+        assert list(chain._columns.type_codes) == [
+            list(DecisionType).index(n.decision_type) for n in chain.nodes
+        ]
+
+
+class TestQueryScan:
+    """Tests for the compiled chain scan."""
+
+    def test_scan_matches_per_chain_check(self):
+        """Scan results should match a per-chain Python check."""
+        rng = np.random.default_rng(7)
+        columns = []
+        for _ in range(50):
+            chain_columns = NodeColumns()
+            for _ in range(rng.integers(1, 12)):
+                chain_columns.append(rng.integers(0, 15), rng.integers(0, 8), 0)
+            columns.append(chain_columns)
+
+        type_mask = np.zeros(15, dtype=bool)
+        type_mask[[2, 9]] = True
+        source_mask = np.zeros(8, dtype=bool)
+        source_mask[[1, 4, 5]] = True
+        exclude_mask = np.zeros(15, dtype=bool)
+        exclude_mask[12] = True
+
+        expected = [
+            type_mask[c.type_codes].any()
+            and source_mask[c.source_codes].any()
+            and not exclude_mask[c.type_codes].any()
+            for c in columns
+        ]
+        result = _query_jit.scan(columns, type_mask, source_mask, exclude_mask)
+        assert result.tolist() == expected
+
+    def test_scan_empty(self):
+        """Scanning no chains should return an empty result."""
+        mask = np.ones(3, dtype=bool)
+        assert len(_query_jit.scan([], mask, mask, ~mask)) == 0
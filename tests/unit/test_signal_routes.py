@@ -0,0 +1,155 @@
+"""
+Tests for ARCHON PRIME Signal Routes
+=====================================
+
+Tests the body-size limit on batch submission and the JSON encoding
+of signal lists.
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from archon_prime.api.dependencies import get_profile_with_access
+from archon_prime.api.main import create_app
+from archon_prime.api.signals import routes
+from archon_prime.api.signals.routes import get_signal_service, router
+from archon_prime.api.signals.schemas import (
+    SignalDecision,
+    SignalDirection,
+    SignalPriority,
+    SignalResponse,
+    SignalSource,
+)
+
+
+@pytest.fixture
+def submitted():
+    """Signal lists passed on to the gate service."""
+    return []
+
+
+@pytest.fixture
+def client(submitted):
+    """Test client serving the signal routes with a recording service."""
+    profile = SimpleNamespace(id=uuid4())
+
+    async def submit_batch(profile, signals):
+        submitted.append(signals)
+        return []
+
+    app = FastAPI()
+    app.include_router(router, prefix="/signals")
+    app.dependency_overrides[get_profile_with_access] = lambda: profile
+    app.dependency_overrides[get_signal_service] = (
+        lambda: SimpleNamespace(submit_batch=submit_batch)
+    )
+    return TestClient(app)
+
+
+def batch_body(count=1, padding=0):
+    """A JSON batch body with optional padding in the strategy name."""
+    signal = {
+        "idempotency_key": "signal-key",
+        "symbol": "EURUSD",
+        "direction": "buy",
+        "confidence": "0.8",
+        "strategy_name": "x" * padding,
+    }
+    return json.dumps({"signals": [signal] * count}).encode()
+
+
+def post_batch(client, content):
+    """POST a JSON batch body to a fresh profile's batch endpoint."""
+    return client.post(
+        f"/signals/{uuid4()}/submit/batch",
+        content=content,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+class TestBatchBodyLimit:
+    """Tests for BatchBodyLimitRoute."""
+
+    def test_small_batch_accepted(self, client, submitted):
+        """Bodies under the limit should reach the service."""
+        response = post_batch(client, batch_body(2))
+
+        assert response.status_code == 200
+        assert len(submitted[0]) == 2
+
+    def test_small_stream_accepted(self, client, submitted):
+        """Chunked bodies under the limit should be replayed to the handler."""
+        body = batch_body(3)
+
+        def chunks():
+            for start in range(0, len(body), 16):
+                yield body[start:start + 16]
+
+        response = post_batch(client, chunks())
+
+        assert response.status_code == 200
+        assert len(submitted[0]) == 3
+
+    def test_oversized_content_length_rejected(self, client, submitted):
+        """A declared length over the limit should give 413."""
+        body = batch_body(padding=routes.MAX_BATCH_BODY_BYTES)
+
+        response = post_batch(client, body)
+
+        assert response.status_code == 413
+        assert not submitted
+
+    def test_oversized_stream_rejected(self, client, submitted):
+        """Chunked bodies should be cut off once they pass the limit."""
+        body = batch_body(padding=routes.MAX_BATCH_BODY_BYTES)
+
+        def chunks():
+            for start in range(0, len(body), 4096):
+                yield body[start:start + 4096]
+
+        response = post_batch(client, chunks())
+
+        assert response.status_code == 413
+        assert not submitted
+
+
+class TestListEncoding:
+    """Tests for how the app encodes signal lists."""
+
+    def test_decimals_encoded_as_strings(self):
+        """Decimals should keep their precision as JSON strings."""
+        profile = SimpleNamespace(id=uuid4())
+        signal = SignalResponse(
+            id=uuid4(),
+            idempotency_key="signal-key",
+            profile_id=profile.id,
+            symbol="EURUSD",
+            direction=SignalDirection.BUY,
+            source=SignalSource.MANUAL,
+            priority=SignalPriority.NORMAL,
+            confidence=Decimal("0.85"),
+            decision=SignalDecision.APPROVED,
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+
+        async def get_signals(profile_id, **filters):
+            return [signal], 1
+
+        app = create_app()
+        app.dependency_overrides[get_profile_with_access] = lambda: profile
+        app.dependency_overrides[get_signal_service] = (
+            lambda: SimpleNamespace(get_signals=get_signals)
+        )
+        response = TestClient(app).get(f"/api/v1/signals/{profile.id}")
+
+        assert response.status_code == 200
+        item = response.json()["signals"][0]
+        assert item["confidence"] == "0.85"
+        assert item["decision"] == "approved"
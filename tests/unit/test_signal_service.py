@@ -0,0 +1,366 @@
+"""
+Tests for ARCHON PRIME Signal Gate Service
+===========================================
+
+Tests batch submission, rate limiting, idempotency, signal lookups
+and execution checks in the API signal gate.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from archon_prime.api.config import settings
+from archon_prime.api.db.models import MT5Profile, Position, User
+from archon_prime.api.signals import service as signal_service
+from archon_prime.api.signals import store as signal_store
+from archon_prime.api.signals.schemas import (
+    GateConfigResponse,
+    SignalDecision,
+    SignalDirection,
+    SignalSubmitRequest,
+)
+from archon_prime.api.signals.service import SignalGateService
+
+
+@pytest.fixture(autouse=True)
+def clear_stores():
+    """Start each test with empty in-memory signal stores."""
+    stores = (
+        signal_store._idempotency_cache,
+        signal_store._rate_limit_buckets,
+        signal_store._signal_store,
+        signal_store._signal_index,
+        signal_store._daily_counts,
+    )
+    for store in stores:
+        store.clear()
+    yield
+    for store in stores:
+        store.clear()
+
+
+@pytest.fixture
+async def db():
+    """In-memory SQLite session with the tables the gate reads."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (User, MT5Profile, Position):
+            await conn.run_sync(model.__table__.create)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def profile():
+    """A connected, trading-enabled profile."""
+    return MT5Profile(
+        id=uuid4(),
+        connection_status="connected",
+        is_trading_enabled=True,
+        balance=Decimal("1000"),
+        equity=Decimal("1000"),
+    )
+
+
+def make_signal(key):
+    """A signal that passes every gate check."""
+    return SignalSubmitRequest(
+        idempotency_key=f"signal-{key}",
+        symbol="EURUSD",
+        direction=SignalDirection.BUY,
+        confidence=Decimal("0.8"),
+    )
+
+
+class TestSubmitBatch:
+    """Tests for SignalGateService.submit_batch."""
+
+    async def test_positions_counted_once_per_batch(self, db, profile):
+        """A batch should query open positions once, not per signal."""
+        statements = []
+        event.listen(
+            db.bind.sync_engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+
+        results = await SignalGateService(db).submit_batch(
+            profile, [make_signal(f"key-{i}") for i in range(3)]
+        )
+
+        assert [r.decision for r in results] == [SignalDecision.APPROVED] * 3
+        assert len(statements) == 1
+
+    async def test_rate_limit_applies_in_order(self, db, profile):
+        """Later signals in a batch should see earlier ones' rate usage."""
+        service = SignalGateService(db)
+        signal_store._rate_limit_buckets[profile.id] = [1.0, time.monotonic()]
+
+        results = await service.submit_batch(
+            profile, [make_signal("first"), make_signal("second")]
+        )
+
+        assert results[0].decision == SignalDecision.APPROVED
+        assert results[1].decision_reason == "Rate limit exceeded"
+
+    async def test_duplicate_key_returns_cached_response(self, db, profile):
+        """A repeated idempotency key within a batch should not be re-gated."""
+        results = await SignalGateService(db).submit_batch(
+            profile, [make_signal("same"), make_signal("same")]
+        )
+        assert results[1].id == results[0].id
+
+
+class TestRateLimit:
+    """Tests for the per-profile token bucket."""
+
+    def test_tokens_taken_and_refilled(self, db, profile):
+        """Signals take tokens, which come back at the per-minute rate."""
+        service = SignalGateService(db)
+        for _ in range(10):
+            signal_store.take_rate_limit_token(profile.id)
+
+        status = service.check_rate_limit(profile.id)
+        assert (status.remaining, status.current_count) == (0, 10)
+        assert status.is_limited
+
+        # Half a minute later, half the bucket is back
+        signal_store._rate_limit_buckets[profile.id][1] -= 30
+        status = service.check_rate_limit(profile.id)
+        assert status.remaining == 5
+        assert not status.is_limited
+
+    def test_never_overfills(self, db, profile):
+        """An idle profile should refill to capacity and no further."""
+        service = SignalGateService(db)
+        signal_store._rate_limit_buckets[profile.id] = [0.0, time.monotonic() - 3600]
+
+        assert service.check_rate_limit(profile.id).remaining == 10
+
+
+class TestDailyLimit:
+    """Tests for the daily signal counter."""
+
+    async def test_counter_tracks_stored_signals(self, db, profile):
+        """Stored signals count toward today's limit."""
+        service = SignalGateService(db)
+        for key in ("a", "b"):
+            await service.submit_signal(profile, make_signal(key))
+
+        check = await service._check_daily_limit(profile.id, {"max_daily_signals": 2})
+
+        assert not check.passed
+        assert check.details == {"max": 2, "current": 2}
+
+    async def test_counter_resets_next_day(self, db, profile):
+        """Yesterday's count should not apply today."""
+        service = SignalGateService(db)
+        yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+        signal_store._daily_counts[profile.id] = [yesterday, 50]
+
+        check = await service._check_daily_limit(profile.id, {})
+        assert check.passed
+
+        await service.submit_signal(profile, make_signal("today"))
+        assert signal_store._daily_counts[profile.id][1] == 1
+
+
+class TestIdempotency:
+    """Tests for the idempotency cache."""
+
+    async def test_keys_scoped_per_profile(self, db, profile):
+        """The same key on another profile should be a new signal."""
+        service = SignalGateService(db)
+        other = MT5Profile(
+            id=uuid4(),
+            connection_status="connected",
+            is_trading_enabled=True,
+        )
+
+        first = await service.submit_signal(profile, make_signal("shared"))
+        second = await service.submit_signal(other, make_signal("shared"))
+
+        assert second.id != first.id
+        assert len(signal_store._idempotency_cache) == 2
+
+    async def test_expired_entry_regated(self, db, profile):
+        """A key past its TTL should be processed as a new signal."""
+        service = SignalGateService(db)
+        first = await service.submit_signal(profile, make_signal("ttl"))
+        cache_key = (profile.id, "signal-ttl")
+        signal_store._idempotency_cache[cache_key] = (0.0, first)
+
+        second = await service.submit_signal(profile, make_signal("ttl"))
+
+        assert second.id != first.id
+
+    async def test_least_recent_evicted_at_capacity(self, db, profile, monkeypatch):
+        """The cache should stay bounded, dropping the least recently used."""
+        monkeypatch.setattr(signal_store, "settings", settings.model_copy(
+            update={"SIGNAL_IDEMPOTENCY_CACHE_SIZE": 2}
+        ))
+        service = SignalGateService(db)
+        for key in ("a", "b"):
+            await service.submit_signal(profile, make_signal(key))
+        await service.submit_signal(profile, make_signal("a"))  # hit: now newest
+        await service.submit_signal(profile, make_signal("c"))
+
+        assert list(signal_store._idempotency_cache) == [
+            (profile.id, "signal-a"),
+            (profile.id, "signal-c"),
+        ]
+
+
+class TestGetSignals:
+    """Tests for SignalGateService.get_signals."""
+
+    async def test_pages_newest_first(self, db, profile):
+        """Pages should walk back from the newest signal."""
+        service = SignalGateService(db)
+        first = await service.submit_signal(profile, make_signal("first"))
+        second = await service.submit_signal(profile, make_signal("second"))
+
+        assert await service.get_signals(profile.id, page_size=1) == ([second], 2)
+        assert await service.get_signals(profile.id, 2, page_size=1) == ([first], 2)
+        assert await service.get_signals(uuid4()) == ([], 0)
+
+    async def test_decision_filter_pages_matches(self, db, profile):
+        """Filtered pages should count and page only matching signals."""
+        service = SignalGateService(db)
+        weak = make_signal("weak").model_copy(update={"confidence": Decimal("0.1")})
+        rejected = await service.submit_signal(profile, weak)
+        approved = [
+            await service.submit_signal(profile, make_signal(key))
+            for key in ("a", "b", "c")
+        ]
+
+        page = await service.get_signals(
+            profile.id, page=2, page_size=2, decision=SignalDecision.APPROVED
+        )
+        assert page == ([approved[0]], 3)
+        assert await service.get_signals(
+            profile.id, decision=SignalDecision.REJECTED
+        ) == ([rejected], 1)
+
+
+class TestGetStats:
+    """Tests for SignalGateService.get_stats."""
+
+    async def test_counts_recent_signals(self, db, profile):
+        """Stats should read decisions and fields off the stored signals."""
+        service = SignalGateService(db)
+        for key in ("a", "b"):
+            await service.submit_signal(profile, make_signal(key))
+
+        stats = await service.get_stats(profile.id)
+
+        assert (stats.total_signals, stats.approved, stats.rejected) == (2, 2, 0)
+        assert stats.avg_confidence == Decimal("0.800")
+        assert sum(stats.by_source.values()) == 2
+
+    async def test_window_and_rejection_reasons(self, db, profile):
+        """Older signals are left out; rejections are grouped by reason."""
+        service = SignalGateService(db)
+        weak = make_signal("weak").model_copy(update={"confidence": Decimal("0.1")})
+        rejected = await service.submit_signal(profile, weak)
+        old = rejected.model_copy(
+            update={"created_at": rejected.created_at - timedelta(days=2)}
+        )
+        signal_store._signal_store[profile.id].appendleft(old)
+
+        stats = await service.get_stats(profile.id)
+
+        assert (stats.total_signals, stats.rejected) == (1, 1)
+        assert stats.approval_rate == Decimal("0.00")
+        assert stats.top_rejection_reasons == [
+            {"reason": rejected.decision_reason, "count": 1}
+        ]
+
+
+class TestGetSignalById:
+    """Tests for SignalGateService.get_signal_by_id."""
+
+    async def test_lookup_follows_store_trim(self, db, profile):
+        """Signals trimmed from the store should drop out of the index."""
+        service = SignalGateService(db)
+        first = await service.submit_signal(profile, make_signal("first"))
+
+        assert await service.get_signal_by_id(profile.id, first.id) is first
+        assert await service.get_signal_by_id(uuid4(), first.id) is None
+
+        for _ in range(signal_store.SIGNALS_PER_PROFILE):
+            copy = first.model_copy(update={"id": uuid4()})
+            signal_store.store_signal(profile.id, copy)
+
+        store = signal_store._signal_store[profile.id]
+        assert len(store) == len(signal_store._signal_index[profile.id])
+        assert await service.get_signal_by_id(profile.id, first.id) is None
+        assert await service.get_signal_by_id(profile.id, store[-1].id) is store[-1]
+
+
+class TestDecisionHash:
+    """Tests for SignalGateService._compute_decision_hash."""
+
+    def test_hash_stable_and_decision_bound(self, db):
+        """Same inputs give the same 128-bit hash; a new decision changes it."""
+        service = SignalGateService(db)
+        args = (uuid4(), uuid4(), "EURUSD", "buy")
+        at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        approved = service._compute_decision_hash(*args, "approved", at)
+
+        assert approved == service._compute_decision_hash(*args, "approved", at)
+        assert approved != service._compute_decision_hash(*args, "rejected", at)
+        assert len(approved) == 32 and int(approved, 16) >= 0
+
+
+class TestGateConfig:
+    """Tests for the default gate configuration."""
+
+    async def test_defaults_match_validated_config(self, db, profile):
+        """Unvalidated defaults should equal a validated config."""
+        config = await SignalGateService(db).get_gate_config(profile.id)
+
+        assert config == GateConfigResponse(
+            profile_id=profile.id, **signal_service.DEFAULT_GATE_CONFIG
+        )
+        assert config.model_dump()["allowed_trading_hours"] is None
+
+    async def test_checks_read_settings_without_model(self, db, profile):
+        """Gate checks should get the settings mapping, not a dumped model."""
+        batch_inputs = {}
+        config, _ = await SignalGateService(db)._gate_inputs(profile.id, batch_inputs)
+
+        assert config is signal_service.DEFAULT_GATE_CONFIG
+
+    def test_defaults_read_only(self):
+        """The shared defaults should not be writable."""
+        with pytest.raises(TypeError):
+            signal_service.DEFAULT_GATE_CONFIG["min_confidence"] = Decimal("0")
+
+
+class TestValidateExecutable:
+    """Tests for SignalGateService.validate_executable."""
+
+    async def test_reasons_in_guard_order(self, db, profile):
+        """Approved signals on a ready profile pass; others give a reason."""
+        service = SignalGateService(db)
+        signal = await service.submit_signal(profile, make_signal("exec"))
+        assert service.validate_executable(signal, profile) is None
+
+        profile.is_trading_enabled = False
+        assert service.validate_executable(signal, profile) == "Trading not enabled"
+
+        profile.connection_status = "disconnected"
+        assert service.validate_executable(signal, profile) == "Profile not connected"
+
+        rejected = signal.model_copy(update={"decision": SignalDecision.REJECTED})
+        reason = service.validate_executable(rejected, profile)
+        assert reason.startswith("Cannot execute signal with decision")
@@ -0,0 +1,77 @@
+"""
+Tests for ARCHON PRIME WebSocket Connection Manager
+===================================================
+
+Tests event fan-out to the clients of a profile.
+"""
+
+import json
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from archon_prime.api.websocket.events import AccountUpdateEvent
+from archon_prime.api.websocket.manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """Records text frames; optionally fails every send."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        pass
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.sent.append(text)
+
+
+@pytest.fixture
+def event():
+    """An account update for a fresh profile."""
+    return AccountUpdateEvent(
+        profile_id=uuid4(),
+        balance=Decimal("1000.50"),
+        equity=Decimal("990"),
+        margin=Decimal("10"),
+        free_margin=Decimal("980"),
+        profit=Decimal("-10.50"),
+    )
+
+
+class TestBroadcastToProfile:
+    """Tests for ConnectionManager.broadcast_to_profile."""
+
+    async def test_same_payload_to_every_client(self, event):
+        """All clients should get one identical JSON text frame."""
+        manager = ConnectionManager()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        for i, ws in enumerate(sockets):
+            await manager.connect(ws, uuid4(), event.profile_id, f"client-{i}")
+
+        await manager.broadcast_to_profile(event.profile_id, event, "client-2")
+
+        assert sockets[0].sent == sockets[1].sent
+        assert sockets[2].sent == []
+        assert json.loads(sockets[0].sent[0]) == event.model_dump(mode="json")
+
+    async def test_failed_clients_disconnected(self, event):
+        """Clients whose send fails should be removed."""
+        manager = ConnectionManager()
+        await manager.connect(FakeWebSocket(), uuid4(), event.profile_id, "ok")
+        await manager.connect(
+            FakeWebSocket(fail=True), uuid4(), event.profile_id, "broken"
+        )
+
+        await manager.broadcast_to_profile(event.profile_id, event)
+
+        assert manager.get_profile_client_count(event.profile_id) == 1
+        assert manager.get_total_connections() == 1